@@ -16,13 +16,16 @@ Created on Feb 3 2020
 """
 
 # import python libraries
+import time
+# time at which the application was launched
+STARTUP = time.perf_counter()
 import os
 import sys
-import time
+import threading
 import numpy as np
 import pandas as pd
-from PyQt5 import QtWidgets, uic, QtCore
-from PyQt5.QtWidgets import QMainWindow, QFileDialog
+from PyQt5 import QtWidgets, QtCore
+from PyQt5.QtWidgets import QMainWindow, QFileDialog, QInputDialog
 from PyQt5.QtGui import QTextCursor
 
 # import custom modules for controlling instruments 
@@ -34,6 +37,24 @@ from instr_libs import ops  # for controlling operations of main GUI
 from instr_libs import lf  # for controlling LightField Raman software
 from instr_libs import mcl  # for controlling Marzhauser MCL-3 stage
 from instr_libs import piline  # for controlling PI C-867 PILine rotator
+from instr_libs import slink  # for controlling Gentec S-Link photometer
+from instr_libs import discovery  # for finding instrument ports
+from instr_libs import rig  # for connecting all instruments at once
+from instr_libs import store  # for storing each run in one HDF5 file
+from instr_libs import state  # for caching the state of the instruments
+from instr_libs import catalog  # for the SQLite catalog of all runs
+
+
+class WorkerSignals(QtCore.QObject):
+    """Signals emitted by a Worker thread. Slots connected to these
+    signals run in the main GUI thread."""
+    finished = QtCore.pyqtSignal()
+
+
+class StateSignals(QtCore.QObject):
+    """Signals emitted when the instrument state cache is updated. Slots
+    connected to these signals run in the main GUI thread."""
+    changed = QtCore.pyqtSignal(dict)
 
 
 class Worker(QtCore.QRunnable):
@@ -48,28 +69,29 @@ class Worker(QtCore.QRunnable):
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
+        self.signals = WorkerSignals()
 
     @QtCore.pyqtSlot()
     def run(self):
         """Take a function and its args which were passed to the Worker
         class and execute it in a new thread."""
-        self.fn(*self.args, **self.kwargs)
+        try:
+            self.fn(*self.args, **self.kwargs)
+        finally:
+            self.signals.finished.emit()
 
 
 class App(QMainWindow):
     """Class which creates the main window of the application."""
 
-    # load Qt designer XML .ui GUI file
-    Ui_MainWindow, QtBaseClass = uic.loadUiType('ui.ui')
-
-    # kill the process which opens LightField if its already running
-    os.system("taskkill /f /im AddInProcess.exe")
+    # Qt designer XML .ui GUI file, which is precompiled to ui_main.py
+    ui_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'UI.ui')
 
     def __init__(self):
 
         # create application instance
         super(App, self).__init__()
-        self.ui = App.Ui_MainWindow()
+        self.ui = ops.load_ui(App.ui_path)()
         self.ui.setupUi(self)
 
         # initialize multithreading
@@ -78,16 +100,23 @@ class App(QMainWindow):
         # assign actions to top menu items
         # example: self.ui.menu_item_name.triggered.connect(self.func_name)
         self.ui.quit_app.triggered.connect(self.quitapp)
+        self.ui.close_lf_host.triggered.connect(self.close_lf_host)
         self.ui.show_help.triggered.connect(ops.show_help)
         self.ui.abort_seq.triggered.connect(self.abort_seq)
         self.ui.run_seq.triggered.connect(self.run_seq_thread)
         self.ui.set_filedir.triggered.connect(self.set_filedir)
         self.ui.print_ports.triggered.connect(self.print_ports)
+        self.ui.connect_all.triggered.connect(self.connect_all_thread)
+        self.ui.save_rig_profile.triggered.connect(self.save_rig_profile)
+        self.ui.find_instruments.triggered.connect(
+                self.find_instruments_thread)
         self.ui.preview_seq.triggered.connect(self.preview_seq)
         self.ui.show_log_path.triggered.connect(self.show_log_path)
         self.ui.show_file_list.triggered.connect(self.show_file_list)
         self.ui.select_spectra.triggered.connect(self.select_spectra)   
         self.ui.generate_report.triggered.connect(self.generate_report)
+        self.ui.query_report.triggered.connect(self.query_report)
+        self.ui.update_catalog.triggered.connect(self.update_catalog_thread)
         self.ui.export_settings.triggered.connect(self.export_settings)
         self.ui.import_settings.triggered.connect(self.import_settings)
         
@@ -96,7 +125,7 @@ class App(QMainWindow):
         self.ui.analyzer_on.clicked.connect(self.analyzer_on)
         self.ui.polarizer_on.clicked.connect(self.polarizer_on)
         self.ui.launch_lf.clicked.connect(self.launch_lf_thread)
-        self.ui.scope_acquire.clicked.connect(self.scope_acquire)
+        self.ui.scope_acquire.clicked.connect(self.scope_acquire_thread)
         self.ui.acquire_raman.clicked.connect(self.acquire_raman)
         self.ui.mcl_set_now.clicked.connect(self.mcl_set_now_thread)
         self.ui.analyzer_set_now.clicked.connect(self.a_set_now_thread)
@@ -106,6 +135,7 @@ class App(QMainWindow):
         self.ui.piline_set_now.clicked.connect(self.piline_set_now_thread)        
         self.ui.export_scope_trace.clicked.connect(self.export_scope_trace)
         self.ui.avacs_set_pc_now.clicked.connect(self.avacs_set_pc_now_thread)
+        self.ui.fluence_servo_now.clicked.connect(self.fluence_servo_thread)
 
         # assign actions to checkboxes
         # example: self.ui.CHECKBOX.stateChanged.connect(self.FUNCTION_NAME)
@@ -114,11 +144,13 @@ class App(QMainWindow):
         self.ui.pulsegen_on.stateChanged.connect(self.pulsegen_on)
         self.ui.avacs_on.stateChanged.connect(self.avacs_on_thread)
         self.ui.piline_on.stateChanged.connect(self.piline_on_thread)
+        self.ui.slink_on.stateChanged.connect(self.slink_on)
         
         # assign actions to value changes in text and numeric input fields
         # example: self.ui.TEXT_FIELD.textChanged.connect(self.FUNCTION_NAME)
         # example: self.ui.SPIN_BOX.valueChanged.connect(self.FUNCTION_NAME)      
         self.ui.outbox.textChanged.connect(self.scroll_outbox)
+        self.ui.raman_filename_notes.textChanged.connect(self.notes_changed)
 
         # intialize log file for logging experimental settings
         self.logdir = os.path.join(os.getcwd(), 'logs\\')
@@ -131,22 +163,66 @@ class App(QMainWindow):
             
             
         self.starttime = time.strftime('%Y-%m-%d_%H-%M-%S')    
+
+        # Raman spectra acquired in this session, shared by LightField
+        # control and report generation
+        self.spectra = {}
         
+        # cache of instrument state which is logged and shown on the GUI
+        self.state = state.new_state()
+        self.state_signals = StateSignals()
+        self.state_signals.changed.connect(self.show_state)
+        state.subscribe(self.state, self.state_signals.changed.emit)
+
+        # information related to the HDF5 store of this run
+        self.store = {
+                'file': None,
+                'h5py': None,
+                'enabled': True,
+                'lock': threading.Lock(),
+                'outbox': self.ui.outbox,
+                'path': store.store_path(self.logdir, self.starttime)}
+
+        # information related to the SQLite catalog of all runs
+        self.catalog = {
+                'conn': None,
+                'run_id': None,
+                'run': self.starttime,
+                'raman_dir': self.raman_dir,
+                'logpath': self.logdir+self.starttime+'.csv',
+                'path': catalog.catalog_path(self.logdir)}
+
         # information related to operations of the application
         self.ops = {
                 'app': self.ui,
                 'row_counter': 0,
+                'ports': {},
+                'store': self.store,
+                'state': self.state,
+                'catalog': self.catalog,
+                'file_timeout': 30,
                 'logdir': self.logdir,
                 'outbox': self.ui.outbox,
                 'raman_dir': self.raman_dir,
+                'spectra': self.spectra,
                 'starttime': self.starttime,
                 'gui_update_finished': True,
-                'data': np.full((1000, 12), '', dtype=object),
+                'log_file': None,
+                'log_writer': None,
+                'log_lock': threading.Lock(),
+                'log_thread': None,
+                'log_queue': None,
+                'log_metrics': None,
+                'log_queue_size': 10000,
+                'log_flush_rows': 100,
+                'log_flush_interval': 1.0,
                 'logpath': self.logdir+self.starttime+'.csv'}
     
         # information related to Laseroptik beam attenuator
         self.avacs = {
                 'dev': None,
+                'servo_error': np.nan,
+                'state': self.state,
                 'on': self.ui.avacs_on,
                 'outbox': self.ui.outbox,
                 'set': self.ui.avacs_set,
@@ -165,6 +241,8 @@ class App(QMainWindow):
         self.srs = {
                 'dev': None,
                 'tot_pulses': 0,
+                'train_start': None,
+                'state': self.state,
                 'outbox': self.ui.outbox,
                 'on': self.ui.pulsegen_on,
                 'width': self.ui.pulse_width,
@@ -175,26 +253,75 @@ class App(QMainWindow):
                 'amplitude': self.ui.pulse_amplitude,
                 'seq_laser_trigger': self.ui.seq_laser_trigger}
         
+        # information related to Gentec S-Link photometer
+        self.slink = {
+                'dev': None,
+                'thread': None,
+                'buffer': None,
+                'streaming': False,
+                'range_code': '20',
+                'buffer_size': 10000,
+                'last_log_time': 0,
+                'state': self.state,
+                'on': self.ui.slink_on,
+                'outbox': self.ui.outbox,
+                'range': self.ui.slink_range,
+                'energy': self.ui.slink_energy,
+                'address': self.ui.slink_address}
+
+        # information related to closed-loop fluence control
+        self.fluence = {
+                'outbox': self.ui.outbox,
+                'target': self.ui.fluence_target,
+                'pulses': self.ui.fluence_pulses,
+                'servo_now': self.ui.fluence_servo_now,
+                'tolerance': self.ui.fluence_tolerance,
+                'closed_loop': self.ui.fluence_closed_loop,
+                'logpath': self.logdir+self.starttime+'_fluence_servo.csv'}
+
         # information related to Tektronix MSO64 oscilloscope
         self.mso = {
                 'dev': None,
+                'busy': False,
+                'cancel': False,
+                'last_raw': None,
+                'last_preambles': None,
+                'last_sources': None,
+                'last_frame_times': None,
+                'seq_metrics': [],
+                'lock': threading.Lock(),
+                'seq': self.ui.seq_scope,
+                'starttime': self.starttime,
                 'on': self.ui.mso_on,
                 'logdir': self.logdir,
                 'outbox': self.ui.outbox,
                 'address': self.ui.mso_address,
                 'acquire': self.ui.scope_acquire,
-                'downsample': self.ui.mso_downsample,
+                'frames': self.ui.mso_frames,
+                'channels': self.ui.mso_channels,
                 'export': self.ui.export_scope_trace}
         
         # information related to Princeton Instruments LightField software
         self.lf = {
-                'app': None,
+                'host': None,
+                'host_lock': threading.Lock(),
+                'host_port': 6021,
+                'host_timeout': 120,
+                'experiment': 'Default_Python_Experiment',
+                'timeout': 120,
+                'standin': os.name != 'nt',
+                'spectra': self.spectra,
+                'kinetics': None,
+                'started': threading.Event(),
+                'state': self.state,
                 'file_list': [],
                 'recent_file': None,
                 'logdir': self.logdir,
                 'outbox': self.ui.outbox,
                 'raman_dir': self.raman_dir,
                 'acquire': self.ui.acquire_raman,
+                'export_csv': self.ui.raman_export_csv,
+                'frames': self.ui.raman_frames,
                 'notes': self.ui.raman_filename_notes,
                 'seq': self.ui.seq_raman_acquisition}
 
@@ -202,6 +329,9 @@ class App(QMainWindow):
         self.kcube = {
                 'pdev': None,
                 'adev': None,
+                'p_move_on_connect': True,
+                'a_move_on_connect': True,
+                'state': self.state,
                 'outbox': self.ui.outbox,
                 'a_on': self.ui.analyzer_on,
                 'p_on': self.ui.polarizer_on,
@@ -222,6 +352,8 @@ class App(QMainWindow):
         self.mcl = {
                'dev': None,
                'busy': False,
+               'move_on_connect': True,
+               'state': self.state,
                'on': self.ui.mcl_on,
                'seq': self.ui.seq_mcl,
                'outbox': self.ui.outbox,
@@ -241,6 +373,7 @@ class App(QMainWindow):
         # information related to PILine PI C-867 rotation stage controller
         self.piline = {
             'dev': None,
+            'reference': True,
             'on': self.ui.piline_on,
             'outbox': self.ui.outbox,
             'set': self.ui.piline_set,
@@ -252,8 +385,50 @@ class App(QMainWindow):
             'display': self.ui.piline_display,
             'address': self.ui.piline_address}
 
-        # kill the process which opens LightField if its already running
-        os.system("taskkill /f /im AddInProcess.exe")
+        # widgets which show values of the instrument state cache
+        self.state_displays = {
+                'x_position_cm': self.mcl['show_x'],
+                'y_position_cm': self.mcl['show_y'],
+                'polarizer_angle_deg': self.kcube['p_display'],
+                'analyzer_angle_deg': self.kcube['a_display'],
+                'avacs_angle_deg': self.avacs['display'],
+                'avacs_power_%': self.avacs['display_percent'],
+                'photometer_energy_j': self.slink['energy'],
+                'photometer_range': self.slink['range']}
+        self.seed_state()
+
+        # instruments which are connected together by the rig profile
+        self.rig = {
+            'ready': {},
+            'outbox': self.ui.outbox,
+            'devices': {
+                'srs': {'state': self.srs, 'on': self.srs['on'],
+                        'address': self.srs['address'],
+                        'connect': self.pulsegen_on},
+                'mso': {'state': self.mso, 'on': self.mso['on'],
+                        'address': self.mso['address'],
+                        'connect': self.mso_on},
+                'avacs': {'state': self.avacs, 'on': self.avacs['on'],
+                          'address': self.avacs['address'],
+                          'connect': self.avacs_on},
+                'mcl': {'state': self.mcl, 'on': self.mcl['on'],
+                        'address': self.mcl['address'],
+                        'connect': self.mcl_on},
+                'piline': {'state': self.piline, 'on': self.piline['on'],
+                           'address': self.piline['address'],
+                           'connect': self.piline_on},
+                'slink': {'state': self.slink, 'on': self.slink['on'],
+                          'address': self.slink['address'],
+                          'connect': self.slink_on},
+                # APT.dll is not thread safe, so the K-Cubes share a group
+                'polarizer': {'state': self.kcube, 'group': 'apt',
+                              'on': self.kcube['p_on'],
+                              'address': self.kcube['paddress'],
+                              'connect': self.polarizer_on},
+                'analyzer': {'state': self.kcube, 'group': 'apt',
+                             'on': self.kcube['a_on'],
+                             'address': self.kcube['aaddress'],
+                             'connect': self.analyzer_on}}}
 
         # disable GUI buttons for instruments which are not connected
         srs.enable_srs(self.srs, False)
@@ -263,6 +438,7 @@ class App(QMainWindow):
         mso.enable_mso(self.mso, False)
         piline.enable_piline(self.piline, False)
         avacs.enable_avacs(self.avacs, False)
+        slink.enable_slink(self.slink, False)
         self.items_to_disable = [
                 self.ui.abort_seq,
                 self.ui.acquire_raman,
@@ -303,26 +479,52 @@ class App(QMainWindow):
             self.polarizer_set_now()
             while kcube.p_in_motion(self.kcube):
                 time.sleep(1)
+        # servo AVACS beam attenuator to the target pulse energy
+        if self.ui.fluence_closed_loop.isChecked():
+            target = self.fluence['target'].value()/1e3
+            if self.ui.seq_avacs.isChecked():
+                target *= g['power_%'].iloc[i]/100
+            self.fluence_servo(target=target, step=i)
         # move AVACS beam attenuator to specified power
-        if self.ui.seq_avacs.isChecked():
+        elif self.ui.seq_avacs.isChecked():
             self.avacs['set_percent'].setValue(g['power_%'].iloc[i])
             self.avacs_set_pc_now()
             time.sleep(2)
 
-        # acquire raman spectrum
-        if self.ui.seq_raman_acquisition.isChecked():
-            time.sleep(3)
+        # record a kinetics series of Raman frames during the pulses
+        kinetics = (self.ui.seq_laser_trigger.isChecked() and
+                    self.ui.seq_raman_acquisition.isChecked() and
+                    self.lf['frames'].value() > 1)
+        # acquire raman spectrum, unless the kinetics series records it
+        if self.ui.seq_raman_acquisition.isChecked() and not kinetics:
             self.acquire_raman()
-            time.sleep(3)
         # trigger excimer laser pulses from pulse generator
         if self.ui.seq_laser_trigger.isChecked():
-            self.trigger_pulses()
-            time.sleep(0.1)
+            # arm the scope to capture the pulse train
+            if self.ui.seq_scope.isChecked():
+                mso.seq_arm(self.mso)
+            try:
+                if kinetics:
+                    raman = threading.Thread(target=lf.acquire_raman,
+                                             args=(self.lf,))
+                    raman.start()
+                    self.lf['started'].wait(self.lf['timeout'])
+                self.trigger_pulses()
+            except Exception:
+                # release the scope so the next step can arm it again
+                if self.ui.seq_scope.isChecked():
+                    mso.seq_disarm(self.mso)
+                raise
+            # read the scope capture in the background
+            if self.ui.seq_scope.isChecked():
+                worker = Worker(mso.seq_capture, self.mso, i)
+                self.threadpool.start(worker)
+            if kinetics:
+                raman.join()
+                self.save_raman()
             # acquire raman spectrum
-            if self.ui.seq_raman_acquisition.isChecked():
-                time.sleep(3)
+            elif self.ui.seq_raman_acquisition.isChecked():
                 self.acquire_raman()
-                time.sleep(3)
 
 
 
@@ -339,6 +541,7 @@ class App(QMainWindow):
             if self.abort_seq is True: break
             # pause a few seconds between cycles
             time.sleep(self.ui.pause_between_cycles.value())
+        mso.seq_wait(self.mso)
         self.finalize_sequence()
         ops.generate_report(self.ops, logpath=self.ops['logpath'])
    
@@ -403,6 +606,7 @@ class App(QMainWindow):
             self.ui.run_seq, self.ui.set_seq_cycles,
             self.ui.pause_between_cycles, self.ui.seq_laser_trigger,
             self.ui.seq_polarizer_rot, self.ui.seq_raman_acquisition,
+            self.ui.seq_scope,
             self.ui.rotation_end, self.ui.rotation_start,
             self.ui.rotation_steps, self.ui.seq_mcl,
             self.ui.pulse_delay, self.ui.pulse_number,
@@ -429,11 +633,16 @@ class App(QMainWindow):
         self.abort_seq = False
         self.ui.abort_seq.setEnabled(False)
         self.enable_during_seq(True)
+        # write the log rows of the sequence, also when it was aborted
+        ops.flush_log(self.ops)
         self.ui.outbox.append('Experiment complete.')
         self.ui.outbox.append('===========================================')
 
     def run_seq_thread(self):
         """Run sequence in a new thread."""
+        # keep the settings of the sequence in the run store. They are
+        # read here because widgets may only be read on the GUI thread.
+        store.add_settings(self.store, ops.get_settings(self.ui))
         worker = Worker(self.run_seq)  # pass other args here
         self.threadpool.start(worker)
 
@@ -534,6 +743,14 @@ class App(QMainWindow):
         """Launch LightField software."""
         lf.launch_lf(self.lf)
 
+    def close_lf_host(self):
+        """Close LightField and its host process."""
+        lf.close_host(self.lf, shutdown=True)
+        self.ui.acquire_raman.setEnabled(False)
+        self.ui.seq_raman_acquisition.setChecked(False)
+        self.ui.seq_raman_acquisition.setEnabled(False)
+        self.ui.outbox.append('LightField host closed.')
+
     def show_file_list(self):
         """Show the list of acquired Raman spe files."""
         lf.show_file_list(self.lf)
@@ -541,10 +758,26 @@ class App(QMainWindow):
     def acquire_raman(self):
         """Acquire Raman spectra using an opened instance of LightField."""
         lf.acquire_raman(self.lf)
+        self.save_raman()
+
+    def save_raman(self):
+        """Save timestamps of a kinetics series relative to the pulse
+        train which was triggered during it, and log the Raman
+        acquisition."""
+        series = self.lf['kinetics']
+        if series is not None:
+            # only use a pulse train which fired during this acquisition,
+            # not one left over from an earlier step or a servo
+            t0 = self.srs['train_start']
+            if t0 is not None and t0 < series['start']:
+                t0 = None
+            lf.save_kinetics(self.lf, t0=t0)
+        spectrum = self.spectra.get(self.lf['recent_file'])
+        if spectrum is not None:
+            store.append_spectrum(self.store, self.lf['recent_file'],
+                                  spectrum['wl'], spectrum['int'])
         # save metadata information to the log file
-        time.sleep(0.5)
         self.log_to_file()
-        time.sleep(0.5)
         ops.generate_report(self.ops, logpath=self.ops['logpath'])
 
 
@@ -555,14 +788,39 @@ class App(QMainWindow):
         "Run this function when MSO64 oscilloscope checkbox is checked."""
         mso.mso_on(self.mso)
 
+    def scope_acquire_thread(self):
+        """Acquire signal from oscilloscope in a new thread, or cancel
+        the acquisition if one is already running."""
+        if self.mso['busy']:
+            self.mso['cancel'] = True
+            return
+        # mark the scope busy before the worker starts, so a second click
+        # cancels this acquisition instead of starting another one
+        self.mso['busy'] = True
+        self.mso['cancel'] = False
+        self.mso['acquire'].setText('Cancel')
+        worker = Worker(self.scope_acquire)  # pass other args here
+        worker.signals.finished.connect(self.plot_scope_trace)
+        self.threadpool.start(worker)
+
     def scope_acquire(self):
-        """Acquire and plot signal from oscilloscope."""
+        """Acquire signal from oscilloscope."""
+        last_raw = self.mso['last_raw']
         mso.acquire(self.mso)
+        if self.mso['last_raw'] is not last_raw:
+            store.add_trace(self.store, self.mso['last_raw'],
+                            self.mso['last_preambles'],
+                            self.mso['last_sources'], self.mso['last_sig_ts'],
+                            frame_times=self.mso['last_frame_times'])
         self.log_to_file()
 
+    def plot_scope_trace(self):
+        """Plot the most recent oscilloscope trace."""
+        mso.plot_trace(self.mso)
+
     def export_scope_trace(self):
         """Export most recent oscilloscope trace to file."""
-        mso.export(self.mso)
+        mso.export_scope_trace(self.mso)
 
     # %% ============ SRS DG645 pulse generator control =================
 
@@ -611,6 +869,61 @@ class App(QMainWindow):
         avacs.set_percent_now(self.avacs)
 
 
+    # %% ============ Gentec S-Link photometer ===========================
+
+    def slink_on(self):
+        """S-Link photometer checkbox is checked/unchecked."""
+        slink.slink_on(self.slink)
+
+
+    # %% ============ closed-loop fluence control ========================
+
+    def measure_pulse_energy(self):
+        """Fire a burst of calibration pulses and return their mean
+        energy measured by the S-Link photometer."""
+        t0 = time.time()
+        srs.fire(self.srs, self.fluence['pulses'].value(),
+                 self.srs['delay'].value()/1e3)
+        # allow the photometer stream to read the last pulse
+        time.sleep(0.2)
+        return slink.pulse_stats(self.slink, t0)['energy_mean_j']
+
+    def fluence_servo_thread(self):
+        """Servo the AVACS to the target pulse energy in a new thread."""
+        worker = Worker(self.fluence_servo)  # pass other args here
+        self.threadpool.start(worker)
+
+    def fluence_servo(self, target=None, step=None):
+        """Servo the AVACS beam attenuator to the target pulse energy
+        using S-Link photometer readings, and log each iteration."""
+        if None in (self.avacs['dev'], self.srs['dev'], self.slink['dev']):
+            self.ui.outbox.append('Closed-loop fluence control requires '
+                                  'the attenuator, pulse generator, and '
+                                  'photometer to be connected.')
+            return
+        if target is None:
+            target = self.fluence['target'].value()/1e3
+        self.fluence['servo_now'].setEnabled(False)
+        try:
+            self.ui.outbox.append(
+                    'Servoing attenuator to {} mJ...'.format(target*1e3))
+            iterations = avacs.servo_to_energy(
+                    self.avacs, target, self.measure_pulse_energy,
+                    tolerance=self.fluence['tolerance'].value())
+            df = pd.DataFrame(iterations)
+            df.insert(0, 'target_j', target)
+            df.insert(0, 'step', step)
+            df.insert(0, 'time', time.strftime('%Y-%m-%d_%H-%M-%S'))
+            df.to_csv(self.fluence['logpath'], mode='a', index=False,
+                      header=not os.path.exists(self.fluence['logpath']))
+            self.ui.outbox.append(
+                    'Attenuator servo finished after {} iterations, '
+                    'error {}%.'.format(len(iterations)-1,
+                                         self.avacs['servo_error']))
+        finally:
+            self.fluence['servo_now'].setEnabled(True)
+
+
     # %% ============ system control functions =============================
 
     def generate_report(self):
@@ -618,6 +931,27 @@ class App(QMainWindow):
         metadata which is stored in a log file selected by the user."""
         ops.generate_report(self.ops, logpath=None)
 
+    def query_report(self):
+        """Generate a report of the steps of all runs in the catalog which
+        match a condition entered by the user."""
+        where, ok = QInputDialog.getText(
+                self, 'Catalog query',
+                'SQL condition, e.g. avacs_power_pct > 50 AND '
+                "polarizer_angle_deg = 45 AND time >= '2026-09-19':")
+        if ok and where.strip():
+            ops.generate_query_report(self.ops, where)
+
+    def update_catalog_thread(self):
+        """Add all log files to the catalog in a new thread."""
+        worker = Worker(self.update_catalog)
+        self.threadpool.start(worker)
+
+    def update_catalog(self):
+        """Add all log files in the log directory to the catalog."""
+        ops.flush_log(self.ops)
+        catalog.backfill(self.catalog['path'], self.ops['logdir'],
+                         self.raman_dir, outbox=self.ui.outbox)
+
     def set_filedir(self):
         """Change the directory for saving log data files."""
         self.ops['logdir'] = str(QFileDialog.getExistingDirectory(
@@ -626,8 +960,9 @@ class App(QMainWindow):
         self.ui.outbox.append(self.ops['logdir'])
 
     def export_settings(self):
-        """Export all GUI settings to file."""
+        """Export all GUI settings to file and to the run store."""
         ops.export_settings(self.ops)
+        store.add_settings(self.store, ops.get_settings(self.ui))
 
     def import_settings(self):
         """Import all GUI settings from file."""
@@ -639,17 +974,84 @@ class App(QMainWindow):
         """Show the path to the log file."""
         self.ui.outbox.append('Log file path:')
         self.ui.outbox.append(str(self.ops['logpath']))
+        ops.show_log_metrics(self.ops)
 
     def log_to_file(self):
         """Create log file."""
-        ops.log_to_file(self.ops, self.srs,
-                        self.lf, self.kcube,
-                        self.mcl, self.avacs)
+        ops.log_to_file(self.ops, self.slink)
+
+    def seed_state(self):
+        """Fill the instrument state cache with the settings on the GUI
+        before any instrument has reported its state."""
+        state.update(
+                self.state, total_pulses=self.srs['tot_pulses'],
+                pulsewidth_ms=self.srs['width'].value()/1e3,
+                pulse_amplitude_v=self.srs['amplitude'].value(),
+                pulse_delay_ms=self.srs['delay'].value()/1e3,
+                pulse_number=self.srs['number'].value(),
+                **{'energy_error_%': self.avacs['servo_error']})
+        self.notes_changed()
+
+    def notes_changed(self):
+        """Keep the Raman notes in the instrument state cache."""
+        notes = self.lf['notes'].text()
+        state.update(self.state,
+                     notes=notes.replace(',', '__').replace('\t', '__'))
+
+    def show_state(self, values):
+        """Show new values of the instrument state cache on the GUI."""
+        for key, value in values.items():
+            if key in self.state_displays:
+                self.state_displays[key].setText(
+                        '---' if value is None else str(value))
 
     def print_ports(self):
         """Print a list of available serial and VISA ports."""
         ops.print_ports(self.ops)
 
+    def find_instruments_thread(self):
+        """Find the port of each instrument in a new thread."""
+        # the attenuator is not probed, so use the address entered for it
+        known = {self.avacs['address'].text(): 'avacs'}
+        worker = Worker(self.find_instruments, known)
+        worker.signals.finished.connect(self.fill_addresses)
+        self.threadpool.start(worker)
+
+    def find_instruments(self, known=None):
+        """Probe all ports in parallel to find each instrument."""
+        self.ui.outbox.append('Finding instruments...')
+        self.ops['ports'] = discovery.discover(
+                discovery.cache_path(self.logdir), outbox=self.ui.outbox,
+                known=known)
+
+    def fill_addresses(self):
+        """Fill in the addresses of the instruments which were found."""
+        discovery.fill_addresses(self.ops['ports'], {
+                'srs': [self.srs['address']],
+                'mso': [self.mso['address']],
+                'avacs': [self.avacs['address']],
+                'mcl': [self.mcl['address']],
+                'piline': [self.piline['address']],
+                'slink': [self.slink['address']],
+                'kcube': [self.kcube['paddress'], self.kcube['aaddress']]})
+
+    def connect_all_thread(self):
+        """Connect all instruments of the rig profile in a new thread."""
+        worker = Worker(self.connect_all)
+        self.threadpool.start(worker)
+
+    def connect_all(self):
+        """Connect all instruments of the rig profile in parallel."""
+        rig.connect_all(self.rig, rig.load_profile(
+                rig.profile_path(self.ops['logdir'])))
+
+    def save_rig_profile(self):
+        """Save the connected instruments, their addresses and their
+        initialization options as the rig profile."""
+        path = rig.profile_path(self.ops['logdir'])
+        rig.save_profile(path, rig.current_profile(self.rig))
+        self.ui.outbox.append('Rig profile saved to {}'.format(path))
+
     def scroll_outbox(self):
         """Scroll down in the output box each time text is added to it."""
         cursor = self.ui.outbox.textCursor()
@@ -658,6 +1060,12 @@ class App(QMainWindow):
         self.ui.outbox.ensureCursorVisible()
 
 
+    def show_startup_time(self):
+        """Show the time from launching the application until the main
+        window was shown."""
+        self.ui.outbox.append('Application opened in {:.2f} s.'.format(
+                time.perf_counter() - STARTUP))
+
     def quitapp(self):
         """Quit the application."""
         if self.srs['dev'] is not None:
@@ -670,8 +1078,17 @@ class App(QMainWindow):
             self.mcl['dev'].close()
         if self.piline['dev'] is not None:
             self.piline['dev'].close()
-        # kill the process which opens LightField if its already running
-        os.system("taskkill /f /im AddInProcess.exe")
+        if self.slink['dev'] is not None:
+            slink.stop_stream(self.slink)
+            self.slink['dev'].close()
+        # detach from LightField, which stays open in its host process
+        lf.close_host(self.lf)
+        # write the log rows which are still queued
+        ops.stop_log_writer(self.ops)
+        # keep the final settings in the store if anything was recorded
+        if self.store['file'] is not None:
+            store.add_settings(self.store, ops.get_settings(self.ui))
+        store.close_store(self.store)
         # close app window
         self.deleteLater()
         self.close()
@@ -687,4 +1104,6 @@ if __name__ == "__main__":
         app = QtWidgets.QApplication.instance()
     window = App()
     window.show()
+    # report the time to window once the event loop is running
+    QtCore.QTimer.singleShot(0, window.show_startup_time)
     sys.exit(app.exec_())
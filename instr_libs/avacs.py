@@ -10,11 +10,13 @@ import time
 import serial
 import numpy as np
 from serial.tools import list_ports
+from instr_libs import state
 
 def enable_avacs(avacs, enabled):
     """Enable/disable GUI objects."""
     for i in avacs:
-        if i not in ['on', 'address', 'dev', 'outbox', 'setpoint_str']:
+        if i not in ['on', 'address', 'dev', 'outbox', 'setpoint_str',
+                     'servo_error', 'state']:
             avacs[i].setEnabled(enabled)
     avacs['address'].setEnabled(not enabled)
     
@@ -55,6 +57,7 @@ def avacs_on(avacs):
         except AttributeError:
             pass
         avacs['dev'] = None
+        state.update(avacs['state'], avacs_angle_deg=None)
         avacs['outbox'].append('Attenuator closed.')
         avacs['on'].setChecked(False)
         avacs['display'].setText('---')
@@ -82,9 +85,9 @@ def set_now(avacs):
     while round(current_angle) != round(setpoint):
         time.sleep(1)
         current_angle = get_current_angle(avacs)
-    avacs['display'].setText(str(current_angle))
-    avacs['display_percent'].setText(str(
-            round(angle_to_percent(current_angle), 1)))
+    # the GUI shows the new angle when the state is updated
+    state.update(avacs['state'], avacs_angle_deg=current_angle,
+                 **{'avacs_power_%': round(angle_to_percent(current_angle), 1)})
     avacs['outbox'].append('Attenuator set.')   
     avacs['set_now'].setEnabled(True)
     avacs['set_percent_now'].setEnabled(True)
@@ -96,6 +99,43 @@ def set_percent_now(avacs):
     set_now(avacs)
     
 
+def servo_to_energy(avacs, target, measure, tolerance=2, max_iter=8):
+    """Adjust the attenuator until the pulse energy returned by measure()
+    is within tolerance (in percent) of the target energy. The calibration
+    curve is used to convert each measurement into an estimate of the
+    energy at full transmission, which gives the next setpoint, so only
+    a few iterations are needed. Returns a list of dictionaries which
+    describe each iteration."""
+    iterations = []
+    percent = angle_to_percent(avacs['set'].value())
+    energy = measure()
+    for i in range(max_iter+1):
+        error = 100*(energy-target)/target
+        iterations.append({'iteration': i,
+                           'angle_deg': avacs['set'].value(),
+                           'power_%': round(percent, 2),
+                           'energy_j': energy,
+                           'error_%': round(error, 2)})
+        if abs(error) <= tolerance or i == max_iter:
+            break
+        # no pulses were measured, so the energy cannot be estimated
+        if not energy > 0:
+            break
+        full_energy = energy / (percent/100)
+        new_percent = min(100*target/full_energy, 99)
+        avacs['set_percent'].setValue(new_percent)
+        set_percent_now(avacs)
+        # the angle is rounded by the attenuator, so get the actual power
+        new_percent = angle_to_percent(avacs['set'].value())
+        if round(new_percent, 2) == round(percent, 2):
+            break
+        percent = new_percent
+        energy = measure()
+    avacs['servo_error'] = iterations[-1]['error_%']
+    state.update(avacs['state'], **{'energy_error_%': avacs['servo_error']})
+    return iterations
+
+
 def get_sweep(avacs):
     """Get beam powers to sweep for the experimental sequence."""
     sweep = np.linspace(
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module for the SQLite catalog of all runs, their logged steps and the
+locations of their Raman spectra. The catalog lets spectra be found
+across experiments with one query, for example all spectra at more than
+50% power and a polarizer angle of 45 degrees since last month:
+
+    query(path, 'avacs_power_pct > ? AND polarizer_angle_deg = ? '
+          'AND time >= ?', (50, 45, '2026-09-19'))
+
+Steps are added to the catalog by the log writer as they are logged, and
+the log files of earlier runs are added with the backfill command.
+Column names of the log which are not valid SQL names are renamed, e.g.
+avacs_power_% is avacs_power_pct in the catalog.
+
+Usage:
+    python -m instr_libs.catalog LOGDIR [--raman-dir DIR] [--db PATH]
+
+Created on Mon Oct 19 15:58:40 2026
+"""
+
+import os
+import glob
+import time
+import sqlite3
+import argparse
+import numpy as np
+import pandas as pd
+
+
+# default name of the catalog file in the log directory
+CATALOG_NAME = 'catalog.sqlite'
+
+# columns of the steps table which are indexed for fast queries
+INDEXED = ('time', 'recent_raman_file', 'avacs_power_pct',
+           'polarizer_angle_deg', 'x_position_cm', 'y_position_cm')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    name TEXT UNIQUE,
+    logpath TEXT,
+    raman_dir TEXT);
+CREATE TABLE IF NOT EXISTS steps (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER REFERENCES runs(id),
+    row INTEGER,
+    UNIQUE(run_id, row));
+CREATE TABLE IF NOT EXISTS spectra (
+    name TEXT PRIMARY KEY,
+    run_id INTEGER REFERENCES runs(id),
+    path TEXT);
+'''
+
+
+def catalog_path(logdir):
+    """Get the path of the catalog in the log directory."""
+    return os.path.join(logdir, CATALOG_NAME)
+
+
+def sql_name(column):
+    """Get the name of a log column in the catalog."""
+    return column.replace('%', 'pct')
+
+
+def log_name(column):
+    """Get the name of a catalog column in the log."""
+    return column[:-3]+'%' if column.endswith('_pct') else column
+
+
+def connect(path):
+    """Open the catalog, creating its tables if they do not exist."""
+    conn = sqlite3.connect(path, timeout=10)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def step_columns(conn):
+    """Get the names of the logged columns of the steps table."""
+    info = conn.execute('PRAGMA table_info(steps)').fetchall()
+    return [c[1] for c in info if c[1] not in ('id', 'run_id', 'row')]
+
+
+def add_columns(conn, columns):
+    """Add columns which are not yet in the steps table. Columns have no
+    declared type, so numbers and text are both stored as they are."""
+    existing = set(step_columns(conn))
+    for col in columns:
+        if col not in existing:
+            conn.execute('ALTER TABLE steps ADD COLUMN "{}"'.format(col))
+            if col in INDEXED:
+                conn.execute('CREATE INDEX IF NOT EXISTS "steps_{0}" ON '
+                             'steps("{0}")'.format(col))
+            existing.add(col)
+
+
+def add_run(conn, name, logpath, raman_dir):
+    """Add a run to the catalog. Returns the id of the run."""
+    conn.execute('INSERT OR IGNORE INTO runs (name, logpath, raman_dir) '
+                 'VALUES (?, ?, ?)', (name, logpath, raman_dir))
+    conn.commit()
+    return conn.execute('SELECT id FROM runs WHERE name = ?',
+                        (name,)).fetchone()[0]
+
+
+def sql_value(value):
+    """Convert a logged value to a value which SQLite can store. Missing
+    values are stored as NULL."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, (float, np.floating)) and np.isnan(value):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def add_steps(conn, run_id, rows, row_numbers, raman_dir):
+    """Add logged rows of a run to the catalog, together with the
+    expected location of the Raman spectrum of each row. row_numbers are
+    the numbers of the rows in the log. Rows may have different columns,
+    e.g. when an instrument is connected during a run. Rows which are
+    already in the catalog are skipped. The rows are added in one
+    transaction, so either all or none of them are added."""
+    if not rows:
+        return
+    columns = list(dict.fromkeys(c for row in rows for c in row))
+    add_columns(conn, [sql_name(c) for c in columns])
+    names = {sql_value(row.get('recent_raman_file')) for row in rows}
+    with conn:
+        conn.executemany(
+                'INSERT OR IGNORE INTO steps (run_id, row, {}) '
+                'VALUES (:run_id, :row, {})'.format(
+                        ', '.join('"{}"'.format(sql_name(c))
+                                  for c in columns),
+                        ', '.join(':c{}'.format(i)
+                                  for i in range(len(columns)))),
+                [dict({'run_id': run_id, 'row': n},
+                      **{'c{}'.format(i): sql_value(row.get(c))
+                         for i, c in enumerate(columns)})
+                 for n, row in zip(row_numbers, rows)])
+        conn.executemany(
+                'INSERT OR IGNORE INTO spectra (name, run_id, path) '
+                'VALUES (?, ?, ?)',
+                [(str(n), run_id, os.path.join(raman_dir, str(n)+'.csv'))
+                 for n in names if n is not None])
+
+
+def log_steps(catalog, rows, first_row):
+    """Add rows which were just written to the log file of this session.
+    This runs in the log writer thread, which owns the connection."""
+    if catalog['conn'] is None:
+        catalog['conn'] = connect(catalog['path'])
+        catalog['run_id'] = add_run(
+                catalog['conn'], catalog['run'], catalog['logpath'],
+                catalog['raman_dir'])
+    add_steps(catalog['conn'], catalog['run_id'], rows,
+              range(first_row, first_row+len(rows)), catalog['raman_dir'])
+
+
+def close(catalog):
+    """Close the connection of the log writer to the catalog."""
+    if catalog['conn'] is not None:
+        catalog['conn'].close()
+    catalog['conn'] = None
+
+
+def is_log_file(columns):
+    """Check whether the columns of a CSV file are those of a log file."""
+    return 'time' in columns and 'recent_raman_file' in columns
+
+
+def backfill(path, logdir, raman_dir, outbox=None):
+    """Add the log files under a directory to the catalog. Files which
+    are already in the catalog only have the rows which are missing from
+    the catalog added. Returns the number of log files which were read."""
+    report = print if outbox is None else outbox.append
+    start = time.time()
+    conn = connect(path)
+    n_files = n_rows = 0
+    logpaths = glob.glob(os.path.join(logdir, '**', '*.csv'), recursive=True)
+    for logpath in sorted(logpaths):
+        try:
+            log = pd.read_csv(logpath)
+        except (OSError, ValueError):
+            continue
+        if not is_log_file(log.columns):
+            continue
+        name = os.path.splitext(os.path.basename(logpath))[0]
+        run_id = add_run(conn, name, logpath, raman_dir)
+        done = {r[0] for r in conn.execute(
+                'SELECT row FROM steps WHERE run_id = ?', (run_id,))}
+        missing = [i for i in range(len(log)) if i not in done]
+        rows = log.iloc[missing].to_dict('records')
+        add_steps(conn, run_id, rows, missing, raman_dir)
+        n_files += 1
+        n_rows += len(rows)
+    conn.close()
+    report('Catalog updated from {} log files with {} new steps in '
+           '{:.1f} s.'.format(n_files, n_rows, time.time()-start))
+    return n_files
+
+
+def query(path, where='1', params=()):
+    """Find the logged steps which match an SQL condition. Returns a
+    DataFrame with the run name, the log columns under their names in
+    the log, and the path of the Raman spectrum of each step."""
+    conn = connect(path)
+    try:
+        columns = ''.join(', steps."{}"'.format(c) for c in step_columns(conn))
+        if 'recent_raman_file' in columns:
+            spectra = ('LEFT JOIN spectra ON '
+                       'spectra.name = steps.recent_raman_file ')
+        else:
+            spectra = 'LEFT JOIN spectra ON 0 '
+        sql = ('SELECT runs.name AS run, steps.row AS step{}, spectra.path '
+               'AS spectrum_path FROM steps JOIN runs ON steps.run_id = '
+               'runs.id {}WHERE {} ORDER BY runs.name, steps.row'.format(
+                       columns, spectra, where))
+        df = pd.read_sql_query(sql, conn, params=params)
+    finally:
+        conn.close()
+    return df.rename(columns=log_name)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+            description='Add log files to the catalog of runs.')
+    parser.add_argument('logdir', help='directory of log files')
+    parser.add_argument('--raman-dir', default=None,
+                        help='directory of Raman spectra')
+    parser.add_argument('--db', default=None, help='catalog path')
+    args = parser.parse_args()
+    backfill(args.db or catalog_path(args.logdir), args.logdir,
+             args.raman_dir or args.logdir)
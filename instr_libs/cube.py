@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module for a spectral cube: a stack of Raman spectra which share one
+wavelength axis. Spectra are stored as the rows of a preallocated array,
+so appending a spectrum copies only that spectrum, and the array grows
+by doubling when it is full. Large cubes are backed by a memory-mapped
+file, so thousands of spectra fit in bounded RAM. Consumers get views of
+the stored spectra instead of copies.
+
+Created on Mon Oct 19 16:27:14 2026
+"""
+
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+
+# cubes larger than this many bytes are backed by a memory-mapped file
+MEMMAP_BYTES = 256e6
+
+
+def new_cube(wavelength, capacity=64, path=None, dtype=np.float32):
+    """Create an empty cube for spectra on a wavelength axis, with room
+    for capacity spectra. If path is given, or the cube is or grows
+    larger than MEMMAP_BYTES, the spectra are stored in a memory-mapped
+    file at path, or in a temporary file."""
+    wavelength = np.asarray(wavelength, dtype=float)
+    capacity = max(int(capacity), 1)
+    cube = {'wavelength': wavelength, 'labels': [], 'count': 0,
+            'dtype': np.dtype(dtype), 'path': path, 'target': path,
+            'temporary': False, 'old_paths': []}
+    if path is not None:
+        open(path, 'wb').close()
+    allocate(cube, capacity)
+    return cube
+
+
+def allocate(cube, capacity):
+    """Make room for capacity spectra. Spectra already in the cube are
+    kept, and views of them stay valid. A memory-mapped cube grows into a
+    new file next to the old one, because the old file may still be
+    mapped by views, and a mapped file cannot be resized on Windows.
+    cube['path'] is the file which holds the spectra until the cube is
+    closed. A cube in memory moves to a temporary memory-mapped file
+    once it would be larger than MEMMAP_BYTES."""
+    shape = (capacity, len(cube['wavelength']))
+    nbytes = capacity * shape[1] * cube['dtype'].itemsize
+    old = cube.pop('data', None)
+    if cube['path'] is None and nbytes > MEMMAP_BYTES:
+        fd, cube['path'] = tempfile.mkstemp(suffix='_cube.dat')
+        os.close(fd)
+        cube['temporary'] = True
+    elif cube['path'] is not None and old is not None:
+        cube['old_paths'].append(cube['path'])
+        fd, cube['path'] = tempfile.mkstemp(
+                suffix='_cube.dat', dir=os.path.dirname(cube['path']))
+        os.close(fd)
+    if cube['path'] is None:
+        data = np.empty(shape, dtype=cube['dtype'])
+    else:
+        with open(cube['path'], 'r+b') as f:
+            f.truncate(nbytes)
+        data = np.memmap(cube['path'], dtype=cube['dtype'], mode='r+',
+                         shape=shape)
+    if old is not None:
+        data[:cube['count']] = old[:cube['count']]
+        del old
+        remove_old_files(cube)
+    cube['data'] = data
+
+
+def remove_old_files(cube):
+    """Delete the files which a memory-mapped cube has grown out of.
+    Files which are still mapped by views on Windows are kept until the
+    next try."""
+    for path in list(cube['old_paths']):
+        try:
+            os.remove(path)
+            cube['old_paths'].remove(path)
+        except FileNotFoundError:
+            cube['old_paths'].remove(path)
+        except OSError:
+            pass
+
+
+def append(cube, intensity, label='', wavelength=None):
+    """Append a spectrum to the cube. If its wavelength axis is given and
+    differs from the axis of the cube, it is interpolated onto it."""
+    intensity = np.asarray(intensity)
+    if wavelength is not None and (
+            len(wavelength) != len(cube['wavelength']) or
+            not np.allclose(wavelength, cube['wavelength'])):
+        intensity = np.interp(cube['wavelength'], wavelength, intensity)
+    if cube['count'] == len(cube['data']):
+        allocate(cube, 2*len(cube['data']))
+    cube['data'][cube['count']] = intensity
+    cube['labels'].append(label)
+    cube['count'] += 1
+
+
+def spectra(cube):
+    """Get a view of the spectra in the cube, one spectrum per row."""
+    return cube['data'][:cube['count']]
+
+
+def close(cube):
+    """Release the array of the cube, and delete its file if it is
+    temporary. If the cube grew out of the file it was created with, its
+    spectra are moved back to that file. Files which are still mapped by
+    views on Windows cannot be deleted or replaced, so release views of
+    the cube before closing it."""
+    data = cube.pop('data', None)
+    if isinstance(data, np.memmap):
+        data.flush()
+    del data
+    remove_old_files(cube)
+    if cube['path'] is None or not os.path.exists(cube['path']):
+        return
+    try:
+        if cube['temporary']:
+            os.remove(cube['path'])
+        elif cube['path'] != cube['target']:
+            os.replace(cube['path'], cube['target'])
+            cube['path'] = cube['target']
+    # a view of the memory map may still be open on Windows
+    except OSError:
+        pass
+
+
+def file_label(path):
+    """Get the label of a spectrum file."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def from_csv_files(filelist, path=None):
+    """Read LightField CSV files into a cube. The wavelength axis is read
+    from the first file only, and only the intensity of the other files,
+    unless their length differs."""
+    filelist = list(filelist)
+    if not filelist:
+        return None
+    df = pd.read_csv(filelist[0], usecols=['Wavelength', 'Intensity'])
+    cube = new_cube(df['Wavelength'].to_numpy(), len(filelist), path=path)
+    append(cube, df['Intensity'].to_numpy(), file_label(filelist[0]))
+    for f in filelist[1:]:
+        intensity = pd.read_csv(f, usecols=['Intensity'])['Intensity']
+        wavelength = None
+        if len(intensity) != len(cube['wavelength']):
+            wavelength = pd.read_csv(f, usecols=['Wavelength'])['Wavelength']
+        append(cube, intensity.to_numpy(), file_label(f), wavelength)
+    return cube
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module for converting a directory of Raman spectra into a single
+dataset. Each LightField CSV or SPE file is parsed once, in parallel
+using a process pool, and the spectra are stored in one .npz file with
+an intensity matrix (one row per file), a shared wavelength axis, and
+columns of metadata joined from the application log files. Running the
+conversion again only parses files which are not yet in the dataset.
+
+Usage:
+    python -m instr_libs.dataset RAMAN_DIR [--log LOG.csv ...] [--out PATH]
+
+Created on Mon Oct 19 11:41:07 2026
+"""
+
+import os
+import glob
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from instr_libs import spe
+
+
+# default name of the dataset file in the Raman directory
+DATASET_NAME = 'raman_dataset.npz'
+
+
+def read_spectrum(path):
+    """Read a LightField CSV or SPE file as a wavelength array and an
+    intensity array. The frames of multi-frame files are summed. This
+    runs in the worker processes of the pool."""
+    if path.lower().endswith('.spe'):
+        s = spe.open_spe(path)
+        wl, intensity = spe.get_spectrum(s, 0)
+        for frame in range(1, s['n_frames']):
+            intensity += spe.get_spectrum(s, frame)[1]
+        spe.close_spe(s)
+        if wl is None:
+            wl = np.arange(len(intensity), dtype=float)
+        return wl, intensity
+    df = pd.read_csv(path, usecols=['Wavelength', 'Intensity'])
+    wl = df['Wavelength'].to_numpy()
+    intensity = df['Intensity'].to_numpy(dtype=float)
+    # frames of a kinetics series are stored one after another
+    n_frames = int(np.sum(wl == wl[0]))
+    if n_frames > 1 and len(wl) % n_frames == 0:
+        wl = wl[:len(wl)//n_frames]
+        intensity = intensity.reshape(n_frames, -1).sum(axis=0)
+    return wl, intensity
+
+
+def read_spectrum_safe(path):
+    """Read a spectrum, returning the error message instead of raising
+    so one bad file does not stop the batch."""
+    try:
+        return read_spectrum(path)
+    except Exception as e:
+        return '{}: {}'.format(type(e).__name__, e)
+
+
+def list_spectra(raman_dir):
+    """Get the CSV and SPE files in a directory, sorted by name."""
+    files = glob.glob(os.path.join(raman_dir, '*.csv'))
+    files += glob.glob(os.path.join(raman_dir, '*.spe'))
+    return sorted(f for f in files if not f.endswith(DATASET_NAME))
+
+
+def file_label(path):
+    """Get the name of a spectrum file as used in the log files."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def read_log_metadata(log_paths):
+    """Read the rows of the log files which describe Raman acquisitions.
+    The first row logged after each acquisition is kept, since later
+    rows can refer to the same spectrum after other instruments moved."""
+    logs = [pd.read_csv(p) for p in log_paths]
+    logs = [log for log in logs if 'recent_raman_file' in log.columns]
+    if not logs:
+        return pd.DataFrame({'name': []})
+    log = pd.concat(logs, ignore_index=True, sort=False)
+    log = log.dropna(subset=['recent_raman_file'])
+    log = log.drop_duplicates(subset='recent_raman_file', keep='first')
+    return log.rename(columns={'recent_raman_file': 'name'})
+
+
+def load_dataset(path):
+    """Load a Raman dataset. Returns a dictionary with the names of the
+    spectra, the intensity matrix, the wavelength axis and a DataFrame
+    of metadata which has one row per spectrum."""
+    with np.load(path, allow_pickle=False) as npz:
+        d = {key: npz[key] for key in ('names', 'intensity', 'wavelength')}
+        meta = {key[5:]: npz[key] for key in npz.files
+                if key.startswith('meta_')}
+    d['names'] = d['names'].astype(str)
+    d['meta'] = pd.DataFrame(meta, index=d['names'])
+    return d
+
+
+def save_dataset(path, names, intensity, wavelength, meta):
+    """Save a Raman dataset to a single .npz file. Each metadata column
+    is stored as its own array. The file is replaced atomically."""
+    arrays = {'names': np.asarray(names, dtype=str),
+              'intensity': intensity, 'wavelength': wavelength}
+    for col in meta.columns:
+        values = meta[col].to_numpy()
+        if values.dtype == object:
+            values = values.astype(str)
+        arrays['meta_'+col] = values
+    tmp = path+'.tmp.npz'
+    np.savez(tmp, **arrays)
+    os.replace(tmp, path)
+
+
+def convert(raman_dir, log_paths=(), out=None, workers=None,
+            chunksize=16, outbox=None):
+    """Convert the spectra in a directory into a single dataset, parsing
+    only files which are not already in it. Spectra on a different
+    wavelength axis are interpolated onto the shared axis. Metadata is
+    joined again from the log files each time. Returns the path of the
+    dataset and the number of newly added spectra."""
+    report = print if outbox is None else outbox.append
+    out = out or os.path.join(raman_dir, DATASET_NAME)
+    if os.path.exists(out):
+        old = load_dataset(out)
+        names, rows = list(old['names']), [old['intensity']]
+        wavelength = old['wavelength']
+    else:
+        names, rows, wavelength = [], [], None
+    done = set(names)
+    new = [f for f in list_spectra(raman_dir) if file_label(f) not in done]
+    report('Converting {} new spectra...'.format(len(new)))
+    added = []
+    if new:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(read_spectrum_safe, new, chunksize=chunksize)
+            for f, result in zip(new, results):
+                if isinstance(result, str):
+                    report('Skipped {} ({})'.format(f, result))
+                    continue
+                wl, intensity = result
+                if wavelength is None:
+                    wavelength = wl
+                if len(wl) != len(wavelength) or not np.allclose(
+                        wl, wavelength):
+                    intensity = np.interp(wavelength, wl, intensity)
+                names.append(file_label(f))
+                added.append(intensity)
+    if wavelength is None:
+        report('No spectra found in {}'.format(raman_dir))
+        return out, 0
+    intensity = np.concatenate(
+            rows + [np.array(added, dtype=np.float32).reshape(
+                    -1, len(wavelength))])
+    meta = pd.DataFrame({'name': names})
+    meta = meta.merge(read_log_metadata(log_paths), on='name', how='left')
+    save_dataset(out, names, intensity, wavelength, meta.drop(columns='name'))
+    report('{} spectra added to {}'.format(len(added), out))
+    return out, len(added)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+            description='Convert Raman spectra into a single dataset.')
+    parser.add_argument('raman_dir', help='directory of CSV/SPE spectra')
+    parser.add_argument('--log', nargs='*', default=[],
+                        help='log files to join metadata from')
+    parser.add_argument('--out', default=None, help='dataset path')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of worker processes')
+    args = parser.parse_args()
+    convert(args.raman_dir, args.log, out=args.out, workers=args.workers)
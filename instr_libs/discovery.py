@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module for finding which instrument is connected to each port.
+
+All VISA resources and serial ports are probed in parallel with short
+timeouts. Each serial port is sent the identify query of each type of
+serial instrument until one of them answers, and VISA resources are
+sent *IDN?. Thorlabs K-Cubes are listed by serial number using the APT
+library. The resulting map of port to instrument is cached in a JSON
+file, and cached ports are probed with their known instrument first on
+the next run.
+
+Created on Mon Oct 19 13:46:22 2026
+"""
+
+import os
+import re
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+import serial
+from serial.tools import list_ports
+from instr_libs import lazy
+
+
+# serial instruments in the order they are probed: the serial settings,
+# the identify query, and text which is expected in the reply, or a
+# regular expression which the whole reply must match
+SERIAL_PROBES = {
+        'srs': {'baudrate': 9600, 'stopbits': serial.STOPBITS_ONE,
+                'query': '*IDN?\r', 'match': 'Stanford Research Systems'},
+        'piline': {'baudrate': 115200, 'stopbits': serial.STOPBITS_ONE,
+                   'query': '*IDN?\n', 'match': 'Physik Instrumente'},
+        'slink': {'baudrate': 921600, 'stopbits': serial.STOPBITS_ONE,
+                  'query': '*VER', 'match': 'LINK'},
+        'mcl': {'baudrate': 9600, 'stopbits': serial.STOPBITS_TWO,
+                # the MCL-3 replies to UF with its status register as a
+                # decimal number
+                'query': 'UF\r\r', 'pattern': r'\d{1,3}'}}
+
+# serial instruments which are never probed, because they have no query
+# which leaves them as they are: the AVACS attenuator has to be put in
+# remote mode and sent an angle to reply. Their ports are taken from the
+# cache or from the addresses entered by the user.
+PASSIVE = ('avacs',)
+
+# text expected in the *IDN? reply of VISA instruments
+VISA_PROBES = {'mso': 'MSO6'}
+
+# name of the cache file of the port to instrument map
+CACHE_NAME = 'ports.json'
+
+
+def query_serial(port, probe, timeout=0.3):
+    """Send an identify query to a serial port and get the reply."""
+    with serial.Serial(port=port, baudrate=probe['baudrate'],
+                       stopbits=probe['stopbits'], timeout=timeout,
+                       write_timeout=timeout) as dev:
+        dev.reset_input_buffer()
+        dev.write(probe['query'].encode())
+        return dev.readline().decode(errors='replace').strip()
+
+
+def is_match(probe, reply):
+    """Check whether the reply to an identify query is from the
+    instrument of the probe."""
+    if not reply:
+        return False
+    if 'pattern' in probe:
+        return re.fullmatch(probe['pattern'], reply) is not None
+    return probe['match'] in reply
+
+
+def probe_serial(port, first=None, timeout=0.3):
+    """Find the instrument on a serial port by sending each identify
+    query until one is answered as expected. The instrument named by
+    first is tried first. Returns the instrument name and its reply, or
+    None and an empty reply, or None and None if the port is busy."""
+    names = list(SERIAL_PROBES)
+    if first in names:
+        names.remove(first)
+        names.insert(0, first)
+    for name in names:
+        probe = SERIAL_PROBES[name]
+        try:
+            reply = query_serial(port, probe, timeout=timeout)
+        except (serial.SerialException, OSError):
+            # the port is busy or gone, so no other query will work
+            return None, None
+        if is_match(probe, reply):
+            return name, reply
+    return None, ''
+
+
+def probe_visa(rm, resource, timeout=0.3):
+    """Find the instrument on a VISA resource using *IDN?. Returns the
+    instrument name and its reply, or None and the reply."""
+    try:
+        dev = rm.open_resource(resource, open_timeout=int(timeout*1e3))
+        try:
+            dev.timeout = int(timeout*1e3)
+            reply = dev.query('*IDN?').strip()
+        finally:
+            dev.close()
+    except Exception:
+        return None, ''
+    for name, match in VISA_PROBES.items():
+        if match in reply:
+            return name, reply
+    return None, reply
+
+
+def load_cache(path):
+    """Load the cached map of port to instrument name."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(path, ports):
+    """Save the map of port to instrument name."""
+    with open(path, 'w') as f:
+        json.dump(ports, f, indent=2)
+
+
+def discover(cache_path=None, timeout=0.3, workers=16, outbox=None,
+             known=None):
+    """Probe all VISA resources and serial ports in parallel and find
+    which instrument is connected to each. Returns a dictionary which
+    maps each port to its instrument name. K-Cube serial numbers map to
+    'kcube'. known maps the ports entered by the user to their
+    instruments. Ports of PASSIVE instruments, known or cached, are not
+    probed. The map is cached at cache_path if it is given."""
+    start = time.time()
+    cache = {} if cache_path is None else load_cache(cache_path)
+    passive = {port: name for port, name in cache.items()
+               if name in PASSIVE}
+    passive.update({port: name for port, name in (known or {}).items()
+                    if name in PASSIVE})
+    devices = [p.device for p in list_ports.comports()]
+    serial_ports = [p for p in devices if p not in passive]
+    visa = lazy.load('visa', outbox)
+    rm = None if visa is None else visa.ResourceManager()
+    # serial ports are probed directly, not through VISA
+    resources = [] if rm is None else [
+            r for r in rm.list_resources() if not r.startswith('ASRL')]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        jobs = {p: pool.submit(probe_serial, p, cache.get(p), timeout)
+                for p in serial_ports}
+        jobs.update({r: pool.submit(probe_visa, rm, r, timeout)
+                     for r in resources})
+        ports = {port: name for port, name in passive.items()
+                 if port in devices}
+        for port, job in jobs.items():
+            name, reply = job.result()
+            # keep the cached instrument of ports which are in use
+            if reply is None:
+                name = cache.get(port)
+            if name is not None:
+                ports[port] = name
+    apt = lazy.load('thorlabs_apt', outbox)
+    if apt is not None:
+        for _, serial_number in apt.list_available_devices():
+            ports[str(serial_number)] = 'kcube'
+    if cache_path is not None:
+        save_cache(cache_path, ports)
+    if outbox is not None:
+        outbox.append('Found {} instruments on {} ports in {:.1f} s:'.format(
+                len(ports), len(jobs), time.time()-start))
+        for port, name in ports.items():
+            outbox.append('{}: {}'.format(name, port))
+    return ports
+
+
+def cache_path(logdir):
+    """Get the path of the port cache in the log directory."""
+    return os.path.join(logdir, CACHE_NAME)
+
+
+def fill_addresses(ports, addresses):
+    """Fill in the address fields of instruments which were found.
+    addresses maps each instrument name to a list of its address
+    widgets. Widgets which are disabled, because their instrument is
+    connected, or which already hold a found address are left as is."""
+    found = {}
+    for port, name in sorted(ports.items()):
+        found.setdefault(name, []).append(port)
+    for name, widgets in addresses.items():
+        current = [w.text() for w in widgets]
+        free = [p for p in found.get(name, []) if p not in current]
+        for w in widgets:
+            if not free:
+                break
+            if w.isEnabled() and w.text() not in found.get(name, []):
+                w.setText(free.pop(0))
@@ -9,9 +9,10 @@ Created on Wed Feb 19 10:07:30 2020
 @author: ericmuckley@gmail.com
 """
 
-import thorlabs_apt as apt
 import numpy as np
 import time
+from instr_libs import lazy
+from instr_libs import state
 
 
 def enable_polarizer(kcube, enable):
@@ -35,6 +36,8 @@ def polarizer_on(kcube):
     """Polarizer checkbox is checked or unchecked."""
     if kcube['p_on'].isChecked():
         try:
+            # thorlabs_apt loads APT.dll, so import it only when needed
+            apt = lazy.load('thorlabs_apt', kcube['outbox'])
             kcube['pdev'] = apt.Motor(int(kcube['paddress'].text()))
             kcube['outbox'].append('Polarizer controller connected.')
             kcube['outbox'].append(str(kcube['pdev'].hardware_info))
@@ -46,7 +49,11 @@ def polarizer_on(kcube):
             # set initial angle to be current angle when program started
             current_position = round(kcube['pdev'].position)
             kcube['p_set'].setValue(current_position)
-            polarizer_set_now(kcube)
+            if kcube.get('p_move_on_connect', True):
+                polarizer_set_now(kcube)
+            else:
+                state.update(kcube['state'], polarizer_angle_deg=round(
+                        kcube['pdev'].position, 1))
         except:
             kcube['outbox'].append('Polarizer controller could not connect.')
             enable_polarizer(kcube, False)
@@ -56,6 +63,7 @@ def polarizer_on(kcube):
             kcube['seq_polarizer_rot'].setChecked(False)
     if not kcube['p_on'].isChecked():
         kcube['pdev'] = None
+        state.update(kcube['state'], polarizer_angle_deg=None)
         enable_polarizer(kcube, False)
         kcube['p_on'].setChecked(False)
         kcube['p_display'].setText('---')
@@ -67,6 +75,8 @@ def analyzer_on(kcube):
     """Analyzer checkbox is checked or unchecked."""
     if kcube['a_on'].isChecked():
         try:
+            # thorlabs_apt loads APT.dll, so import it only when needed
+            apt = lazy.load('thorlabs_apt', kcube['outbox'])
             kcube['adev'] = apt.Motor(int(kcube['aaddress'].text()))
             kcube['outbox'].append('Analyzer controller connected.')
             kcube['outbox'].append(str(kcube['adev'].hardware_info))
@@ -78,7 +88,11 @@ def analyzer_on(kcube):
             # set initial angle to be current angle when program started
             current_position = round(kcube['adev'].position)
             kcube['a_set'].setValue(current_position)
-            analyzer_set_now(kcube)
+            if kcube.get('a_move_on_connect', True):
+                analyzer_set_now(kcube)
+            else:
+                state.update(kcube['state'], analyzer_angle_deg=round(
+                        kcube['adev'].position, 1))
         except:
             kcube['outbox'].append('Analyzer controller could not connect.')
             enable_analyzer(kcube, False)
@@ -87,6 +101,7 @@ def analyzer_on(kcube):
             kcube['a_display'].setText('---')
     if not kcube['a_on'].isChecked():
         kcube['adev'] = None
+        state.update(kcube['state'], analyzer_angle_deg=None)
         enable_analyzer(kcube, False)
         kcube['a_on'].setChecked(False)
         kcube['a_display'].setText('---')
@@ -114,7 +129,7 @@ def polarizer_set_now(kcube):
     kcube['outbox'].append(
         'Polarizer at {} deg...'.format(position))
     kcube['p_set_now'].setEnabled(True)
-    kcube['p_display'].setText(str(position))
+    state.update(kcube['state'], polarizer_angle_deg=position)
 
 
 
@@ -138,7 +153,7 @@ def analyzer_set_now(kcube):
     kcube['outbox'].append(
         'Analyzer at {} deg...'.format(position))
     kcube['a_set_now'].setEnabled(True)
-    kcube['a_display'].setText(str(position))
+    state.update(kcube['state'], analyzer_angle_deg=position)
 
 
 
@@ -180,6 +195,7 @@ def analyzer_move_to(kcube):
 
 if __name__ == '__main__':
 
+    import thorlabs_apt as apt
     dev = apt.Motor(27255762)
     
     #print(dev.hardware_info)
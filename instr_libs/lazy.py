@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module for importing hardware SDKs and slow libraries on demand.
+
+Instrument modules call load() when their instrument is enabled instead
+of importing SDKs such as thorlabs_apt (which loads APT.dll) or visa at
+import time. This keeps startup fast and lets the application start on
+machines which are missing some SDKs, e.g. on Linux.
+
+Created on Mon Oct 19 12:02:16 2026
+"""
+
+import importlib
+
+
+# plot settings which make plots look nicer
+PLOT_STYLE = {
+        'xtick.labelsize': 14,
+        'ytick.labelsize': 14,
+        'axes.linewidth': 3,
+        'xtick.minor.width': 3,
+        'xtick.major.width': 3,
+        'ytick.minor.width': 3,
+        'ytick.major.width': 3,
+        'figure.autolayout': True}
+
+# whether the plot settings have been applied
+styled = False
+
+
+def load(name, outbox=None):
+    """Import an SDK module by name. If it can not be imported, the error
+    is reported to the outbox and None is returned."""
+    try:
+        return importlib.import_module(name)
+    # OSError is raised when a module fails to load its DLL
+    except (ImportError, OSError) as e:
+        if outbox is not None:
+            outbox.append('{} could not be loaded: {}'.format(name, e))
+        return None
+
+
+def pyplot():
+    """Import matplotlib.pyplot, applying the plot settings on first
+    use."""
+    global styled
+    import matplotlib.pyplot as plt
+    if not styled:
+        plt.rcParams.update(PLOT_STYLE)
+        styled = True
+    return plt
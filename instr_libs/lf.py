@@ -11,60 +11,174 @@ Created on Mon Feb 17 17:56:21 2020
 import os
 import sys
 import time
+import ctypes
+import threading
+import subprocess
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib import cm
 from PyQt5.QtWidgets import QFileDialog
-
-
-import clr  # the .NET class library
-import System.IO as sio  # for saving and opening files
-# Import c compatible List and String
-from System import String
-from System.Collections.Generic import List
-# Add needed dll references for LightField
-sys.path.append(os.environ['LIGHTFIELD_ROOT'])
-sys.path.append(os.environ['LIGHTFIELD_ROOT']+"\\AddInViews")
-clr.AddReference('System.IO')
-clr.AddReference('System.Collections')
-clr.AddReference('PrincetonInstruments.LightFieldViewV5')
-clr.AddReference('PrincetonInstruments.LightField.AutomationV5')
-clr.AddReference('PrincetonInstruments.LightFieldAddInSupportServices')
-# Princeton Instruments imports
-from PrincetonInstruments.LightField.Automation import Automation
-from PrincetonInstruments.LightField.AddIns import ExperimentSettings
-from PrincetonInstruments.LightField.AddIns import DeviceType 
-
-# ------- change matplotlib settings to make plots look nicer --------------
-
-plt.rcParams['xtick.labelsize'] = 14
-plt.rcParams['ytick.labelsize'] = 14
-plt.rcParams['axes.linewidth'] = 3
-plt.rcParams['xtick.minor.width'] = 3
-plt.rcParams['xtick.major.width'] = 3
-plt.rcParams['ytick.minor.width'] = 3
-plt.rcParams['ytick.major.width'] = 3
-plt.rcParams['figure.autolayout'] = True
+from instr_libs import lazy
+from instr_libs import state
+from instr_libs import cube
+from instr_libs.ops import wait_for_file
+
+
+# LightField .NET classes, loaded by load_lightfield()
+Automation = None
+ExperimentSettings = None
+CameraSettings = None
+DeviceType = None
+List = None
+String = None
+
+# numpy types of the .NET arrays which hold LightField pixel data
+NET_DTYPES = {'UInt16': np.uint16, 'UInt32': np.uint32, 'Int32': np.int32,
+              'Single': np.float32, 'Double': np.float64}
+
+
+def load_lightfield(standin=False):
+    """Load the LightField automation classes. If standin is True, the
+    pure Python stand-in in lf_standin.py is used instead, so the
+    wrapper can run without LightField, e.g. on Linux."""
+    global Automation, ExperimentSettings, CameraSettings, DeviceType
+    global List, String
+    if standin:
+        from instr_libs import lf_standin as pi
+        Automation = pi.Automation
+        ExperimentSettings, DeviceType = pi.ExperimentSettings, pi.DeviceType
+        CameraSettings = pi.CameraSettings
+        List, String = pi.List, pi.String
+        return
+    import clr  # the .NET class library
+    # Import c compatible List and String
+    from System import String
+    from System.Collections.Generic import List
+    # Add needed dll references for LightField
+    sys.path.append(os.environ['LIGHTFIELD_ROOT'])
+    sys.path.append(os.environ['LIGHTFIELD_ROOT']+"\\AddInViews")
+    clr.AddReference('System.IO')
+    clr.AddReference('System.Collections')
+    clr.AddReference('PrincetonInstruments.LightFieldViewV5')
+    clr.AddReference('PrincetonInstruments.LightField.AutomationV5')
+    clr.AddReference('PrincetonInstruments.LightFieldAddInSupportServices')
+    # Princeton Instruments imports
+    from PrincetonInstruments.LightField.Automation import Automation
+    from PrincetonInstruments.LightField.AddIns import ExperimentSettings
+    from PrincetonInstruments.LightField.AddIns import CameraSettings
+    from PrincetonInstruments.LightField.AddIns import DeviceType
+
+
+def kill_lightfield(wait=False):
+    """Kill the AddInProcess which hosts LightField if it is already
+    running. This only applies on Windows. The process is killed in the
+    background unless wait is True."""
+    if os.name != 'nt':
+        return
+    proc = subprocess.Popen(
+            ['taskkill', '/f', '/im', 'AddInProcess.exe'],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            creationflags=subprocess.CREATE_NO_WINDOW)
+    if wait:
+        proc.wait()
+
+
+def host_address(lf):
+    """Get the local address of the LightField host process."""
+    return ('localhost', lf['host_port'])
+
+
+def connect_host(lf, timeout=0):
+    """Attach to the LightField host process, retrying until the timeout
+    in seconds. Returns True if the connection was made."""
+    from multiprocessing.connection import Client
+    from instr_libs.lf_host import get_authkey
+    authkey = get_authkey()
+    start = time.time()
+    while True:
+        try:
+            lf['host'] = Client(host_address(lf), authkey=authkey)
+            return True
+        except OSError:
+            if time.time() - start > timeout:
+                return False
+            time.sleep(0.2)
+
+
+def start_host(lf):
+    """Start the LightField host process. It is detached from the
+    application, so it keeps LightField and the experiment loaded after
+    the application quits."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    cmd = [sys.executable, '-m', 'instr_libs.lf_host',
+           '--port', str(lf['host_port']),
+           '--experiment', lf['experiment']]
+    if lf['standin']:
+        cmd.append('--standin')
+    if os.name == 'nt':
+        flags = (subprocess.DETACHED_PROCESS |
+                 subprocess.CREATE_NEW_PROCESS_GROUP)
+        subprocess.Popen(cmd, cwd=root, creationflags=flags)
+    else:
+        subprocess.Popen(cmd, cwd=root, start_new_session=True)
+
+
+def host_request(lf, cmd, **kwargs):
+    """Send a command to the LightField host and wait for its reply.
+    lf['started'] is set when the host reports that an acquisition has
+    started. Returns None if the host reported an error or the
+    connection was lost."""
+    with lf['host_lock']:
+        try:
+            lf['host'].send((cmd, kwargs))
+            while True:
+                kind, value = lf['host'].recv()
+                if kind == 'started':
+                    lf['started'].set()
+                elif kind == 'error':
+                    lf['outbox'].append('LightField host error:')
+                    lf['outbox'].append(value)
+                    return None
+                else:
+                    return value
+        except (EOFError, OSError):
+            lf['outbox'].append('Lost connection to LightField host.')
+            lf['host'] = None
+            return None
+
+
+def close_host(lf, shutdown=False):
+    """Detach from the LightField host. If shutdown is True, the host
+    process and LightField are closed too."""
+    if lf['host'] is None:
+        return
+    if shutdown:
+        host_request(lf, 'shutdown')
+    if lf['host'] is not None:
+        lf['host'].close()
+    lf['host'] = None
 
 
 def launch_lf(lf):
-    """Launch LightField software."""
-    lf['outbox'].append('Opening LightField...')
-    # kill the process which opens LightField if its already running
-    #os.system("taskkill /f /im AddInProcess.exe")
-    # create a C# compatible List of type String object
-    lf_exp_list = List[String]()
-    # add the command line option for an empty experiment
-    lf_exp_list.Add("/empty")#("Default_Python_Experiment")#
-    # create the LightField Application (true for visible)
-    # the 2nd parameter is the experiment name to load 
-    lf['app'] = Automation(True, List[String](lf_exp_list))
+    """Attach to the LightField host process, which owns the LightField
+    Automation object and keeps the experiment loaded. The host is
+    started first if it is not already running."""
+    if lf['host'] is None:
+        lf['outbox'].append('Attaching to LightField host...')
+        if not connect_host(lf):
+            lf['outbox'].append('Opening LightField...')
+            start_host(lf)
+            if not connect_host(lf, timeout=lf['host_timeout']):
+                lf['outbox'].append('LightField host could not start.')
+                return
+    info = host_request(lf, 'ping')
+    if info is None:
+        return
     lf['acquire'].setEnabled(True)
     lf['notes'].setEnabled(True)
     lf['seq'].setEnabled(True)
-    lf['outbox'].append('LightField opened.')
-    lf['outbox'].append('Now load "Default_Python_Experiment" in Lightfield.')
+    lf['outbox'].append('LightField opened with experiment "{}".'.format(
+            info['experiment']))
+    if not info['device']:
+        lf['outbox'].append('No LightField-compatible devices found.')
 
 
 def device_found(experiment):
@@ -79,7 +193,7 @@ def save_file(filename, experiment):
     # Set the base file name
     experiment.SetValue(
         ExperimentSettings.FileNameGenerationBaseFileName,
-        sio.Path.GetFileName(filename))
+        os.path.basename(filename))
     # Option to Increment, set to false will not increment
     experiment.SetValue(
         ExperimentSettings.FileNameGenerationAttachIncrement, False)
@@ -99,30 +213,240 @@ def show_file_list(lf):
         lf['outbox'].append(f)
 
 
-def acquire_raman(lf):
-    """Acquire Raman spectra using an opened instance of LightField."""
-    # get current loaded experiment
-    experiment = lf['app'].LightFieldApplication.Experiment
-    # check for device and inform user if one is needed
-    if (device_found(experiment)==True):        
-        file_name = time.strftime('%Y-%m-%d_%H-%M-%S')
-        lf['recent_file'] = file_name
-        lf['file_list'].append(file_name+'.csv')
-        # pass location of saved file
-        save_file(file_name, experiment)
-        time.sleep(0.2)
-        # acquire image
+def net_array_to_numpy(data):
+    """Copy a .NET array of pixel data into a numpy array with a single
+    block copy, instead of iterating over it element by element."""
+    if isinstance(data, np.ndarray):
+        return data.copy()
+    from System.Runtime.InteropServices import GCHandle, GCHandleType
+    dtype = np.dtype(NET_DTYPES[data.GetType().GetElementType().Name])
+    handle = GCHandle.Alloc(data, GCHandleType.Pinned)
+    try:
+        address = handle.AddrOfPinnedObject().ToInt64()
+        buf = (ctypes.c_char * (data.Length*dtype.itemsize)).from_address(
+                address)
+        arr = np.frombuffer(buf, dtype=dtype).copy()
+    finally:
+        handle.Free()
+    return arr
+
+
+def dataset_to_numpy(dataset):
+    """Get all frames of the first region of interest of a LightField
+    image dataset as an (n_frames, height, width) array."""
+    frames = []
+    for fi in range(dataset.Frames):
+        frame = dataset.GetFrame(0, fi)
+        frames.append(net_array_to_numpy(frame.GetData()).reshape(
+                frame.Height, frame.Width))
+    return np.stack(frames)
+
+
+def spectrometer_setting(experiment, setting):
+    """Get a spectrometer setting of the experiment, or None if the
+    experiment has no spectrometer."""
+    try:
+        return experiment.GetValue(setting)
+    except Exception:
+        return None
+
+
+def get_wavelength(lf, experiment):
+    """Get the wavelength calibration of the experiment. It is read from
+    LightField once and then cached until the grating or the center
+    wavelength of the spectrometer is changed."""
+    key = (spectrometer_setting(
+                   experiment, ExperimentSettings.SpectrometerGratingSelected),
+           spectrometer_setting(
+                   experiment,
+                   ExperimentSettings.SpectrometerGratingCenterWavelength))
+    if lf['wavelength'] is None or lf.get('wavelength_key') != key:
+        lf['wavelength'] = net_array_to_numpy(
+                experiment.SystemColumnCalibration)
+        lf['wavelength_key'] = key
+    return lf['wavelength']
+
+
+def wait_for_acquisition(experiment, timeout=120, on_data=None,
+                         on_start=None):
+    """Start an acquisition and wait for LightField to report that it
+    has completed, instead of sleeping for a fixed time. The
+    ExperimentCompleted event is used, with IsRunning polled as a
+    fallback. If on_data is given, it is called with each image dataset
+    as a numpy array as soon as the dataset is received. If on_start is
+    given, it is called once the acquisition has been started. Returns
+    False if the timeout elapsed first."""
+    done = threading.Event()
+
+    def completed(sender, args):
+        done.set()
+
+    def received(sender, args):
+        on_data(dataset_to_numpy(args.ImageDataSet))
+
+    experiment.ExperimentCompleted += completed
+    if on_data is not None:
+        experiment.ImageDataSetReceived += received
+    try:
         experiment.Acquire()
-        time.sleep(0.2)
-        lf['outbox'].append('Raman data saved to:')
-        lf['outbox'].append(
-                str(experiment.GetValue(
-                        ExperimentSettings.FileNameGenerationDirectory)))
+        if on_start is not None:
+            on_start()
+        start = time.time()
+        while not done.wait(0.05):
+            if not experiment.IsRunning:
+                break
+            if time.time() - start > timeout:
+                return False
+    finally:
+        experiment.ExperimentCompleted -= completed
+        if on_data is not None:
+            experiment.ImageDataSetReceived -= received
+    return True
+
+
+def file_stamp():
+    """Get a timestamp for file names with millisecond resolution, so
+    acquisitions less than a second apart get unique names."""
+    now = time.time()
+    return '{}-{:03d}'.format(
+            time.strftime('%Y-%m-%d_%H-%M-%S', time.localtime(now)),
+            int(now % 1 * 1000))
+
+
+def open_series(raman_dir, name, n_frames, wavelength):
+    """Allocate the buffers of a series of n_frames spectra. A series of
+    more than one frame (kinetics mode) is streamed into a .npy file in
+    the Raman directory as the frames arrive, so long series do not have
+    to fit in memory."""
+    shape = (n_frames, len(wavelength))
+    if n_frames > 1:
+        path = os.path.join(raman_dir, name+'_kinetics.npy')
+        frames = np.lib.format.open_memmap(
+                path, mode='w+', dtype=np.float64, shape=shape)
     else:
+        path = None
+        frames = np.zeros(shape)
+    return {'name': name, 'path': path, 'wl': wavelength, 'frames': frames,
+            'time': np.full(n_frames, np.nan), 'count': 0,
+            'start': time.time()}
+
+
+def store_frames(series, data):
+    """Store frames of an image dataset in a series as they arrive. The
+    rows of each frame are summed into a spectrum, and each frame is
+    stamped with the time at which its dataset was received."""
+    t = time.time()
+    i = series['count']
+    n = min(len(data), len(series['frames']) - i)
+    series['frames'][i:i+n] = data[:n].sum(axis=1)
+    series['time'][i:i+n] = t
+    series['count'] = i + n
+
+
+def acquire_on(experiment, name, raman_dir, n_frames=1, export_csv=True,
+               timeout=120, wavelength=None, on_start=None):
+    """Acquire a series of n_frames frames with a LightField experiment,
+    storing each frame as soon as it arrives. This runs in the LightField
+    host process. Returns the series, or None if the timeout elapsed."""
+    # pass location of saved file
+    save_file(name, experiment)
+    experiment.SetValue(ExperimentSettings.OnlineExportEnabled, export_csv)
+    if export_csv:
+        experiment.SetValue(
+                ExperimentSettings.OnlineExportOutputOptionsCustomDirectory,
+                raman_dir)
+    # set number of frames acquired by each Acquire()
+    experiment.SetValue(
+            ExperimentSettings.FrameSettingsFramesToStore, n_frames)
+    exposure = experiment.GetValue(
+            CameraSettings.ShutterTimingExposureTime)/1e3
+    series = open_series(raman_dir, name, n_frames, wavelength)
+    # acquire image, storing each frame as soon as it arrives
+    if not wait_for_acquisition(
+            experiment, timeout=timeout+n_frames*exposure,
+            on_data=lambda data: store_frames(series, data),
+            on_start=on_start):
+        return None
+    if n_frames > 1:
+        series['frames'].flush()
+    series['directory'] = str(experiment.GetValue(
+            ExperimentSettings.FileNameGenerationDirectory))
+    return series
+
+
+def save_kinetics(lf, t0=None):
+    """Save the wavelength and the per-frame timestamps of the most
+    recent kinetics series next to its frames. Timestamps are saved in
+    seconds relative to t0, which is the start time of the triggered
+    pulse train, or the start of the acquisition if t0 is None."""
+    series = lf['kinetics']
+    if t0 is None:
+        t0 = series['start']
+    path = os.path.join(lf['raman_dir'], series['name']+'_kinetics_time.npz')
+    np.savez(path, wavelength=series['wl'],
+             time=series['time'][:series['count']] - t0, t0=t0)
+    lf['outbox'].append('Kinetics series of {} frames saved to:'.format(
+            series['count']))
+    lf['outbox'].append(series['path'])
+
+
+def acquire_raman(lf):
+    """Acquire Raman spectra using the LightField host process.
+    The spectrum is read from the acquired data straight into memory and
+    stored in lf['spectra']. Exporting a CSV file is optional. If more
+    than one frame is set, a kinetics series of frames is acquired with
+    a single Acquire() and kept in lf['kinetics']."""
+    lf['kinetics'] = None
+    lf['started'].clear()
+    try:
+        acquire_series(lf)
+    finally:
+        # never leave a sequence waiting for the acquisition to start
+        lf['started'].set()
+
+
+def acquire_series(lf):
+    """Acquire a series of frames using the LightField host process.
+    This is called by acquire_raman()."""
+    if lf['host'] is None:
+        lf['outbox'].append('LightField is not open.')
+        return
+    file_name = file_stamp()
+    lf['recent_file'] = file_name
+    state.update(lf['state'], recent_raman_file=file_name)
+    export_csv = lf['export_csv'].isChecked()
+    n_frames = lf['frames'].value()
+    result = host_request(
+            lf, 'acquire', name=file_name, raman_dir=lf['raman_dir'],
+            n_frames=n_frames, export_csv=export_csv, timeout=lf['timeout'])
+    if result is None:
+        return
+    if result['status'] == 'no_device':
         lf['outbox'].append('No LightField-compatible devices found.')
         lf['outbox'].append(
-                'Please load "Default_Python_Experiment" in Lightfield.')
-
+                'Please load "{}" in Lightfield.'.format(lf['experiment']))
+        return
+    if result['status'] == 'timeout':
+        lf['outbox'].append('Raman acquisition timed out.')
+        return
+    series = result['series']
+    if n_frames > 1:
+        # the host streamed the frames to disk
+        series['frames'] = np.load(series['path'], mmap_mode='r')
+        lf['kinetics'] = series
+    # sum the frames to get the spectrum
+    lf['spectra'][file_name] = {
+            'wl': series['wl'],
+            'int': series['frames'][:series['count']].sum(axis=0)}
+    if export_csv:
+        lf['file_list'].append(file_name+'.csv')
+        csv_path = os.path.join(lf['raman_dir'], file_name+'.csv')
+        if not wait_for_file(csv_path, timeout=lf['timeout']):
+            lf['outbox'].append('Raman CSV file was not found at:')
+            lf['outbox'].append(csv_path)
+            return
+    lf['outbox'].append('Raman data saved to:')
+    lf['outbox'].append(series['directory'])
 
 
 def plot_setup(labels=['X', 'Y'], fsize=14, setlimits=False,
@@ -131,6 +455,7 @@ def plot_setup(labels=['X', 'Y'], fsize=14, setlimits=False,
     This can be called with matplotlib for setting axes labels,
     titles, axes ranges, and the font size of plot labels.
     This should be called between plt.plot() and plt.show() commands."""
+    plt = lazy.pyplot()
     plt.xlabel(str(labels[0]), fontsize=fsize)
     plt.ylabel(str(labels[1]), fontsize=fsize)
     #fig = plt.gcf()
@@ -147,23 +472,30 @@ def plot_setup(labels=['X', 'Y'], fsize=14, setlimits=False,
 
 
 def stack_spectra(filelist):
-    """Get a 2D array of stacked spectra and metadata in a dictionary."""
+    """Get a 2D array of stacked spectra and metadata in a dictionary.
+    The spectra are read into a spectral cube, and spec_mat is a view of
+    the cube with one spectrum per column. Release it with close_stack
+    when done, so the file of a large cube is deleted."""
+    from matplotlib import cm
     d = {
         'colors': cm.jet(np.linspace(0, 1, len(filelist))),
         'labels': []}
-    # loop over each spectrum and stack it into 2D array
-    for fi, f in enumerate(filelist):
-        df = pd.read_csv(f)
-        d['labels'].append(os.path.split(f)[1].split('.csv')[0])
-        # stack spectra together in a single matrix
-        if fi == 0:
-            d['spec_mat'] = np.array(df['Intensity'])
-        else:
-            d['spec_mat'] = np.column_stack((d['spec_mat'], df['Intensity']))
-        d['wavelength'] = np.array(df['Wavelength'])
+    c = cube.from_csv_files(filelist)
+    if c is not None:
+        d.update({'cube': c, 'labels': c['labels'],
+                  'wavelength': c['wavelength'],
+                  'spec_mat': cube.spectra(c).T})
     return d
 
 
+def close_stack(d):
+    """Close the spectral cube of stacked spectra. spec_mat is removed
+    first, because a mapped file cannot be deleted on Windows."""
+    d.pop('spec_mat', None)
+    if d.get('cube') is not None:
+        cube.close(d['cube'])
+
+
 def plot_raman_files_from_selection(lf):
     """Plot Raman data from files selected using a user dialog."""
     qfd = QFileDialog()
@@ -176,6 +508,16 @@ def plot_raman_files_from_selection(lf):
     
     # get array of spectral information
     d = stack_spectra(filenames)
+    try:
+        plot_stack(d, lf)
+    finally:
+        close_stack(d)
+
+
+def plot_stack(d, lf):
+    """Plot stacked Raman spectra as lines and as a heatmap. The plots
+    get copies of the spectra, so the cube can be closed afterwards."""
+    plt = lazy.pyplot()
 
     # plot Raman spectra as lines
     if len(list(d['labels'])) == 0:
@@ -184,7 +526,7 @@ def plot_raman_files_from_selection(lf):
         plt.ion()
         fig = plt.figure(1)
         fig.clf()
-        plt.plot(d['wavelength'], d['spec_mat'], lw=1)
+        plt.plot(d['wavelength'], np.array(d['spec_mat']), lw=1)
         plot_setup(
             labels=('Wavelength (nm)', 'Intensity (counts)'),
             legend=False)
@@ -196,7 +538,7 @@ def plot_raman_files_from_selection(lf):
         fig.clf()
         for i in range(np.shape(d['spec_mat'])[1]):
             plt.plot(
-                d['wavelength'], d['spec_mat'][:, i],
+                d['wavelength'], np.array(d['spec_mat'][:, i]),
                 label=d['labels'][i], c=d['colors'][i], lw=1)
 
         plot_setup(labels=('Wavelength (nm)', 'Intensity (counts)'),
@@ -212,7 +554,7 @@ def plot_raman_files_from_selection(lf):
             np.min(d['wavelength']),
             np.max(d['wavelength'])]
         plt.imshow(
-            d['spec_mat'],
+            np.array(d['spec_mat']),
             aspect='auto',
             origin='lower',
             cmap='jet',    extent=plot_extent,
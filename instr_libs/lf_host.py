@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+
+Long-lived host process for Princeton Instruments LightField.
+
+The host owns the LightField Automation object and keeps the experiment
+loaded, so LightField does not have to be cold-started and the
+experiment reloaded by hand each time the application starts. The
+application attaches to the host over a local connection (see
+lf.launch_lf) and sends it commands. The host keeps running after the
+application quits, so the next application start reattaches in seconds.
+Connections are authenticated with a random key which is created on
+first use and stored in the user profile (see KEY_PATH), so only
+processes of the same user can send commands to the host. Run with
+--standin to host the pure Python LightField stand-in for testing
+without LightField.
+
+Usage:
+    python -m instr_libs.lf_host [--port 6021] [--experiment NAME] [--standin]
+
+Created on Mon Oct 19 13:18:50 2026
+"""
+
+import os
+import time
+import argparse
+import traceback
+from multiprocessing.connection import Listener
+from instr_libs import lf
+
+
+# file in the user profile which holds the key that authenticates
+# connections to the host
+KEY_PATH = os.path.join(os.path.expanduser('~'), '.laser_triggering',
+                        'lf_host.key')
+
+# number of random bytes in the key
+KEY_BYTES = 32
+
+# default port of the host on localhost
+PORT = 6021
+
+
+def get_authkey(path=KEY_PATH):
+    """Get the key which authenticates connections to the host. A random
+    key is created the first time, readable only by the current user."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    # the key already exists, or was just created by the other process
+    except FileExistsError:
+        for _ in range(50):
+            with open(path, 'rb') as f:
+                key = f.read()
+            if len(key) == KEY_BYTES:
+                return key
+            time.sleep(0.02)
+        raise OSError('Invalid LightField host key: {}'.format(path))
+    key = os.urandom(KEY_BYTES)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(key)
+    return key
+
+
+def open_lightfield(standin, experiment_name):
+    """Open LightField and load the experiment. Returns the state of the
+    host, which holds the Automation object and the experiment."""
+    lf.load_lightfield(standin=standin)
+    if not standin:
+        # kill a LightField left behind by a previous host
+        lf.kill_lightfield(wait=True)
+    # create a C# compatible List of type String object
+    args = lf.List[lf.String]()
+    # add the command line option for an empty experiment
+    args.Add("/empty")
+    # create the LightField Application (true for visible)
+    app = lf.Automation(True, lf.List[lf.String](args))
+    experiment = app.LightFieldApplication.Experiment
+    if experiment_name:
+        experiment.Load(experiment_name)
+    return {'app': app, 'experiment': experiment,
+            'experiment_name': experiment_name, 'wavelength': None}
+
+
+def acquire(state, conn, **kwargs):
+    """Run an acquisition for the application. The frames of kinetics
+    series are in a .npy file, so only their path is sent back."""
+    experiment = state['experiment']
+    if not lf.device_found(experiment):
+        return {'status': 'no_device'}
+    series = lf.acquire_on(
+            experiment, wavelength=lf.get_wavelength(state, experiment),
+            on_start=lambda: conn.send(('started', None)), **kwargs)
+    if series is None:
+        return {'status': 'timeout'}
+    if series['path'] is not None:
+        series['frames'] = None
+    return {'status': 'ok', 'series': series}
+
+
+def handle(state, conn, cmd, kwargs):
+    """Run one command from the application and get its reply."""
+    if cmd == 'ping':
+        return {'experiment': state['experiment_name'],
+                'device': bool(lf.device_found(state['experiment']))}
+    if cmd == 'acquire':
+        return acquire(state, conn, **kwargs)
+    raise ValueError('Unknown command: {}'.format(cmd))
+
+
+def serve(port=PORT, experiment_name='Default_Python_Experiment',
+          standin=False):
+    """Open LightField and serve commands from one application at a time
+    until a shutdown command is received."""
+    state = open_lightfield(standin, experiment_name)
+    with Listener(('localhost', port), authkey=get_authkey()) as listener:
+        while True:
+            conn = listener.accept()
+            try:
+                while True:
+                    cmd, kwargs = conn.recv()
+                    if cmd == 'shutdown':
+                        conn.send(('done', None))
+                        state['app'].Dispose()
+                        return
+                    try:
+                        conn.send(('done', handle(state, conn, cmd, kwargs)))
+                    except Exception:
+                        conn.send(('error', traceback.format_exc(limit=3)))
+            # the application quit or was closed, so wait for the next one
+            except (EOFError, OSError):
+                pass
+            finally:
+                conn.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='LightField host process.')
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--experiment', default='Default_Python_Experiment')
+    parser.add_argument('--standin', action='store_true',
+                        help='host the LightField stand-in for testing')
+    args = parser.parse_args()
+    serve(port=args.port, experiment_name=args.experiment,
+          standin=args.standin)
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+
+Pure Python stand-in for the Princeton Instruments LightField
+Automation object. It mimics the small part of the LightField API which
+is used by lf.py, so the LightField wrapper can be run and tested
+without LightField or .NET, e.g. on Linux. Use it by calling
+lf.load_lightfield(standin=True) before launching LightField.
+
+Acquisitions produce a synthetic Raman spectrum with a few peaks on a
+noisy background, and run asynchronously like the real Acquire().
+
+Created on Mon Oct 19 14:15:31 2026
+"""
+
+import os
+import time
+import tempfile
+import threading
+import numpy as np
+
+
+class _Names:
+    """Namespace whose attributes evaluate to their own names. This
+    stands in for LightField setting and device type enumerations."""
+    def __getattr__(self, name):
+        return name
+
+
+ExperimentSettings = _Names()
+CameraSettings = _Names()
+DeviceType = _Names()
+
+
+class String(str):
+    """Stand-in for System.String."""
+
+
+class List(list):
+    """Stand-in for System.Collections.Generic.List. List[String]
+    returns the list class itself."""
+    def __class_getitem__(cls, item):
+        return cls
+
+    def Add(self, item):
+        self.append(item)
+
+
+class Event:
+    """Stand-in for a .NET event which supports += and -= handlers."""
+    def __init__(self):
+        self.handlers = []
+
+    def __iadd__(self, handler):
+        self.handlers.append(handler)
+        return self
+
+    def __isub__(self, handler):
+        self.handlers.remove(handler)
+        return self
+
+    def fire(self, sender, args):
+        for handler in list(self.handlers):
+            handler(sender, args)
+
+
+class EventArgs:
+    """Stand-in for LightField event arguments."""
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class ImageData:
+    """Stand-in for the IImageData of a single frame."""
+    def __init__(self, data):
+        self.data = data
+        self.Height, self.Width = data.shape
+
+    def GetData(self):
+        return self.data.ravel()
+
+
+class ImageDataSet:
+    """Stand-in for the IImageDataSet of an acquisition with one region
+    of interest."""
+    def __init__(self, frames):
+        self.frames = frames
+        self.Frames = len(frames)
+
+    def GetFrame(self, region, frame):
+        return ImageData(self.frames[frame])
+
+    def Dispose(self):
+        pass
+
+
+class Device:
+    """Stand-in for a LightField experiment device."""
+    def __init__(self, device_type):
+        self.Type = device_type
+
+
+class Experiment:
+    """Stand-in for the LightField experiment, with a simulated camera
+    which has a single binned row of pixels."""
+    def __init__(self, n_pixels=1024, exposure_ms=100):
+        self.ExperimentDevices = [Device(DeviceType.Camera)]
+        self.SystemColumnCalibration = np.linspace(487.156, 611.2, n_pixels)
+        self.ImageDataSetReceived = Event()
+        self.ExperimentCompleted = Event()
+        self.IsRunning = False
+        directory = tempfile.mkdtemp()
+        self.settings = {
+            ExperimentSettings.FileNameGenerationDirectory: directory,
+            ExperimentSettings.FileNameGenerationBaseFileName: 'spectrum',
+            ExperimentSettings.OnlineExportEnabled: True,
+            ExperimentSettings.OnlineExportOutputOptionsCustomDirectory:
+                directory,
+            ExperimentSettings.FrameSettingsFramesToStore: 1,
+            CameraSettings.ShutterTimingExposureTime: exposure_ms}
+
+    def Load(self, name):
+        """Load a saved experiment by name."""
+        self.Name = name
+        return True
+
+    def GetValue(self, setting):
+        return self.settings.get(setting)
+
+    def SetValue(self, setting, value):
+        self.settings[setting] = value
+
+    def spectrum(self):
+        """Get a synthetic Raman spectrum as a (1, n_pixels) frame."""
+        wl = self.SystemColumnCalibration
+        peaks = sum(a*np.exp(-((wl-c)/w)**2) for a, c, w in
+                    [(900, 520.5, 0.8), (300, 545.0, 2.0), (150, 580.0, 4.0)])
+        noise = np.random.poisson(10, size=len(wl))
+        return (peaks + noise).astype(np.uint16).reshape(1, -1)
+
+    def export_csv(self, frames):
+        """Write frames in the LightField CSV export format."""
+        directory = self.GetValue(
+                ExperimentSettings.OnlineExportOutputOptionsCustomDirectory)
+        name = self.GetValue(ExperimentSettings.FileNameGenerationBaseFileName)
+        wl = self.SystemColumnCalibration
+        lines = ['ROI,Frame,Wavelength,Row,Column,Intensity,'
+                 'Exposure started time stamp,Exposure ended time stamp']
+        for fi, frame in enumerate(frames):
+            for ci, intensity in enumerate(frame[0]):
+                lines.append('1,{},{},0,{},{},N/A,N/A'.format(
+                        fi+1, wl[ci], ci, intensity))
+        path = os.path.join(directory, name+'.csv')
+        with open(path+'.tmp', 'w') as f:
+            f.write('\n'.join(lines)+'\n')
+        os.replace(path+'.tmp', path)
+
+    def run(self):
+        """Simulate an acquisition of the configured number of frames."""
+        exposure = self.GetValue(CameraSettings.ShutterTimingExposureTime)
+        n_frames = int(self.GetValue(
+                ExperimentSettings.FrameSettingsFramesToStore))
+        frames = []
+        for _ in range(n_frames):
+            time.sleep(exposure/1e3)
+            frame = self.spectrum()
+            frames.append(frame)
+            self.ImageDataSetReceived.fire(
+                    self, EventArgs(ImageDataSet=ImageDataSet([frame])))
+        if self.GetValue(ExperimentSettings.OnlineExportEnabled):
+            self.export_csv(frames)
+        self.IsRunning = False
+        self.ExperimentCompleted.fire(self, EventArgs())
+
+    def Acquire(self):
+        """Start an acquisition in the background, like LightField."""
+        self.IsRunning = True
+        threading.Thread(target=self.run, daemon=True).start()
+
+
+class Application:
+    """Stand-in for the LightField application object."""
+    def __init__(self):
+        self.Experiment = Experiment()
+
+
+class Automation:
+    """Stand-in for the LightField Automation object."""
+    def __init__(self, visible, args):
+        self.LightFieldApplication = Application()
+
+    def Dispose(self):
+        pass
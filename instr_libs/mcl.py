@@ -21,6 +21,7 @@ import time
 import serial
 import numpy as np
 from serial.tools import list_ports
+from instr_libs import state
 
 
 
@@ -53,11 +54,11 @@ def stage_on(mcl):
             clear_stage_buffer(dev)
             mcl['outbox'].append('Stage status: {}'.format(get_status(dev)))
             x, y = get_x_pos(mcl['dev']), get_y_pos(mcl['dev'])
-            mcl['show_x'].setText(str(x))
-            mcl['show_y'].setText(str(y))
+            state.update(mcl['state'], x_position_cm=x, y_position_cm=y)
             mcl['set_x'].setValue(float(x))
             mcl['set_y'].setValue(float(y))
-            set_now(mcl)
+            if mcl.get('move_on_connect', True):
+                set_now(mcl)
             enable_stage(mcl, True)
             mcl['outbox'].append('Marzhauser MCL-3 stage connected.')
         except:
@@ -74,6 +75,7 @@ def stage_on(mcl):
             mcl['dev'].close()
         except AttributeError:
             pass
+        state.update(mcl['state'], x_position_cm=None, y_position_cm=None)
         mcl['outbox'].append('Stage closed.')
         enable_stage(mcl, False)
         mcl['on'].setChecked(False)
@@ -113,8 +115,8 @@ def set_now(mcl):
             current_y = get_y_pos(mcl['dev'])
             time.sleep(1)
     mcl['outbox'].append('Stage at {}'.format((current_x, current_y)))
-    mcl['show_x'].setText(str(current_x))
-    mcl['show_y'].setText(str(current_y))
+    state.update(mcl['state'], x_position_cm=current_x,
+                 y_position_cm=current_y)
     mcl['set_now'].setEnabled(True)
     mcl['busy'] = False
 
@@ -7,17 +7,21 @@ Created on Mon Feb 17 16:27:52 2020
 @author: ericmuckley@gmail.com
 """
 
-import visa
+import os
+import struct
+import zipfile
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
 import time
+import re
+import datetime
+import csv
+from instr_libs import lazy
 
 
 
 def enable_mso(mso, enabled):
     """Enable/disable GUI objects realted to the oscilloscope."""
-    items = ['acquire',  'downsample', 'export']
+    items = ['acquire', 'export', 'channels', 'frames', 'seq']
     [mso[i].setEnabled(enabled) for i in items]
     mso['address'].setEnabled(not enabled)
 
@@ -26,6 +30,7 @@ def mso_on(mso):
     "Run this function when MSO64 oscilloscope checkbox is checked."""
     if mso['on'].isChecked():
         try:
+            visa = lazy.load('visa', mso['outbox'])
             rm = visa.ResourceManager()
             dev = rm.open_resource(mso['address'].text())
             mso['dev'] = dev
@@ -45,64 +50,512 @@ def mso_on(mso):
         mso['dev'] = None
         mso['outbox'].append('Oscilloscope closed.')
         mso['on'].setChecked(False)
+        mso['seq'].setChecked(False)
         enable_mso(mso, True)
 
 
 
 
-def get_scope_timescale(mso, signal, downsample=10):
+def get_preamble(dev):
+    """Get the waveform preamble which is used to scale raw samples
+    from the oscilloscope into volts and seconds."""
+    preamble = {
+        'ymult': float(dev.query(':WFMOutpre:YMUlt?')),
+        'yoff': float(dev.query(':WFMOutpre:YOFf?')),
+        'yzero': float(dev.query(':WFMOutpre:YZEro?')),
+        'xincr': float(dev.query(':WFMOutpre:XINcr?')),
+        'xzero': float(dev.query(':WFMOutpre:XZEro?')),
+        'byt_nr': int(dev.query(':WFMOutpre:BYT_Nr?'))}
+    return preamble
+
+
+def setup_binary_transfer(dev, source='CH1', start=1, stop=None, byt_nr=2):
+    """Configure the scope to send signed little-endian binary samples
+    (RIBinary) so they can be decoded without parsing any text."""
+    if stop is None:
+        stop = int(float(dev.query(':HORizontal:RECOrdlength?')))
+    dev.write(':HEADer 0')
+    dev.write(':DATa:SOUrce '+source)
+    dev.write(':DATa:ENCdg SRIBinary')
+    dev.write(':WFMOutpre:BYT_Nr '+str(byt_nr))
+    dev.write(':DATa:STARt '+str(start))
+    dev.write(':DATa:STOP '+str(stop))
+    return stop
+
+
+def read_block(dev):
+    """Read an IEEE 488.2 definite-length binary block (#<n><len><data>)
+    from the device and return the data bytes."""
+    header = dev.read_bytes(2)
+    ndigits = int(header[1:2])
+    nbytes = int(dev.read_bytes(ndigits))
+    data = dev.read_bytes(nbytes)
+    # discard the termination character which follows the block
+    dev.read_bytes(1)
+    return data
+
+
+def decode_curve(data, preamble):
+    """Decode raw binary curve data into a numpy array of raw integer
+    samples. This is a zero-copy view of the data buffer."""
+    dtype = np.int8 if preamble['byt_nr'] == 1 else np.dtype('<i2')
+    return np.frombuffer(data, dtype=dtype)
+
+
+def to_volts(raw, preamble):
+    """Scale raw integer samples to volts using the waveform preamble."""
+    return (raw - preamble['yoff']) * preamble['ymult'] + preamble['yzero']
+
+
+def get_scope_timescale(preamble, n_samples, downsample=1):
     """Get the time-scale associated with the scope signal."""
-    # get time-scale increment
-    dt = float(mso['dev'].query('WFMOutpre:XINcr?'))
-    # calculate the actual values of the x-scale
-    t_scale = np.linspace(0, len(signal)*downsample*dt,
-                          num=int(len(signal)))
+    t_scale = preamble['xzero'] + preamble['xincr'] * downsample * np.arange(
+            n_samples)
     return t_scale
 
 
+def allocate_record(shape, dtype, path=None):
+    """Preallocate an array to hold raw scope samples. If a path is
+    given, the array is an on-disk numpy memmap instead of being held
+    in RAM."""
+    if path is None:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='w+', shape=shape)
+
+
+def read_channels(dev, sources=('CH1',), byt_nr=2, chunk_size=2500000,
+                  path=None, progress=None, cancel=None):
+    """Read full records from one or more channels using chunked
+    DATa:STARt/STOP windows. Each chunk is decoded straight into a single
+    preallocated (n_sources, n_samples) array of raw integer samples, so
+    peak memory stays close to the size of the final record.
+    progress(n_done, n_total) is called after each chunk, and the
+    transfer stops early and returns None if cancel() returns True."""
+    n_samples = int(float(dev.query(':HORizontal:RECOrdlength?')))
+    dtype = np.int8 if byt_nr == 1 else np.dtype('<i2')
+    out = allocate_record((len(sources), n_samples), dtype, path=path)
+    preambles = []
+    n_total = len(sources) * n_samples
+    for si, source in enumerate(sources):
+        setup_binary_transfer(dev, source=source, stop=n_samples,
+                              byt_nr=byt_nr)
+        preamble = get_preamble(dev)
+        preambles.append(preamble)
+        for start in range(0, n_samples, chunk_size):
+            if cancel is not None and cancel():
+                return None, preambles
+            stop = min(start+chunk_size, n_samples)
+            dev.write(':DATa:STARt '+str(start+1))
+            dev.write(':DATa:STOP '+str(stop))
+            dev.write(':CURVe?')
+            out[si, start:stop] = decode_curve(read_block(dev), preamble)
+            if progress is not None:
+                progress(si*n_samples + stop, n_total)
+    return out, preambles
+
+
+def read_curve(dev, source='CH1', byt_nr=2):
+    """Read a full waveform record from a channel using binary transfer.
+    Returns raw integer samples and the preamble used to scale them."""
+    out, preambles = read_channels(dev, sources=(source,), byt_nr=byt_nr)
+    return out[0], preambles[0]
+
+
+def get_sources(mso):
+    """Get the list of channels to acquire from the GUI, e.g. 'CH1, CH2'."""
+    sources = mso['channels'].text().upper().replace(' ', '').split(',')
+    return tuple(src for src in sources if src)
+
+
+def wait_for_acquisition(dev, timeout=60, cancel=None):
+    """Wait until a single-sequence acquisition has finished. Returns
+    False if the timeout elapsed or cancel() returned True first."""
+    start = time.time()
+    while int(float(dev.query(':ACQuire:STATE?'))) != 0:
+        if cancel is not None and cancel():
+            return False
+        if time.time() - start > timeout:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+# month names in FastFrame timestamps
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep',
+          'Oct', 'Nov', 'Dec']
+
+
+def arm_fastframe(dev, n_frames):
+    """Arm a single FastFrame segmented acquisition of n_frames frames.
+    One frame is captured per trigger event."""
+    dev.write(':HORizontal:FASTframe:STATE 1')
+    dev.write(':HORizontal:FASTframe:COUNt '+str(n_frames))
+    dev.write(':ACQuire:STOPAfter SEQuence')
+    dev.write(':ACQuire:STATE 1')
+
+
+def disarm_fastframe(dev):
+    """Turn off FastFrame mode and return the scope to free-running."""
+    dev.write(':HORizontal:FASTframe:STATE 0')
+    dev.write(':ACQuire:STOPAfter RUNSTop')
+    dev.write(':ACQuire:STATE 1')
+
+
+def parse_frame_times(response):
+    """Convert FastFrame timestamps such as '17 Feb 2020 16:27:52.1234'
+    into seconds relative to the first frame. The date is included, so
+    frames on both sides of midnight are in order. Timestamps without a
+    date are unwrapped by a day where they go backwards."""
+    times, dates = [], []
+    for day, month, year, h, m, sec in re.findall(
+            r'(?:(\d+) ([A-Za-z]{3}) (\d{4}) )?(\d+):(\d+):(\d+\.?\d*)',
+            response):
+        times.append(int(h)*3600 + int(m)*60 + float(sec))
+        if day:
+            dates.append(datetime.date(
+                    int(year), MONTHS.index(month.title())+1,
+                    int(day)).toordinal())
+    times = np.array(times)
+    if not len(times):
+        return times
+    # days since the first frame, counted relative to it to keep precision
+    if len(dates) == len(times):
+        days = np.array(dates) - dates[0]
+    else:
+        days = np.concatenate(([0], np.cumsum(np.diff(times) < 0)))
+    times = times + 86400*days
+    return times - times[0]
+
+
+def read_fastframe(dev, source='CH1', n_frames=None, byt_nr=2):
+    """Read all frames of a finished FastFrame acquisition from one
+    channel in a single binary transfer. Returns the raw samples as an
+    (n_frames, n_samples) array, the preamble, and the per-frame
+    timestamps in seconds relative to the first frame."""
+    if n_frames is None:
+        n_frames = int(float(dev.query(':HORizontal:FASTframe:COUNt?')))
+    n_samples = int(float(dev.query(':HORizontal:RECOrdlength?')))
+    setup_binary_transfer(dev, source=source, stop=n_samples, byt_nr=byt_nr)
+    dev.write(':DATa:FRAMESTARt 1')
+    dev.write(':DATa:FRAMESTOP '+str(n_frames))
+    preamble = get_preamble(dev)
+    dev.write(':CURVe?')
+    frames = decode_curve(read_block(dev), preamble).reshape(
+            n_frames, n_samples)
+    times = parse_frame_times(dev.query(
+            ':HORizontal:FASTframe:TIMEStamp:ALL:{}? 1,{}'.format(
+                    source, n_frames)))
+    return frames, preamble, times
+
+
+def read_fastframe_channels(dev, sources=('CH1',), n_frames=None, byt_nr=2):
+    """Read FastFrame acquisitions from several channels. Returns an
+    (n_sources, n_frames, n_samples) array, a list of preambles, and
+    the per-frame timestamps."""
+    frames, preambles = [], []
+    for source in sources:
+        f, preamble, times = read_fastframe(
+                dev, source=source, n_frames=n_frames, byt_nr=byt_nr)
+        frames.append(f)
+        preambles.append(preamble)
+    return np.stack(frames), preambles, times
+
+
+def envelope(signal, n_bins):
+    """Reduce a signal to n_bins min/max (peak-detect) pairs for display.
+    Unlike plain decimation this keeps short spikes visible. Returns the
+    index of the center of each bin and the interleaved min/max values,
+    both of length 2*n_bins, so the result can be plotted as a line. A
+    2D signal of FastFrame frames is reduced over all of its frames, so
+    the envelope covers every frame."""
+    signal = np.asarray(signal)
+    if signal.ndim > 1:
+        lo, hi = signal.min(axis=0), signal.max(axis=0)
+    else:
+        lo = hi = signal
+    n = len(lo)
+    if n <= 2*n_bins:
+        if signal.ndim == 1:
+            return np.arange(n), signal
+        return np.repeat(np.arange(n), 2), np.column_stack((lo, hi)).ravel()
+    edges = np.linspace(0, n, n_bins+1).astype(int)
+    mins = np.minimum.reduceat(lo, edges[:-1])
+    maxs = np.maximum.reduceat(hi, edges[:-1])
+    centers = (edges[:-1] + edges[1:]) // 2
+    return np.repeat(centers, 2), np.column_stack((mins, maxs)).ravel()
+
+
 def acquire(mso):
-    """Acquire and plot signal on oscilloscope."""
-    mso['dev'].write(':DATA:SOURCE CH1')
-    mso['dev'].write(':DATa:START 1')
-    mso['dev'].write(':DATa:STOP 12500000')
-    mso['dev'].write(':WFMOutpre:ENCDG ASCII')
-    mso['dev'].write(':WFMOOutpre:BYT_NR 1')
-    downsample = mso['downsample'].value()
-    # get signal from scope
-    signal_raw = np.array(mso['dev'].query(':CURVE?').split(','))
-    signal = signal_raw.astype(float)[::downsample]
-    # get timescale associated with scope trace        
-    timescale = get_scope_timescale(mso, signal, downsample=downsample)
-    # plot scope trace
+    """Acquire signal on oscilloscope from each selected channel. If the
+    number of FastFrame frames is set, a segmented acquisition with one
+    frame per trigger is armed and read instead of a single record. The
+    full-resolution raw samples are kept for export and analysis. The
+    scope is marked busy until the acquisition ends, even if it fails."""
+    mso['busy'] = True
+    try:
+        sources = get_sources(mso)
+        n_frames = mso['frames'].value()
+
+        def progress(n_done, n_total):
+            mso['outbox'].append(
+                    'Transferring trace: {}%'.format(int(100*n_done/n_total)))
+
+        # get signal from scope
+        frame_times = None
+        if n_frames > 0:
+            mso['outbox'].append(
+                    'Waiting for {} FastFrame triggers...'.format(n_frames))
+            arm_fastframe(mso['dev'], n_frames)
+            try:
+                if wait_for_acquisition(mso['dev'],
+                                        cancel=lambda: mso['cancel']):
+                    raw, preambles, frame_times = read_fastframe_channels(
+                            mso['dev'], sources=sources, n_frames=n_frames)
+                else:
+                    raw = None
+            finally:
+                disarm_fastframe(mso['dev'])
+        else:
+            raw, preambles = read_channels(
+                    mso['dev'], sources=sources, progress=progress,
+                    cancel=lambda: mso['cancel'])
+    finally:
+        mso['acquire'].setText('Acquire')
+        mso['cancel'] = False
+        mso['busy'] = False
+    if raw is None:
+        mso['outbox'].append('Oscilloscope acquisition cancelled.')
+        return
+    mso['outbox'].append('Oscilloscope trace acquired.')
+    mso['last_raw'] = raw
+    mso['last_preambles'] = preambles
+    mso['last_sources'] = sources
+    mso['last_frame_times'] = frame_times
+    mso['last_sig_ts'] = time.strftime('%Y-%m-%d_%H-%M-%S')
+    mso['export'].setEnabled(True)
+
+
+def iter_traces(mso):
+    """Iterate over (channel, raw samples, preamble) for every channel of
+    the most recent acquisition. The samples of a FastFrame acquisition
+    have one row per frame."""
+    for si, source in enumerate(mso['last_sources']):
+        yield source, mso['last_raw'][si], mso['last_preambles'][si]
+
+
+def plot_trace(mso):
+    """Plot the min/max envelope of the most recent oscilloscope traces,
+    reduced to one bin per horizontal pixel of the figure. The frames of
+    a FastFrame acquisition are drawn as one envelope per channel. This
+    should be called from the main GUI thread."""
+    if mso['last_raw'] is None:
+        return
+    plt = lazy.pyplot()
     plt.ion()
     fig = plt.figure(1)
     fig.clf()
-    plt.plot(timescale, signal, lw=1)
-    plot_setup(labels=('Time (s)', 'Signal'), legend=False)
+    n_bins = int(fig.get_size_inches()[0] * fig.dpi)
+    for label, raw, preamble in iter_traces(mso):
+        idx, env = envelope(raw, n_bins)
+        plt.plot(preamble['xzero'] + preamble['xincr']*idx,
+                 to_volts(env, preamble), lw=1, label=label)
+    plot_setup(labels=('Time (s)', 'Signal (V)'),
+               legend=len(mso['last_sources']) > 1)
     fig.canvas.set_window_title('Oscilloscope trace')
     plt.draw()
-    mso['outbox'].append('Oscilloscope trace acquired.')
-    mso['last_sig'] = np.column_stack((timescale, signal))
-    mso['last_sig_ts'] = time.strftime('%Y-%m-%d_%H-%M-%S')
-    mso['export'].setEnabled(True)
+
+
+PREAMBLE_KEYS = ('ymult', 'yoff', 'yzero', 'xincr', 'xzero', 'byt_nr')
+
+
+def save_scope_npz(path, raw, preambles, sources, timestamp,
+                   frame_times=None, compress=False):
+    """Save raw integer scope samples with their scaling preamble,
+    channel names, and acquisition timestamp to a numpy .npz file.
+    The time axis is not stored since it is xzero + xincr * i. Leave
+    compress=False to be able to memory-map the samples when loading."""
+    d = {'raw': raw,
+         'sources': np.array(sources),
+         'timestamp': np.array(timestamp)}
+    for key in PREAMBLE_KEYS:
+        d['preamble_'+key] = np.array([p[key] for p in preambles])
+    if frame_times is not None:
+        d['frame_times'] = np.asarray(frame_times)
+    if compress:
+        np.savez_compressed(path, **d)
+    else:
+        np.savez(path, **d)
+
+
+def memmap_npz_member(path, name):
+    """Memory-map an uncompressed array stored inside a .npz file. The
+    data of an uncompressed zip member is contiguous in the file, so it
+    can be mapped directly without extracting it."""
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo(name+'.npy')
+    if info.compress_type != zipfile.ZIP_STORED:
+        with np.load(path) as npz:
+            return npz[name]
+    with open(path, 'rb') as f:
+        # skip the local zip file header which precedes the member data
+        f.seek(info.header_offset + 26)
+        name_len, extra_len = struct.unpack('<HH', f.read(4))
+        f.seek(info.header_offset + 30 + name_len + extra_len)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            header = np.lib.format.read_array_header_1_0(f)
+        else:
+            header = np.lib.format.read_array_header_2_0(f)
+        shape, fortran_order, dtype = header
+        offset = f.tell()
+    return np.memmap(path, dtype=dtype, mode='r', shape=shape,
+                     offset=offset, order='F' if fortran_order else 'C')
+
+
+def load_scope_npz(path, mmap=True):
+    """Load a scope trace saved with save_scope_npz into a dictionary.
+    If mmap is True the raw samples are memory-mapped from the file."""
+    with np.load(path) as npz:
+        d = {key: npz[key] for key in npz.files if key != 'raw'}
+        if not mmap:
+            d['raw'] = npz['raw']
+    if mmap:
+        d['raw'] = memmap_npz_member(path, 'raw')
+    d['sources'] = [str(src) for src in d['sources']]
+    d['timestamp'] = str(d['timestamp'])
+    preamble_arrays = {key: d.pop('preamble_'+key) for key in PREAMBLE_KEYS}
+    d['preambles'] = [
+            {key: preamble_arrays[key][i].item() for key in PREAMBLE_KEYS}
+            for i in range(len(d['sources']))]
+    return d
 
 
 def export_scope_trace(mso):
-    """Export most recent oscilloscope trace to file."""
-    df = pd.DataFrame(data=mso['last_sig'],
-                      columns=['time', 'signal'])
-    path = mso['logdir']+'\\'+mso['last_sig_ts']+'__scope_trace.csv'
-    df.to_csv(path, index=False)
-    mso['outbox'].append('Oscilloscope trace exported.')
+    """Export most recent full-resolution oscilloscope traces to a
+    compact binary .npz file."""
+    path = os.path.join(mso['logdir'],
+                        mso['last_sig_ts']+'__scope_trace.npz')
+    save_scope_npz(path, mso['last_raw'], mso['last_preambles'],
+                   mso['last_sources'], mso['last_sig_ts'],
+                   frame_times=mso['last_frame_times'])
+    mso['outbox'].append('Oscilloscope trace exported to:')
+    mso['outbox'].append(path)
     
     
     
+def pulse_metrics(raw, preamble):
+    """Extract metrics of the laser pulses in a raw scope trace. Pulses
+    are counted as rising crossings of half the peak signal."""
+    signal = to_volts(np.asarray(raw).ravel(), preamble)
+    baseline = np.median(signal)
+    peak = np.max(signal)
+    above = signal > baseline + (peak-baseline)/2
+    n_pulses = int(np.count_nonzero(above[1:] & ~above[:-1]) + above[0])
+    return {'n_pulses': n_pulses,
+            'peak_v': float(peak),
+            'baseline_v': float(baseline),
+            'area_vs': float(np.sum(signal-baseline)*preamble['xincr'])}
+
+
+def seq_arm(mso):
+    """Arm the scope for a single acquisition before a pulse train is
+    triggered during an experimental sequence. This blocks until the
+    transfer of the previous step's capture has finished."""
+    # released by seq_capture when the transfer is complete, or by
+    # seq_disarm if the pulse train could not be triggered
+    mso['lock'].acquire()
+    try:
+        n_frames = mso['frames'].value()
+        if n_frames > 0:
+            arm_fastframe(mso['dev'], n_frames)
+        else:
+            mso['dev'].write(':ACQuire:STOPAfter SEQuence')
+            mso['dev'].write(':ACQuire:STATE 1')
+    except Exception:
+        mso['lock'].release()
+        raise
+
+
+def seq_restore(mso, n_frames):
+    """Return the scope to free-running after a sequence capture."""
+    if n_frames > 0:
+        disarm_fastframe(mso['dev'])
+    else:
+        mso['dev'].write(':ACQuire:STOPAfter RUNSTop')
+        mso['dev'].write(':ACQuire:STATE 1')
+
+
+def seq_disarm(mso):
+    """Cancel a capture which was armed with seq_arm, when the pulse
+    train could not be triggered."""
+    try:
+        seq_restore(mso, mso['frames'].value())
+    finally:
+        mso['lock'].release()
+
+
+def seq_capture(mso, step, timeout=60):
+    """Read the capture of a pulse train which was armed with seq_arm,
+    save the trace and its pulse metrics keyed to the sequence step.
+    This is meant to run in the background so that the transfer
+    overlaps with the next move of the sequence."""
+    try:
+        try:
+            sources = get_sources(mso)
+            n_frames = mso['frames'].value()
+            if not wait_for_acquisition(mso['dev'], timeout=timeout):
+                mso['outbox'].append(
+                        'Scope did not trigger during step {}.'.format(
+                                step+1))
+                return
+            frame_times = None
+            if n_frames > 0:
+                raw, preambles, frame_times = read_fastframe_channels(
+                        mso['dev'], sources=sources, n_frames=n_frames)
+            else:
+                raw, preambles = read_channels(mso['dev'], sources=sources)
+        finally:
+            # return the scope to free-running even if the transfer failed
+            seq_restore(mso, mso['frames'].value())
+        ts = time.strftime('%Y-%m-%d_%H-%M-%S')
+        path = os.path.join(mso['logdir'], '{}_step{}__scope_trace.npz'.format(
+                mso['starttime'], step))
+        save_scope_npz(path, raw, preambles, sources, ts,
+                       frame_times=frame_times)
+        # write pulse metrics of each channel to the run's metrics file
+        metrics_path = os.path.join(
+                mso['logdir'], mso['starttime']+'_scope_metrics.csv')
+        new_file = not os.path.exists(metrics_path)
+        with open(metrics_path, 'a', newline='') as f:
+            for si, source in enumerate(sources):
+                row = {'step': step, 'time': ts, 'channel': source,
+                       'trace_file': os.path.basename(path)}
+                row.update(pulse_metrics(raw[si], preambles[si]))
+                writer = csv.DictWriter(f, fieldnames=list(row.keys()))
+                if new_file:
+                    writer.writeheader()
+                    new_file = False
+                writer.writerow(row)
+                mso['seq_metrics'].append(row)
+        mso['outbox'].append(
+                'Scope trace for step {} saved.'.format(step+1))
+    finally:
+        mso['lock'].release()
+
+
+def seq_wait(mso):
+    """Wait until the last sequence capture has been transferred."""
+    with mso['lock']:
+        pass
+
+
 def plot_setup(labels=['X', 'Y'], fsize=20, setlimits=False,
                title=None, legend=True, limits=(0,1,0,1)):
     """Creates a custom plot configuration to make graphs look nice.
     This can be called with matplotlib for setting axes labels,
     titles, axes ranges, and the font size of plot labels.
     This should be called between plt.plot() and plt.show() commands."""
+    plt = lazy.pyplot()
     plt.xlabel(str(labels[0]), fontsize=fsize)
     plt.ylabel(str(labels[1]), fontsize=fsize)
     #fig = plt.gcf()
@@ -8,32 +8,28 @@ Created on Mon Feb 17 16:44:03 2020
 @author: ericmuckley@gmail.com
 """
 
+import csv
 import json
 import os
+import queue
+import sqlite3
+import hashlib
+import threading
+import importlib
 import numpy as np
 import time
-import visa
 import pandas as pd
 import inspect
-import thorlabs_apt as apt
 from serial.tools import list_ports
 from PyQt5.QtWidgets import QLabel, QComboBox, QLineEdit, QSlider, QFileDialog
 from PyQt5.QtWidgets import QSpinBox, QDoubleSpinBox, QCheckBox, QRadioButton
 from PyQt5.QtCore import QSettings
-import markdown
 import webbrowser
-import matplotlib.pyplot as plt
-from matplotlib import cm
-
-
-plt.rcParams['xtick.labelsize'] = 14
-plt.rcParams['ytick.labelsize'] = 14
-plt.rcParams['axes.linewidth'] = 3
-plt.rcParams['xtick.minor.width'] = 3
-plt.rcParams['xtick.major.width'] = 3
-plt.rcParams['ytick.minor.width'] = 3
-plt.rcParams['ytick.major.width'] = 3
-plt.rcParams['figure.autolayout'] = True
+from instr_libs import lazy
+from instr_libs import store
+from instr_libs import state
+from instr_libs import catalog
+from instr_libs.slink import pulse_stats as slink_stats
 
 
 def plot_setup(labels=['X', 'Y'], fsize=14, setlimits=False,
@@ -42,6 +38,7 @@ def plot_setup(labels=['X', 'Y'], fsize=14, setlimits=False,
     This can be called with matplotlib for setting axes labels,
     titles, axes ranges, and the font size of plot labels.
     This should be called between plt.plot() and plt.show() commands."""
+    plt = lazy.pyplot()
     plt.xlabel(str(labels[0]), fontsize=fsize)
     plt.ylabel(str(labels[1]), fontsize=fsize)
     #fig = plt.gcf()
@@ -57,6 +54,28 @@ def plot_setup(labels=['X', 'Y'], fsize=14, setlimits=False,
         plt.colorbar()
 
 
+def ui_hash(ui_path):
+    """Get a hash of the Qt Designer .ui file, which is stored in the
+    precompiled UI module to check whether it is up to date. Line endings
+    are normalized, so the hash is the same whether git checked the file
+    out with LF or CRLF line endings."""
+    with open(ui_path, 'rb') as f:
+        return hashlib.sha1(f.read().replace(b'\r\n', b'\n')).hexdigest()
+
+
+def load_ui(ui_path, module='ui_main'):
+    """Get the main window UI class. The UI module precompiled by
+    support_files/build_ui.py is used if it was built from the current
+    .ui file. Otherwise the .ui file is parsed with uic, which is slower."""
+    try:
+        ui_module = importlib.import_module(module)
+        if ui_module.UI_HASH == ui_hash(ui_path):
+            return ui_module.Ui_MainWindow
+    except (ImportError, AttributeError):
+        pass
+    from PyQt5 import uic
+    return uic.loadUiType(ui_path)[0]
+
 
 def show_help():
     """Show help popup window. First, generate the HTML using the markdown
@@ -67,11 +86,83 @@ def show_help():
     md_filename = os.path.join(os.getcwd(), 'README.md')
     #md_filename = os.path.join(parent_folder, 'README.md')
     html_filename = os.path.join(os.getcwd(), 'README.html')
+    import markdown
     markdown.markdownFromFile(input=md_filename, output=html_filename)                            
     # open help in web browser
     webbrowser.open(html_filename)
 
 
+def wait_for_file(path, timeout=10, interval=0.05):
+    """Wait until a file exists and its size has stopped changing, so it
+    is safe to read. Returns False if the timeout elapsed first."""
+    start = time.time()
+    size = -1
+    while time.time() - start < timeout:
+        if os.path.exists(path):
+            new_size = os.path.getsize(path)
+            if new_size > 0 and new_size == size:
+                return True
+            size = new_size
+        time.sleep(interval)
+    return False
+
+
+def watch_dirs(dirs, wake):
+    """Set the wake event whenever a file changes in one of the
+    directories. Returns the watchdog observer, or None if watchdog is
+    not installed, in which case files are polled."""
+    observers = lazy.load('watchdog.observers')
+    events = lazy.load('watchdog.events')
+    if observers is None or events is None:
+        return None
+
+    class Handler(events.FileSystemEventHandler):
+        def on_any_event(self, event):
+            wake.set()
+
+    observer = observers.Observer()
+    for d in dirs:
+        if os.path.isdir(d):
+            observer.schedule(Handler(), d)
+    observer.start()
+    return observer
+
+
+def wait_for_files(paths, on_ready, timeout=10, interval=0.05):
+    """Wait for several files at once, and call on_ready(path) as soon as
+    each file exists and its size has stopped changing. Directories are
+    watched for changes if watchdog is installed, otherwise they are
+    polled. Returns the paths which were not ready within the timeout."""
+    sizes = {p: -1 for p in paths}
+    wake = threading.Event()
+    observer = watch_dirs({os.path.dirname(p) or '.' for p in sizes}, wake)
+    start = time.time()
+    try:
+        while sizes:
+            for p in list(sizes):
+                size = os.path.getsize(p) if os.path.exists(p) else -1
+                if size > 0 and size == sizes[p]:
+                    del sizes[p]
+                    on_ready(p)
+                else:
+                    sizes[p] = size
+            remaining = timeout - (time.time()-start)
+            if not sizes or remaining <= 0:
+                break
+            # files which are being written are checked again shortly,
+            # otherwise wait for a change in the watched directories
+            if observer is None or any(s > 0 for s in sizes.values()):
+                wait = interval
+            else:
+                wait = 1
+            wake.wait(min(wait, remaining))
+            wake.clear()
+    finally:
+        if observer is not None:
+            observer.stop()
+    return list(sizes)
+
+
 def show_log_path(ops):
     """Show the path to the log file."""
     ops['outbox'].append('Log file path:')
@@ -82,7 +173,8 @@ def show_log_path(ops):
 def generate_report(ops, logpath=None):
     """Generate a report which links each Raman spectra with its metadata
     which is stored in the log file."""
-    
+    # write queued rows, which may be in the log file of this session
+    flush_log(ops)
     # prompt user to ask for log file 
     if logpath is None:
         logpath = QFileDialog.getOpenFileName(
@@ -98,76 +190,301 @@ def generate_report(ops, logpath=None):
             
     # use log file to match data with Raman spectra
     if log is not None:
-        ops['selected_logname'] = os.path.split(logpath)[1].split('.')[0]
-        # create dictionary to hold all results, metadata, and statistics
-        d = {'df': {}, 'log': log}
-        
-        max_int_list = np.full(len(log), np.nan)
-        max_int_wl_list = np.full(len(log), np.nan)
-        
-        # loop over each raman file and save to dictionary
-        for ri, r in enumerate(log['recent_raman_file']):
-            if not pd.isna(r):
-                filename = os.path.join(ops['raman_dir'], r+'.csv')
-                
-                # try to open the raman file when it is finished loading
-                df = None
-                while df is None:
-                    try:
-                        df = pd.read_csv(filename, usecols=['Wavelength',
-                                                            'Intensity'])
-                    except FileNotFoundError:
-                        time.sleep(1)
-                        df = None
-                # rename columns and add dataframe to dictionary
-                df.columns = ['wl', 'int']
-                d['df'][r] = df 
-                # calculate some statistics and add to dictionary
-                max_int_list[ri] = float(df['int'].max())
-                max_int_wl_list[ri] = float(df['wl'].iloc[df['int'].idxmax()])
-        d['log']['max_intensity'] = max_int_list
-        d['log']['max_intensity_wavelength'] = max_int_wl_list
-        
-        ops['report'] = d
-        # create json file summarizing results
-        report_filepath = serialize(ops)
-        ops['outbox'].append('Report generated:')
-        ops['outbox'].append(report_filepath)
+        build_report(ops, log, os.path.split(logpath)[1].split('.')[0])
+
+
+def generate_query_report(ops, where, params=()):
+    """Generate a report of the logged steps of all runs in the catalog
+    which match an SQL condition."""
+    flush_log(ops)
+    start = time.time()
+    try:
+        log = catalog.query(ops['catalog']['path'], where, params)
+    except (sqlite3.Error, pd.io.sql.DatabaseError) as e:
+        ops['outbox'].append('Catalog query failed: {}'.format(e))
+        return
+    ops['outbox'].append('Catalog query found {} steps in {:.0f} ms.'.format(
+            len(log), 1e3*(time.time()-start)))
+    build_report(ops, log, time.strftime('%Y-%m-%d_%H-%M-%S')+'_query')
+
+
+def read_report_spectrum(path):
+    """Read a Raman CSV file as a DataFrame of wavelength and intensity."""
+    df = pd.read_csv(path, usecols=['Wavelength', 'Intensity'])
+    df.columns = ['wl', 'int']
+    return df
+
+
+def build_report(ops, log, name):
+    """Match each logged step with its Raman spectrum and save the report.
+    Spectra are found at the path given by the catalog, or else in the
+    Raman directory. Spectra which are not written yet are waited for
+    all at once, and each is added as soon as its file is ready. Spectra
+    which were missing from an earlier report are not waited for again.
+    Spectra which are still missing are listed in the report."""
+    ops['selected_logname'] = name
+    # create dictionary to hold all results, metadata, and statistics
+    d = {'df': {}, 'log': log, 'missing': []}
+    paths = log.get('spectrum_path', pd.Series([None]*len(log)))
+    missing = ops.setdefault('missing_spectra', set())
     
+    # find the file of each raman spectrum which is not in memory
+    pending, late = {}, {}
+    for r, path in zip(log['recent_raman_file'], paths):
+        if pd.isna(r) or r in d['df']:
+            continue
+        # use the spectrum in memory if it was acquired this session
+        if r in ops['spectra']:
+            d['df'][r] = pd.DataFrame(ops['spectra'][r])
+            continue
+        filename = path if isinstance(path, str) else os.path.join(
+                ops['raman_dir'], r+'.csv')
+        if filename in missing:
+            late[filename] = r
+        else:
+            pending[filename] = r
+
+    def add_spectrum(filename):
+        """Add a spectrum to the report once its file is ready."""
+        r = pending.get(filename, late.get(filename))
+        try:
+            d['df'][r] = read_report_spectrum(filename)
+            missing.discard(filename)
+        except (OSError, ValueError) as e:
+            ops['outbox'].append('Raman file could not be read: {} '
+                                 '({})'.format(filename, e))
+
+    # spectra which were missing before are only checked once
+    late_missing = wait_for_files(late, add_spectrum, timeout=0.2)
+    not_found = wait_for_files(pending, add_spectrum,
+                               timeout=ops['file_timeout'])
+    for filename in not_found + late_missing:
+        missing.add(filename)
+        d['missing'].append(pending.get(filename, late.get(filename)))
+        ops['outbox'].append('Raman file not found: '+filename)
+
+    # calculate some statistics and add to dictionary
+    max_int_list = np.full(len(log), np.nan)
+    max_int_wl_list = np.full(len(log), np.nan)
+    for ri, r in enumerate(log['recent_raman_file']):
+        if r in d['df']:
+            df = d['df'][r]
+            max_int_list[ri] = float(df['int'].max())
+            max_int_wl_list[ri] = float(df['wl'].iloc[df['int'].idxmax()])
+    d['log']['max_intensity'] = max_int_list
+    d['log']['max_intensity_wavelength'] = max_int_wl_list
     
+    ops['report'] = d
+    # create json file summarizing results
+    report_filepath = serialize(ops)
+    if d['missing']:
+        ops['outbox'].append('{} of {} spectra are missing from the '
+                             'report.'.format(len(d['missing']),
+                                              len(d['missing'])+len(d['df'])))
+    ops['outbox'].append('Report generated:')
+    ops['outbox'].append(report_filepath)
     
-def log_to_file(ops, srs, lf, kcube, mcl, avacs):
-    """Create log file."""
-    # get most recent row of data
-    d = get_log_row_data(srs, lf, kcube, mcl, avacs)
-    # assign most recent row to last row in log data
-    ops['data'][ops['row_counter']] = list(d.values())
-    # convert log data to Pandas DataFrame
-    df = pd.DataFrame(columns=list(d.keys()), data=ops['data'])
-    # remove empty rows before saving
-    df.replace('', np.nan, inplace=True)
-    df.dropna(how='all', inplace=True)
-    # save dataframe as csv file
-    df.to_csv(ops['logpath'], index=False)
-    ops['outbox'].append('Log file appended to:')
-    ops['outbox'].append(ops['logpath'])
-    ops['row_counter'] += 1
-
-
-def get_log_row_data(srs, lf, kcube, mcl, avacs):
-    """Get data for the most recent row of the log file."""
-    d = {'time': time.strftime('%Y-%m-%d_%H-%M-%S'),
-         'total_pulses': srs['tot_pulses'],
-         'pulsewidth_ms':  srs['width'].value()/1e3,
-         'pulse_amplitude_v': srs['amplitude'].value(),
-         'pulse_delay_ms': srs['delay'].value()/1e3,
-         'pulse_number': srs['number'].value(),
-         'x_position_cm': mcl['show_x'].text(),
-         'y_position_cm': mcl['show_y'].text(),
-         'avacs_power_%': avacs['set_percent'].value(),
-         'polarizer_angle_deg': kcube['p_set'].value(),
-         'notes': lf['notes'].text().replace(',','__').replace('\t', '__'),
-         'recent_raman_file': lf['recent_file']}
+    
+    
+# columns of the log file in order. Every row has these columns, so rows
+# can be appended to the file without rewriting it.
+LOG_COLUMNS = [
+        'time', 'total_pulses', 'pulsewidth_ms', 'pulse_amplitude_v',
+        'pulse_delay_ms', 'pulse_number', 'x_position_cm', 'y_position_cm',
+        'avacs_power_%', 'energy_error_%', 'polarizer_angle_deg', 'notes',
+        'recent_raman_file', 'pulse_count', 'energy_mean_j', 'energy_std_j',
+        'energy_min_j', 'energy_max_j']
+
+
+def log_value(value):
+    """Format a value for the log file. Missing values are left empty."""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return ''
+    return value
+
+
+def open_log(ops):
+    """Open the log file for appending, and write its header if the file
+    is new."""
+    new = not os.path.exists(ops['logpath']) or not os.path.getsize(
+            ops['logpath'])
+    f = open(ops['logpath'], 'a', newline='')
+    writer = csv.DictWriter(f, fieldnames=LOG_COLUMNS, restval='',
+                            extrasaction='ignore')
+    if new:
+        writer.writeheader()
+    ops['log_file'], ops['log_writer'] = f, writer
+
+
+def write_log_rows(ops, rows):
+    """Append rows to the log file and flush it. The file is kept open,
+    so each row costs the same no matter how long the log is."""
+    with ops['log_lock']:
+        if ops['log_file'] is None or ops['log_file'].closed:
+            open_log(ops)
+        ops['log_writer'].writerows(
+                {k: log_value(v) for k, v in row.items()} for row in rows)
+        ops['log_file'].flush()
+        ops['row_counter'] += len(rows)
+
+
+def append_log_row(ops, row):
+    """Append one row to the log file right away."""
+    write_log_rows(ops, [row])
+
+
+def close_log(ops):
+    """Close the log file."""
+    with ops['log_lock']:
+        if ops['log_file'] is not None:
+            ops['log_file'].close()
+        ops['log_file'], ops['log_writer'] = None, None
+
+
+def start_log_writer(ops):
+    """Start the thread which writes queued log rows to the log file. If
+    a writer thread died, the new one writes the rows it left queued."""
+    if ops.get('log_queue') is None:
+        ops['log_queue'] = queue.Queue(maxsize=ops['log_queue_size'])
+        ops['log_metrics'] = {'queue_depth': 0, 'max_queue_depth': 0,
+                              'rows_written': 0, 'flushes': 0,
+                              'flush_latency_s': 0, 'max_flush_latency_s': 0}
+    ops['log_thread'] = threading.Thread(
+            target=log_writer_loop, args=(ops,), daemon=True)
+    ops['log_thread'].start()
+
+
+def flush_log_batch(ops, rows):
+    """Write a batch of rows and record how long it took."""
+    m = ops['log_metrics']
+    if rows:
+        t0 = time.perf_counter()
+        write_log_rows(ops, rows)
+        if ops.get('store') is not None:
+            store.append_log(ops['store'], rows, LOG_COLUMNS)
+        if ops.get('catalog') is not None:
+            try:
+                catalog.log_steps(ops['catalog'], rows,
+                                  ops['row_counter']-len(rows))
+            except sqlite3.Error as e:
+                ops['outbox'].append(
+                        'Catalog could not be updated: {}'.format(e))
+        m['flush_latency_s'] = time.perf_counter() - t0
+        m['max_flush_latency_s'] = max(
+                m['max_flush_latency_s'], m['flush_latency_s'])
+        m['rows_written'] += len(rows)
+        m['flushes'] += 1
+    m['queue_depth'] = ops['log_queue'].qsize()
+
+
+def log_writer_loop(ops):
+    """Write queued log rows in batches. A batch is written when it has
+    log_flush_rows rows or log_flush_interval seconds after its first
+    row. None stops the thread, and an Event asks for the queued rows to
+    be written now and is set when they are."""
+    q = ops['log_queue']
+    while True:
+        item = q.get()
+        rows, deadline = [], time.time() + ops['log_flush_interval']
+        while isinstance(item, dict):
+            rows.append(item)
+            if len(rows) >= ops['log_flush_rows']:
+                break
+            try:
+                item = q.get(timeout=max(0, deadline-time.time()))
+            except queue.Empty:
+                break
+        # an error in one batch must not stop the writer, or the queue
+        # fills up and log_to_file blocks
+        try:
+            flush_log_batch(ops, rows)
+        except Exception as e:
+            ops['outbox'].append('Error while writing {} log rows: {}'.format(
+                    len(rows), repr(e)))
+        if isinstance(item, threading.Event):
+            item.set()
+        elif item is None:
+            close_log_writer(ops)
+            return
+
+
+def close_log_writer(ops):
+    """Close the log file and the connection of the writer to the
+    catalog."""
+    close_log(ops)
+    if ops.get('catalog') is not None:
+        try:
+            catalog.close(ops['catalog'])
+        except sqlite3.Error as e:
+            ops['outbox'].append('Catalog could not be closed: {}'.format(e))
+
+
+def flush_log(ops, timeout=10):
+    """Wait until all queued log rows are written. Returns False if they
+    were not written within the timeout."""
+    if ops.get('log_thread') is None:
+        return True
+    if not ops['log_thread'].is_alive():
+        start_log_writer(ops)
+    done = threading.Event()
+    ops['log_queue'].put(done)
+    return done.wait(timeout)
+
+
+def stop_log_writer(ops, timeout=10):
+    """Write all queued log rows, close the log file and stop the writer
+    thread."""
+    if ops.get('log_thread') is None:
+        close_log(ops)
+        return
+    if not ops['log_thread'].is_alive():
+        close_log_writer(ops)
+        ops['log_thread'] = None
+        return
+    ops['log_queue'].put(None)
+    ops['log_thread'].join(timeout)
+    ops['log_thread'] = None
+
+
+def log_to_file(ops, slink):
+    """Queue the current state of the instruments to be written to the
+    log file by the writer thread. If the queue is full this waits for
+    the writer, so no rows are lost. A writer thread which died is
+    restarted, so this never waits for a writer which is gone."""
+    if ops.get('log_thread') is None:
+        start_log_writer(ops)
+    elif not ops['log_thread'].is_alive():
+        ops['outbox'].append('Log writer stopped unexpectedly, restarting.')
+        start_log_writer(ops)
+    ops['log_queue'].put(get_log_row_data(ops, slink))
+    m = ops['log_metrics']
+    m['queue_depth'] = ops['log_queue'].qsize()
+    m['max_queue_depth'] = max(m['max_queue_depth'], m['queue_depth'])
+
+
+def show_log_metrics(ops):
+    """Show the state of the log writer in the output box."""
+    if ops.get('log_thread') is None:
+        return
+    m = ops['log_metrics']
+    ops['outbox'].append(
+            'Log writer: {} rows written in {} flushes, queue depth {} '
+            '(max {}), last flush {:.1f} ms (max {:.1f} ms).'.format(
+                    m['rows_written'], m['flushes'], m['queue_depth'],
+                    m['max_queue_depth'], 1e3*m['flush_latency_s'],
+                    1e3*m['max_flush_latency_s']))
+
+
+def get_log_row_data(ops, slink):
+    """Get data for the most recent row of the log file from a snapshot of
+    the instrument state, so no widgets are read."""
+    d = {c: None for c in LOG_COLUMNS}
+    d.update(state.snapshot(ops['state']))
+    d['time'] = time.strftime('%Y-%m-%d_%H-%M-%S')
+    # add photometer statistics of pulses since the previous log row
+    now = time.time()
+    d.update(slink_stats(slink, slink['last_log_time']))
+    slink['last_log_time'] = now
     return d
 
 
@@ -181,10 +498,11 @@ def plot_spec_in_report(ops):
     if len(d['log']) == 0:
         ops['outbox'].append('No spectra selected.')
     else:
+        plt = lazy.pyplot()
         plt.ion()
         fig = plt.figure(5)
         fig.clf()
-        colors = cm.jet(np.linspace(0, 1, len(d['log'])))
+        colors = plt.cm.jet(np.linspace(0, 1, len(d['log'])))
         for ri, r in enumerate(d['df']):
             plot_setup(
                     colorbar=False, legend=False,
@@ -233,11 +551,15 @@ class JSONEncoder(json.JSONEncoder):
 
 
 def print_ports(ops):
-    """Print a list of available serial and VISA ports."""
-    rm = visa.ResourceManager()
-    visa_ports = list(rm.list_resources())
+    """Print a list of available serial and VISA ports. Ports of SDKs
+    which are not installed are skipped."""
+    visa = lazy.load('visa', ops['outbox'])
+    apt = lazy.load('thorlabs_apt', ops['outbox'])
+    visa_ports = [] if visa is None else list(
+            visa.ResourceManager().list_resources())
     ser_ports = list(list_ports.comports())
-    ftid_usb_ports = list(apt.list_available_devices())
+    ftid_usb_ports = [] if apt is None else list(
+            apt.list_available_devices())
     ops['outbox'].append('Available instrument addresses:')
     [ops['outbox'].append('Visa port: '+str(p)) for p in visa_ports]
     [ops['outbox'].append('Serial port: '+str(p.device)) for p in ser_ports]
@@ -245,6 +567,23 @@ def print_ports(ops):
     
 
 
+def get_settings(app):
+    """Get the value of every settings widget on the GUI, by name."""
+    settings = {}
+    for name, obj in inspect.getmembers(app):
+        if isinstance(obj, QComboBox):
+            settings[obj.objectName()] = obj.itemText(obj.currentIndex())
+        if isinstance(obj, QLineEdit):
+            settings[obj.objectName()] = obj.text()
+        if isinstance(obj, QCheckBox):
+            settings[obj.objectName()] = int(obj.checkState())
+        if isinstance(obj, QRadioButton):
+            settings[obj.objectName()] = obj.isChecked()
+        if isinstance(obj, (QSpinBox, QDoubleSpinBox, QSlider)):
+            settings[obj.objectName()] = obj.value()
+    return settings
+
+
 def export_settings(ops):
     # export app settings from file
     ops['outbox'].append('Exporting experiment settings...')
@@ -257,36 +596,9 @@ def export_settings(ops):
     # create settings .ini file
     settings = QSettings(settings_filepath, QSettings.IniFormat)
 
-    # scroll through each GUI widget and write its data to settings file
-    for name, obj in inspect.getmembers(ops['app']):
-        if isinstance(obj, QComboBox):
-            name = obj.objectName()
-            text = obj.itemText(obj.currentIndex())
-            settings.setValue(name, text)
-        if isinstance(obj, QLineEdit):
-            name = obj.objectName()
-            value = obj.text()
-            settings.setValue(name, value)
-        if isinstance(obj, QCheckBox):
-            name = obj.objectName()
-            state = obj.checkState()
-            settings.setValue(name, state)
-        if isinstance(obj, QRadioButton):
-            name = obj.objectName()
-            value = obj.isChecked()
-            settings.setValue(name, value)
-        if isinstance(obj, QSpinBox):
-            name = obj.objectName()
-            value = obj.value()
-            settings.setValue(name, value)
-        if isinstance(obj, QDoubleSpinBox):
-            name = obj.objectName()
-            value = obj.value()
-            settings.setValue(name, value)
-        if isinstance(obj, QSlider):
-            name = obj.objectName()
-            value = obj.value()
-            settings.setValue(name, value)
+    # write the data of each GUI widget to settings file
+    for name, value in get_settings(ops['app']).items():
+        settings.setValue(name, value)
 
     ops['app_settings'] = settings
     ops['outbox'].append('Experiment settings exported.')
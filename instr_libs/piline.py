@@ -63,8 +63,10 @@ def initialize(piline):
     # get reference point and wait until its finished
     piline['outbox'].append('Please wait while C-867 stage initializes...')
     turn_on_servo(piline['dev'], on=True)
-    piline['dev'].write(('FRF 1\n').encode())
-    time.sleep(6)
+    # reference again only if asked to or if the stage is not referenced
+    if piline.get('reference', True) or not is_referenced(piline['dev']):
+        piline['dev'].write(('FRF 1\n').encode())
+        time.sleep(6)
     # read stage information
     piline['outbox'].append(
         'Controller ID: {}'.format(get_id(piline['dev'])))
@@ -179,6 +181,10 @@ def get_reference_result(dev):
     dev.write(('FRF? 1\n').encode())
     return dev.readline().decode()
 
+def is_referenced(dev):
+    """Check whether the stage has been referenced."""
+    return get_reference_result(dev).strip().endswith('=1')
+
 def initialize_stage(dev):
     """Initialize the stage and get some operating parameters."""
     turn_on_servo(dev, on=True)
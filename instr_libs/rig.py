@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module for connecting every instrument of the rig at once.
+
+A rig profile lists which instruments to connect, their addresses, and
+their initialization options. Connecting the rig runs the connect
+function of each instrument at the same time in its own thread, so the
+rig is ready after the slowest instrument instead of after all of them
+one by one. Instruments which share a driver which is not thread safe,
+such as the two K-Cubes on APT.dll, are put in the same group and
+connected one after another. The profile is saved as JSON in the log
+directory.
+
+Created on Mon Oct 19 14:12:37 2026
+"""
+
+import os
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+# default name of the rig profile in the log directory
+PROFILE_NAME = 'rig_profile.json'
+
+# initialization options of each instrument and their defaults when the
+# whole rig is connected. Options are copied into the state dictionary
+# of the instrument while it connects.
+OPTIONS = {
+        'mcl': {'move_on_connect': False},
+        'piline': {'reference': False},
+        'polarizer': {'p_move_on_connect': False},
+        'analyzer': {'a_move_on_connect': False}}
+
+
+def profile_path(logdir):
+    """Get the path of the rig profile in the log directory."""
+    return os.path.join(logdir, PROFILE_NAME)
+
+
+def load_profile(path):
+    """Load a rig profile. Returns an empty profile if there is none."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_profile(path, profile):
+    """Save a rig profile."""
+    with open(path, 'w') as f:
+        json.dump(profile, f, indent=2)
+
+
+def current_profile(rig):
+    """Get a rig profile from the GUI. Instruments which are connected
+    now are connected by the profile."""
+    profile = {}
+    for name, d in rig['devices'].items():
+        profile[name] = {'connect': d['on'].isChecked(),
+                         'address': d['address'].text()}
+        for key, default in OPTIONS.get(name, {}).items():
+            profile[name][key] = d['state'].get(key, default)
+    return profile
+
+
+def default_profile(rig):
+    """Get the rig profile used when none has been saved. Instruments
+    which have an address are connected with the default options."""
+    profile = {}
+    for name, d in rig['devices'].items():
+        profile[name] = {'connect': bool(d['address'].text()),
+                         'address': d['address'].text()}
+        profile[name].update(OPTIONS.get(name, {}))
+    return profile
+
+
+def connect_group(rig, names, start, options):
+    """Connect a group of instruments one after another, each with its
+    initialization options. The options which the instruments had before
+    are restored after they connect, so later manual connects behave as
+    before. Returns the time at which each instrument was ready, relative
+    to start, the time it took to connect, and whether it connected."""
+    ready = {}
+    for name in names:
+        d = rig['devices'][name]
+        previous = {key: d['state'][key] for key in options[name]
+                    if key in d['state']}
+        d['state'].update(options[name])
+        t0 = time.perf_counter()
+        try:
+            d['connect']()
+        except Exception as e:
+            rig['outbox'].append('{} could not connect: {}'.format(name, e))
+        finally:
+            for key in options[name]:
+                d['state'].pop(key, None)
+            d['state'].update(previous)
+        t = time.perf_counter()
+        ready[name] = (t-start, t-t0, d['on'].isChecked())
+    return ready
+
+
+def connect_all(rig, profile=None):
+    """Connect every instrument of the rig profile in parallel and report
+    how long each took to become ready. Instruments which are already
+    connected are left as is. If the profile is empty, the default
+    profile is used. Returns the readiness of each instrument."""
+    if not profile:
+        profile = default_profile(rig)
+    groups, options = {}, {}
+    for name, d in rig['devices'].items():
+        entry = profile.get(name, {})
+        if not entry.get('connect') or d['on'].isChecked():
+            continue
+        if entry.get('address'):
+            d['address'].setText(entry['address'])
+        options[name] = {key: entry.get(key, default)
+                         for key, default in OPTIONS.get(name, {}).items()}
+        # check the box without running its handler, which is run below
+        d['on'].blockSignals(True)
+        d['on'].setChecked(True)
+        d['on'].blockSignals(False)
+        groups.setdefault(d.get('group', name), []).append(name)
+    if not groups:
+        rig['outbox'].append('No instruments to connect.')
+        return {}
+    rig['outbox'].append('Connecting {}...'.format(
+            ', '.join(n for names in groups.values() for n in names)))
+    start = time.perf_counter()
+    ready = {}
+    with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+        jobs = [pool.submit(connect_group, rig, names, start, options)
+                for names in groups.values()]
+        for job in jobs:
+            ready.update(job.result())
+    total = time.perf_counter() - start
+    for name, (t, duration, ok) in sorted(
+            ready.items(), key=lambda item: item[1][0]):
+        rig['outbox'].append('{}: {} after {:.1f} s'.format(
+                name, 'ready' if ok else 'failed', t))
+    rig['outbox'].append(
+            '{}/{} instruments ready in {:.1f} s ({:.1f} s one by '
+            'one).'.format(sum(r[2] for r in ready.values()), len(ready),
+                           total, sum(r[1] for r in ready.values())))
+    rig['ready'] = ready
+    return ready
@@ -9,12 +9,23 @@ Created on Mon Mar  2 15:34:06 2020
 
 import codecs
 import time
+import threading
 import serial
 import numpy as np
 from serial.tools import list_ports
+from instr_libs import state
 
 decode_hex = codecs.getdecoder('hex_codec')
 
+# seconds to wait after a failed read while streaming
+ERROR_DELAY = 0.05
+
+# serial errors in a row after which streaming stops
+MAX_SERIAL_ERRORS = 10
+
+# seconds between polls for a new reading while streaming
+POLL_DELAY = 0.002
+
 def print_ports():
     """Print a list of avilable serial ports."""
     ports = list(list_ports.comports())
@@ -93,6 +104,188 @@ def get_status(dev):
 
 
 
+def range_value(code):
+    """Get the full-scale value of a range code in watts or joules,
+    e.g. '20' --> 0.01 (10 millijoules)."""
+    n = int(code)
+    return (1, 3)[n % 2] * 10.0**(n//2 - 12)
+
+
+def choose_range(value, code, low=0.05, high=0.9):
+    """Choose the range code for a reading. Step up a range when the
+    reading is near full scale and step down when it would still fit
+    comfortably on the next lower range."""
+    n = int(code)
+    while abs(value) > high*range_value(n) and n < len(range_dict)-1:
+        n += 1
+    while n > 0 and abs(value) < low*range_value(n) and (
+            abs(value) < high*range_value(n-1)):
+        n -= 1
+    return '{:02d}'.format(n)
+
+
+class RingBuffer:
+    """Fixed-size, thread-safe ring buffer of timestamped readings."""
+
+    def __init__(self, size=10000):
+        self.size = size
+        self.values = np.zeros(size)
+        self.times = np.zeros(size)
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def append(self, t, value):
+        """Add a reading, overwriting the oldest one when full."""
+        with self.lock:
+            i = self.count % self.size
+            self.times[i] = t
+            self.values[i] = value
+            self.count += 1
+
+    def since(self, t0=0):
+        """Get the times and values of readings taken after time t0,
+        oldest first."""
+        with self.lock:
+            n = min(self.count, self.size)
+            idx = (self.count - n + np.arange(n)) % self.size
+            times, values = self.times[idx], self.values[idx]
+        keep = times > t0
+        return times[keep], values[keep]
+
+
+def enable_slink(slink, enabled):
+    """Enable/disable GUI objects related to the photometer."""
+    slink['address'].setEnabled(not enabled)
+    slink['energy'].setEnabled(enabled)
+    slink['range'].setEnabled(enabled)
+
+
+def slink_on(slink):
+    """Run this when S-Link photometer checkbox is checked/unchecked."""
+    if slink['on'].isChecked():
+        try:
+            dev = serial.Serial(port=slink['address'].text(),
+                                baudrate=921600, timeout=0.2)
+            slink['dev'] = dev
+            slink['outbox'].append('Photometer connected.')
+            slink['outbox'].append(
+                    'Version number: {}'.format(version_number(dev)))
+            set_range(slink, slink['range_code'])
+            start_stream(slink)
+            enable_slink(slink, True)
+        except serial.SerialException:
+            slink['outbox'].append('Photometer could not connect.')
+            slink['outbox'].append(
+                    'Try unplugging its USB cable for 5 seconds.')
+            slink['dev'] = None
+            slink['on'].setChecked(False)
+            enable_slink(slink, False)
+    if not slink['on'].isChecked():
+        stop_stream(slink)
+        try:
+            slink['dev'].close()
+        except AttributeError:
+            pass
+        slink['dev'] = None
+        slink['outbox'].append('Photometer closed.')
+        state.update(slink['state'], photometer_energy_j=None,
+                     photometer_range=None)
+        enable_slink(slink, False)
+
+
+def set_range(slink, code):
+    """Set the measurement range of channel 1 using a range_dict code.
+    The range is shown on the GUI through the state cache, so this can
+    run on the streaming thread."""
+    slink['dev'].write(('*SC1'+code).encode())
+    slink['range_code'] = code
+    state.update(slink['state'], photometer_range=range_dict[code])
+
+
+def new_value_ready(dev):
+    """Check whether a new reading (e.g. a new pulse) is available."""
+    dev.write('*NV1'.encode())
+    return 'New Data Available' in dev.readline().decode()
+
+
+def current_value(dev):
+    """Read the current value of channel 1 in watts or joules."""
+    dev.write('*CV1'.encode())
+    return float(dev.readline().decode().split(':')[-1])
+
+
+def stream(slink):
+    """Read new values from the photometer into the ring buffer until
+    streaming is stopped. The range is adjusted automatically. Readings
+    are shown on the GUI through the state cache, because widgets may
+    only be changed on the GUI thread. After a read error the thread
+    waits before trying again, and streaming stops after
+    MAX_SERIAL_ERRORS serial errors in a row, e.g. when the photometer
+    is unplugged."""
+    serial_errors = 0
+    while slink['streaming']:
+        try:
+            if not new_value_ready(slink['dev']):
+                time.sleep(POLL_DELAY)
+                continue
+            t = time.time()
+            value = current_value(slink['dev'])
+        except (ValueError, IndexError):
+            time.sleep(ERROR_DELAY)
+            continue
+        except serial.SerialException as e:
+            serial_errors += 1
+            if serial_errors >= MAX_SERIAL_ERRORS:
+                slink['streaming'] = False
+                slink['outbox'].append(
+                        'Photometer streaming stopped: {}'.format(e))
+                return
+            time.sleep(min(ERROR_DELAY*2**serial_errors, 1))
+            continue
+        serial_errors = 0
+        slink['buffer'].append(t, value)
+        state.update(slink['state'],
+                     photometer_energy_j=float('{:.4g}'.format(value)))
+        code = choose_range(value, slink['range_code'])
+        if code != slink['range_code']:
+            set_range(slink, code)
+
+
+def start_stream(slink):
+    """Start streaming photometer readings on a background thread."""
+    slink['buffer'] = RingBuffer(size=slink['buffer_size'])
+    slink['streaming'] = True
+    slink['thread'] = threading.Thread(target=stream, args=(slink,),
+                                       daemon=True)
+    slink['thread'].start()
+
+
+def stop_stream(slink):
+    """Stop the background streaming thread."""
+    slink['streaming'] = False
+    if slink['thread'] is not None:
+        slink['thread'].join(timeout=2)
+        slink['thread'] = None
+
+
+def pulse_stats(slink, t0=0):
+    """Get statistics of the pulse energies measured after time t0.
+    This only reads the ring buffer, so it never blocks on the device."""
+    stats = {'pulse_count': 0, 'energy_mean_j': np.nan,
+             'energy_std_j': np.nan, 'energy_min_j': np.nan,
+             'energy_max_j': np.nan}
+    if slink['buffer'] is None:
+        return stats
+    _, values = slink['buffer'].since(t0)
+    if len(values):
+        stats = {'pulse_count': len(values),
+                 'energy_mean_j': float(np.mean(values)),
+                 'energy_std_j': float(np.std(values)),
+                 'energy_min_j': float(np.min(values)),
+                 'energy_max_j': float(np.max(values))}
+    return stats
+
+
 if __name__ == '__main__':
 
     #print_ports()
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module for reading Princeton Instruments SPE 2.x and 3.0 files.
+
+The data block of the file is memory-mapped, so frames of large
+multi-frame files are read lazily, one at a time, without loading the
+whole file. The binary header gives the data type, frame count and
+regions of interest (ROIs). SPE 3.0 files also have an XML footer, which
+gives the frame layout and the wavelength calibration.
+
+Created on Mon Oct 19 11:24:52 2026
+"""
+
+import struct
+import xml.etree.ElementTree as ET
+import numpy as np
+
+
+# size of the binary header, after which the data block starts
+HEADER_SIZE = 4100
+
+# numpy types of the data type codes in the header
+SPE_DTYPES = {0: np.float32, 1: np.int32, 2: np.int16, 3: np.uint16,
+              5: np.float64, 6: np.uint8, 8: np.uint32}
+
+# numpy types of the pixel formats in the SPE 3.0 XML footer
+XML_DTYPES = {'MonochromeUnsigned16': np.uint16,
+              'MonochromeUnsigned32': np.uint32,
+              'MonochromeFloating32': np.float32}
+
+
+def read_header(raw):
+    """Read the fields of a 4100 byte SPE file header."""
+    def read_at(pos, fmt):
+        return struct.unpack_from('<'+fmt, raw, pos)[0]
+    n_rois = read_at(1510, 'h')
+    h = {'xdim': read_at(42, 'H'),
+         'datatype': read_at(108, 'h'),
+         'ydim': read_at(656, 'H'),
+         'xml_offset': read_at(678, 'Q'),
+         'n_frames': read_at(1446, 'i'),
+         'version': read_at(1992, 'f'),
+         'rois': []}
+    # each ROI is stored as startx, endx, groupx, starty, endy, groupy
+    for i in range(max(n_rois, 1)):
+        x0, x1, gx, y0, y1, gy = struct.unpack_from('<6H', raw, 1512+12*i)
+        if n_rois < 1 or gx == 0 or gy == 0:
+            x0, x1, gx, y0, y1, gy = 0, h['xdim']-1, 1, 0, h['ydim']-1, 1
+        h['rois'].append({'x': x0, 'y': y0,
+                          'width': (x1-x0+1)//gx, 'height': (y1-y0+1)//gy,
+                          'x_binning': gx, 'y_binning': gy})
+    # wavelength polynomial of SPE 2.x files
+    order = read_at(3101, 'B')
+    coeffs = struct.unpack_from('<6d', raw, 3263)
+    h['calibration'] = coeffs[:order+1] if read_at(3098, 'B') else None
+    return h
+
+
+def xml_children(element, name):
+    """Get child elements by name, ignoring the XML namespace."""
+    return [c for c in element if c.tag.split('}')[-1] == name]
+
+
+def xml_find(element, *names):
+    """Get the first element at a path of names, ignoring the XML
+    namespace, or None if it does not exist."""
+    for name in names:
+        children = xml_children(element, name)
+        if not children:
+            return None
+        element = children[0]
+    return element
+
+
+def parse_xml_footer(xml):
+    """Get the frame layout, ROIs and wavelength from an SPE 3.0 XML
+    footer."""
+    root = ET.fromstring(xml)
+    d = {'xml': xml, 'wavelength': None}
+    frame = [b for b in xml_children(xml_find(root, 'DataFormat'),
+             'DataBlock') if b.get('type') == 'Frame'][0]
+    d['n_frames'] = int(frame.get('count'))
+    d['dtype'] = XML_DTYPES[frame.get('pixelFormat')]
+    d['frame_stride'] = int(frame.get('stride', frame.get('size')))
+    d['rois'] = [{'width': int(r.get('width')), 'height': int(r.get('height'))}
+                 for r in xml_children(frame, 'DataBlock')]
+    calibrations = xml_find(root, 'Calibrations')
+    if calibrations is None:
+        return d
+    # position and binning of each ROI on the sensor
+    mapping = xml_children(calibrations, 'SensorMapping')
+    for roi, m in zip(d['rois'], mapping):
+        roi.update({'x': int(m.get('x', 0)), 'y': int(m.get('y', 0)),
+                    'x_binning': int(m.get('xBinning', 1)),
+                    'y_binning': int(m.get('yBinning', 1))})
+    wl = xml_find(calibrations, 'WavelengthMapping', 'Wavelength')
+    if wl is not None:
+        d['wavelength'] = np.array(wl.text.split(','), dtype=float)
+    else:
+        # some files store wavelength,error pairs instead
+        wl = xml_find(calibrations, 'WavelengthMapping', 'WavelengthError')
+        if wl is not None:
+            d['wavelength'] = np.array(
+                    [p.split(',')[0] for p in wl.text.split()], dtype=float)
+    return d
+
+
+def roi_wavelength(wavelength, roi):
+    """Get the wavelength of each binned column of an ROI from the
+    wavelength of each column of the sensor."""
+    if wavelength is None:
+        return None
+    if len(wavelength) == roi['width']:
+        return wavelength
+    bins = roi.get('x_binning', 1)
+    cols = wavelength[roi.get('x', 0):roi.get('x', 0)+roi['width']*bins]
+    if len(cols) != roi['width']*bins:
+        return None
+    return cols.reshape(roi['width'], bins).mean(axis=1)
+
+
+def open_spe(path):
+    """Open an SPE file for lazy reading. The header and footer are read
+    and the data block is memory-mapped. Returns a dictionary of the
+    file metadata and the memory map."""
+    with open(path, 'rb') as f:
+        h = read_header(f.read(HEADER_SIZE))
+        xml = None
+        if h['version'] >= 3 and h['xml_offset'] > 0:
+            f.seek(h['xml_offset'])
+            xml = f.read().decode('utf-8', errors='replace')
+    spe = {'path': path, 'version': h['version'], 'xml': xml,
+           'n_frames': h['n_frames'], 'dtype': SPE_DTYPES[h['datatype']],
+           'rois': h['rois'], 'wavelength': None}
+    if xml is not None:
+        spe.update(parse_xml_footer(xml))
+    elif h['calibration'] is not None:
+        pixels = np.arange(h['xdim'])
+        spe['wavelength'] = np.polynomial.polynomial.polyval(
+                pixels, h['calibration'])
+    itemsize = np.dtype(spe['dtype']).itemsize
+    # the ROIs of each frame are stored one after another
+    offset = 0
+    for roi in spe['rois']:
+        roi['offset'] = offset
+        offset += roi['width']*roi['height']*itemsize
+    spe.setdefault('frame_stride', offset)
+    spe['data'] = np.memmap(path, dtype=np.uint8, mode='r',
+                            offset=HEADER_SIZE,
+                            shape=(spe['n_frames']*spe['frame_stride'],))
+    return spe
+
+
+def get_frame(spe, frame=0, roi=0):
+    """Get one ROI of one frame as a (height, width) array. The array is
+    a view on the memory map, so only this frame is read from disk."""
+    r = spe['rois'][roi]
+    if not 0 <= frame < spe['n_frames']:
+        raise IndexError('Frame {} is not in the file.'.format(frame))
+    return np.ndarray((r['height'], r['width']), dtype=spe['dtype'],
+                      buffer=spe['data'],
+                      offset=frame*spe['frame_stride']+r['offset'])
+
+
+def iter_frames(spe, roi=0):
+    """Iterate over one ROI of each frame of the file."""
+    for frame in range(spe['n_frames']):
+        yield get_frame(spe, frame, roi)
+
+
+def get_spectrum(spe, frame=0, roi=0):
+    """Get the spectrum of one ROI of a frame by summing its rows.
+    Returns the wavelength, which is None if the file has no
+    calibration, and the intensity."""
+    wl = roi_wavelength(spe['wavelength'], spe['rois'][roi])
+    return wl, get_frame(spe, frame, roi).sum(axis=0, dtype=np.float64)
+
+
+def close_spe(spe):
+    """Release the memory map of an SPE file. Frames which were read
+    from it remain valid until they are deleted."""
+    spe['data'] = None
@@ -9,9 +9,8 @@ Created on Mon Feb 17 14:08:13 2020
 
 import time
 import serial
-import visa
-import thorlabs_apt as apt
 from serial.tools import list_ports
+from instr_libs import state
 
 def pulsegen_on(srs):
     "Run this function when pulse generator checkbox is checked."""
@@ -70,18 +69,32 @@ def trigger_pulses(srs):
     srs['dev'].write(('DLAY3,2,'+str(pulse_width)+'\r').encode())
     # set amplitude of output A
     srs['dev'].write(('LAMP1,'+str(pulse_amplitude)+'\r').encode())
+    fire(srs, pulse_number, pulse_delay)
+    state.update(srs['state'], pulsewidth_ms=pulse_width,
+                 pulse_amplitude_v=pulse_amplitude,
+                 pulse_delay_ms=pulse_delay, pulse_number=pulse_number)
+    srs['trigger'].setEnabled(True)
+    srs['outbox'].append('Pulse sequence complete.')
+
+
+def fire(srs, pulse_number, pulse_delay):
+    """Fire n single shot triggers spaced by pulse_delay seconds using
+    the currently configured outputs. The start time of the pulse train
+    is kept in srs['train_start']."""
+    srs['train_start'] = time.time()
     for _ in range(pulse_number):
         # initiate single shot trigger
         srs['dev'].write('*TRG\r'.encode())
         time.sleep(pulse_delay)
-    srs['trigger'].setEnabled(True)
-    srs['outbox'].append('Pulse sequence complete.')
     srs['tot_pulses'] += pulse_number
+    state.update(srs['state'], total_pulses=srs['tot_pulses'])
 
 
 
 if __name__ == '__main__':
     
+    import visa
+    import thorlabs_apt as apt
     rm = visa.ResourceManager()
     
     print('Available ports:')
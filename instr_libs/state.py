@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module for the cache of instrument state which is shared between the
+instrument drivers, the log writer and the GUI.
+
+Drivers update the cache with values read back from their instruments
+once a move or a setting has been confirmed, so the cache never holds
+intermediate values such as 'moving'. Log rows are built from a
+snapshot of the cache instead of reading Qt widgets from worker
+threads, which takes microseconds. The GUI subscribes to the cache to
+show new values, and receives them on its own thread through a Qt
+signal (see App.show_state).
+
+Created on Mon Oct 19 15:31:18 2026
+"""
+
+import threading
+
+
+def new_state():
+    """Create an empty state cache."""
+    return {'lock': threading.Lock(), 'values': {}, 'subscribers': []}
+
+
+def update(state, **values):
+    """Update values in the cache and send them to the subscribers."""
+    with state['lock']:
+        state['values'].update(values)
+        subscribers = list(state['subscribers'])
+    for callback in subscribers:
+        callback(values)
+
+
+def snapshot(state):
+    """Get a copy of all values in the cache."""
+    with state['lock']:
+        return dict(state['values'])
+
+
+def subscribe(state, callback):
+    """Call callback with a dictionary of the changed values each time
+    the cache is updated. The callback runs on the thread which updated
+    the cache."""
+    with state['lock']:
+        state['subscribers'].append(callback)
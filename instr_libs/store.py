@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module for storing everything recorded in one run of the application in
+a single HDF5 file: the log table, the Raman spectra, oscilloscope
+traces and snapshots of the GUI settings. Data is appended while the run
+goes on, and each part can be read back without loading the rest.
+
+Layout of the file:
+    /log/<column>          one resizable array per log column
+    /spectra/wavelength    wavelength axis shared by all spectra
+    /spectra/intensity     (n_spectra, n_pixels) chunked intensity array
+    /spectra/names         file name of each spectrum
+    /spectra/time          acquisition time of each spectrum
+    /traces/<timestamp>    raw scope samples, with the sources and
+                           scaling preambles as attributes
+    /settings/<timestamp>  GUI settings as a JSON string
+
+h5py is imported when the store is opened, so the application runs
+without it and only the store is disabled. The file is locked while the
+application has it open, so to read it during a run from another
+process, set the environment variable HDF5_USE_FILE_LOCKING=FALSE.
+
+Created on Mon Oct 19 15:04:51 2026
+"""
+
+import os
+import json
+import time
+import numpy as np
+import pandas as pd
+from instr_libs import lazy
+
+
+# log columns which hold text. All other log columns are numeric, and
+# values which are not numbers (such as 'moving') are stored as NaN.
+LOG_TEXT_COLUMNS = ('time', 'notes', 'recent_raman_file')
+
+# number of spectra per chunk of the intensity array
+SPECTRA_CHUNK = 16
+
+
+def store_path(logdir, starttime):
+    """Get the path of the store of a run."""
+    return os.path.join(logdir, starttime+'.h5')
+
+
+def open_store(store):
+    """Open the store file for appending. Returns False if h5py is not
+    available, in which case the store is disabled for this run."""
+    if store['file'] is not None:
+        return True
+    if not store['enabled']:
+        return False
+    h5py = lazy.load('h5py', store['outbox'])
+    if h5py is None:
+        store['enabled'] = False
+        store['outbox'].append('Run store disabled.')
+        return False
+    store['h5py'] = h5py
+    store['file'] = h5py.File(store['path'], 'a')
+    return True
+
+
+def close_store(store):
+    """Close the store file."""
+    with store['lock']:
+        if store['file'] is not None:
+            store['file'].close()
+        store['file'] = None
+
+
+def text_dtype(store):
+    """Get the HDF5 data type of variable length text."""
+    return store['h5py'].special_dtype(vlen=str)
+
+
+def append_rows(group, name, values, dtype, chunk=1024):
+    """Append values to a resizable 1D array in a group."""
+    if name not in group:
+        group.create_dataset(name, shape=(0,), maxshape=(None,),
+                             dtype=dtype, chunks=(chunk,))
+    dset = group[name]
+    n = len(dset)
+    dset.resize((n+len(values),))
+    dset[n:] = values
+
+
+def to_number(value):
+    """Convert a log value to a float, or NaN if it is not a number."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def append_log(store, rows, columns):
+    """Append rows of the log table to the store."""
+    if not rows or not open_store(store):
+        return
+    with store['lock']:
+        log = store['file'].require_group('log')
+        for col in columns:
+            values = [row.get(col) for row in rows]
+            if col in LOG_TEXT_COLUMNS:
+                values = ['' if v is None else str(v) for v in values]
+                append_rows(log, col, values, text_dtype(store))
+            else:
+                append_rows(log, col, [to_number(v) for v in values],
+                            np.float64)
+        store['file'].flush()
+
+
+def append_spectrum(store, name, wavelength, intensity):
+    """Append a Raman spectrum to the intensity array. The first spectrum
+    sets the shared wavelength axis, and later spectra on a different
+    axis are interpolated onto it."""
+    if not open_store(store):
+        return
+    with store['lock']:
+        spectra = store['file'].require_group('spectra')
+        wavelength = np.asarray(wavelength, dtype=float)
+        intensity = np.asarray(intensity, dtype=np.float32)
+        if 'wavelength' not in spectra:
+            n_pixels = len(wavelength)
+            spectra.create_dataset('wavelength', data=wavelength)
+            spectra.create_dataset(
+                    'intensity', shape=(0, n_pixels), dtype=np.float32,
+                    maxshape=(None, n_pixels), chunks=(SPECTRA_CHUNK, n_pixels))
+        shared = spectra['wavelength'][()]
+        if len(wavelength) != len(shared) or not np.allclose(
+                wavelength, shared):
+            intensity = np.interp(shared, wavelength, intensity)
+        dset = spectra['intensity']
+        n = len(dset)
+        dset.resize((n+1, dset.shape[1]))
+        dset[n] = intensity
+        append_rows(spectra, 'names', [name], text_dtype(store))
+        append_rows(spectra, 'time', [time.time()], np.float64)
+        store['file'].flush()
+
+
+def add_trace(store, raw, preambles, sources, timestamp, frame_times=None):
+    """Add the raw samples of an oscilloscope acquisition."""
+    if raw is None or not open_store(store):
+        return
+    with store['lock']:
+        traces = store['file'].require_group('traces')
+        name = timestamp
+        while name in traces:
+            name += '_'
+        dset = traces.create_dataset(name, data=raw, chunks=True)
+        dset.attrs['sources'] = json.dumps(list(sources))
+        dset.attrs['preambles'] = json.dumps(preambles, default=float)
+        if frame_times is not None:
+            dset.attrs['frame_times'] = np.asarray(frame_times)
+        store['file'].flush()
+
+
+def add_settings(store, settings):
+    """Add a snapshot of the GUI settings."""
+    if not open_store(store):
+        return
+    with store['lock']:
+        group = store['file'].require_group('settings')
+        name = time.strftime('%Y-%m-%d_%H-%M-%S')
+        while name in group:
+            name += '_'
+        group.create_dataset(name, data=json.dumps(settings),
+                             dtype=text_dtype(store))
+        store['file'].flush()
+
+
+def to_text(values):
+    """Convert text read from a store to a string array. Newer versions
+    of h5py read text as bytes."""
+    return np.array([v.decode() if isinstance(v, bytes) else v
+                     for v in values], dtype=str)
+
+
+def read_log(path, columns=None):
+    """Read the log table, or only some of its columns, from a store."""
+    import h5py
+    with h5py.File(path, 'r') as f:
+        log = f.get('log', {})
+        columns = list(log) if columns is None else columns
+        d = {}
+        for col in columns:
+            values = log[col][()]
+            if col in LOG_TEXT_COLUMNS:
+                values = to_text(values)
+            d[col] = values
+    return pd.DataFrame(d)
+
+
+def read_spectra(path, rows=slice(None)):
+    """Read the names, wavelength axis and intensities of the spectra in
+    a store. rows selects which spectra are read from the file."""
+    import h5py
+    with h5py.File(path, 'r') as f:
+        spectra = f['spectra']
+        names = to_text(spectra['names'][rows])
+        return {'names': names,
+                'wavelength': spectra['wavelength'][()],
+                'intensity': spectra['intensity'][rows],
+                'time': spectra['time'][rows]}
+
+
+def list_traces(path):
+    """List the names of the oscilloscope traces in a store."""
+    import h5py
+    with h5py.File(path, 'r') as f:
+        return list(f.get('traces', {}))
+
+
+def read_trace(path, name):
+    """Read one oscilloscope trace from a store, in the format returned
+    by mso.load_scope_npz."""
+    import h5py
+    with h5py.File(path, 'r') as f:
+        dset = f['traces'][name]
+        d = {'raw': dset[()], 'timestamp': name,
+             'sources': json.loads(dset.attrs['sources']),
+             'preambles': json.loads(dset.attrs['preambles'])}
+        if 'frame_times' in dset.attrs:
+            d['frame_times'] = dset.attrs['frame_times']
+    return d
+
+
+def read_settings(path, name=None):
+    """Read a snapshot of the GUI settings from a store. The most recent
+    snapshot is read if no name is given."""
+    import h5py
+    with h5py.File(path, 'r') as f:
+        group = f['settings']
+        name = sorted(group)[-1] if name is None else name
+        return json.loads(group[name][()])
@@ -6,12 +6,15 @@ Created on Mon Mar  9 15:00:38 2020
 """
 
 import os
+import sys
 import glob
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib import cm
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from instr_libs import cube
+
 
 plt.rcParams['xtick.labelsize'] = 14
 plt.rcParams['ytick.labelsize'] = 14
@@ -52,20 +55,20 @@ def plot_setup(labels=['X', 'Y'], fsize=18, setlimits=False,
 
 
 def stack_spectra(filelist):
-    """Get a 2D array of stacked spectra and metadata in a dictionary."""
-    d = {
-        'colors': cm.jet(np.linspace(0, 1, len(filelist))),
-        'labels': []}
-    # loop over each spectrum and stack it into 2D array
-    for fi, f in enumerate(filelist):
-        df = pd.read_csv(f)
-        d['labels'].append(os.path.split(f)[1].split('.csv')[0])
-        # stack spectra together in a single matrix
-        if fi == 0:
-            d['spec_mat'] = np.array(df['Intensity'])
-        else:
-            d['spec_mat'] = np.column_stack((d['spec_mat'], df['Intensity']))
-    d['wavelength'] = np.array(df['Wavelength'])
+    """Get a 2D array of stacked spectra and metadata in a dictionary,
+    with one spectrum per column. The spectra are read into a spectral
+    cube and copied out of it, and the cube is closed, so the file of a
+    large cube is deleted."""
+    d = {'colors': cm.jet(np.linspace(0, 1, len(filelist))),
+         'labels': [],
+         'wavelength': np.empty(0),
+         'spec_mat': np.empty((0, 0))}
+    c = cube.from_csv_files(filelist)
+    if c is not None:
+        d.update({'labels': list(c['labels']),
+                  'wavelength': c['wavelength'],
+                  'spec_mat': np.array(cube.spectra(c).T)})
+        cube.close(c)
     return d
                              
                              
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+
+Benchmark for stacking Raman spectra. Compares growing a matrix with
+np.column_stack for each spectrum, which copies every spectrum already
+stacked, against appending to a spectral cube in memory and backed by a
+memory-mapped file. Synthetic 1340 pixel spectra are used, and the
+example CSV files are read into a cube to check it matches the old
+stacking.
+
+Usage: python support_files/benchmark_cube.py
+
+Created on Mon Oct 19 16:48:30 2026
+"""
+
+import os
+import sys
+import glob
+import time
+import tempfile
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+from instr_libs import cube
+
+
+def column_stack(spectra):
+    """Stack spectra the way stack_spectra used to."""
+    for i, s in enumerate(spectra):
+        mat = s if i == 0 else np.column_stack((mat, s))
+    return mat
+
+
+def run(n_spectra=4000, n_pixels=1340):
+    """Time both ways of stacking and print results."""
+    wavelength = np.linspace(500, 600, n_pixels)
+    spectra = np.random.random((n_spectra, n_pixels)).astype(np.float32)
+
+    t0 = time.perf_counter()
+    mat = column_stack(spectra)
+    t_old = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    c = cube.new_cube(wavelength)
+    for s in spectra:
+        cube.append(c, s)
+    t_cube = time.perf_counter() - t0
+    assert np.array_equal(cube.spectra(c).T, mat)
+    cube.close(c)
+
+    path = os.path.join(tempfile.mkdtemp(), 'cube.dat')
+    t0 = time.perf_counter()
+    c = cube.new_cube(wavelength, path=path)
+    for s in spectra:
+        cube.append(c, s)
+    t_mmap = time.perf_counter() - t0
+    assert np.array_equal(cube.spectra(c), spectra)
+    cube.close(c)
+
+    print('{} spectra of {} pixels:'.format(n_spectra, n_pixels))
+    print('column_stack:    {:.2f} s'.format(t_old))
+    print('cube in memory:  {:.3f} s'.format(t_cube))
+    print('cube memory-mapped: {:.3f} s'.format(t_mmap))
+
+    files = sorted(glob.glob(os.path.join(
+            ROOT, 'support_files', 'example_raman_csv_files', '*.csv')))
+    c = cube.from_csv_files(files)
+    old = column_stack([pd.read_csv(f)['Intensity'] for f in files])
+    assert np.allclose(cube.spectra(c).T, old)
+    print('{} example files match the old stacking.'.format(len(files)))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+
+Benchmark for writing the experiment log file. Compares the old log
+writer, which put each row into a fixed 1000 row array and rewrote the
+whole CSV file on every call, against the append-only writer in ops.py.
+The time per row is printed at intervals to show that appending stays
+constant as the log grows to 100k rows. The time to queue a row for the
+background writer thread, which is what the experiment waits for, is
+also measured together with the flush metrics of the writer.
+
+Usage: python support_files/benchmark_log.py
+
+Created on Mon Oct 19 14:38:05 2026
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from instr_libs import ops
+
+
+class Outbox:
+    """Stand-in for the output box of the GUI."""
+    def append(self, text):
+        pass
+
+
+def make_row(i):
+    """Make a synthetic log row."""
+    row = {c: '' for c in ops.LOG_COLUMNS}
+    row.update({'time': time.strftime('%Y-%m-%d_%H-%M-%S'),
+                'total_pulses': i, 'pulsewidth_ms': 0.01,
+                'x_position_cm': 1.25, 'y_position_cm': 2.5,
+                'avacs_power_%': 50.0, 'energy_error_%': np.nan,
+                'polarizer_angle_deg': 45.0, 'notes': 'benchmark',
+                'recent_raman_file': 'spectrum_{}'.format(i)})
+    return row
+
+
+def old_log(d, row):
+    """Log one row the way the old log writer did."""
+    d['data'][d['row_counter']] = list(row.values())
+    df = pd.DataFrame(columns=list(row.keys()), data=d['data'])
+    df.replace('', np.nan, inplace=True)
+    df.dropna(how='all', inplace=True)
+    df.to_csv(d['logpath'], index=False)
+    d['row_counter'] += 1
+
+
+def run(n_rows=100000, n_old=1000, interval=10000):
+    """Time the old and the new log writers and print results."""
+    folder = tempfile.mkdtemp()
+
+    d = {'row_counter': 0, 'logpath': os.path.join(folder, 'old.csv'),
+         'data': np.full((1000, len(ops.LOG_COLUMNS)), '', dtype=object)}
+    t0 = time.perf_counter()
+    for i in range(n_old):
+        old_log(d, make_row(i))
+    t_old = time.perf_counter() - t0
+    print('old writer: {} rows in {:.2f} s ({:.2f} ms per row)'.format(
+            n_old, t_old, 1e3*t_old/n_old))
+
+    d = {'row_counter': 0, 'logpath': os.path.join(folder, 'new.csv'),
+         'log_file': None, 'log_writer': None, 'log_lock': threading.Lock(),
+         'outbox': Outbox()}
+    t0 = t_last = time.perf_counter()
+    for i in range(n_rows):
+        ops.append_log_row(d, make_row(i))
+        if (i+1) % interval == 0:
+            t = time.perf_counter()
+            print('new writer: rows {:6d}-{:6d}: {:.1f} us per row'.format(
+                    i+1-interval, i+1, 1e6*(t-t_last)/interval))
+            t_last = t
+    t_new = time.perf_counter() - t0
+    ops.close_log(d)
+    print('new writer: {} rows in {:.2f} s ({:.1f} us per row)'.format(
+            n_rows, t_new, 1e6*t_new/n_rows))
+    assert len(pd.read_csv(d['logpath'])) == n_rows
+
+    d.update({'row_counter': 0, 'logpath': os.path.join(folder, 'queued.csv'),
+              'log_thread': None, 'log_queue_size': 10000,
+              'log_flush_rows': 100, 'log_flush_interval': 1.0})
+    ops.start_log_writer(d)
+    t0 = time.perf_counter()
+    for i in range(n_rows):
+        d['log_queue'].put(make_row(i))
+    t_put = time.perf_counter() - t0
+    ops.flush_log(d, timeout=60)
+    t_flush = time.perf_counter() - t0
+    m = d['log_metrics']
+    print('queued writer: {:.1f} us per row to queue, all {} rows written '
+          'in {:.2f} s in {} flushes, max flush {:.1f} ms'.format(
+                  1e6*t_put/n_rows, m['rows_written'], t_flush, m['flushes'],
+                  1e3*m['max_flush_latency_s']))
+    ops.stop_log_writer(d)
+    assert len(pd.read_csv(d['logpath'])) == n_rows
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+
+Benchmark for exporting Tektronix MSO64 scope traces. Compares the old
+CSV export (time and signal columns written with pandas) against the
+binary .npz export, and checks that the .npz file can be memory-mapped
+back. A synthetic 1.25 M point trace is used so that the benchmark runs
+without an oscilloscope attached.
+
+Created on Mon Oct 19 11:02:15 2026
+"""
+
+import os
+import sys
+import time
+import tempfile
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from instr_libs import mso
+
+
+def run(n_samples=1250000, byt_nr=1):
+    """Time CSV and .npz export of a synthetic trace and print results."""
+    preamble = {'ymult': 1e-3, 'yoff': 0.0, 'yzero': 0.0,
+                'xincr': 8e-10, 'xzero': 0.0, 'byt_nr': byt_nr}
+    dtype = np.int8 if byt_nr == 1 else np.dtype('<i2')
+    raw = np.random.randint(-100, 100, size=(1, n_samples)).astype(dtype)
+    folder = tempfile.mkdtemp()
+    csv_path = os.path.join(folder, 'trace.csv')
+    npz_path = os.path.join(folder, 'trace.npz')
+
+    t0 = time.perf_counter()
+    signal = mso.to_volts(raw[0], preamble)
+    timescale = mso.get_scope_timescale(preamble, n_samples)
+    df = pd.DataFrame(data=np.column_stack((timescale, signal)),
+                      columns=['time', 'signal'])
+    df.to_csv(csv_path, index=False)
+    t_csv = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    mso.save_scope_npz(npz_path, raw, [preamble], ['CH1'], 'benchmark')
+    t_npz = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    d = mso.load_scope_npz(npz_path, mmap=True)
+    t_load = time.perf_counter() - t0
+    assert np.array_equal(d['raw'], raw)
+
+    print('samples: {}, bytes per sample: {}'.format(n_samples, byt_nr))
+    print('CSV: {:.1f} MB in {:.3f} s'.format(
+            os.path.getsize(csv_path)/1e6, t_csv))
+    print('npz: {:.1f} MB in {:.3f} s'.format(
+            os.path.getsize(npz_path)/1e6, t_npz))
+    print('npz memory-mapped load: {:.4f} s'.format(t_load))
+
+
+if __name__ == '__main__':
+
+    run(n_samples=1250000, byt_nr=1)
+    run(n_samples=1250000, byt_nr=2)
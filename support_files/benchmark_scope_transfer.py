@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+
+Benchmark for decoding Tektronix MSO64 waveform data. Compares the old
+ASCII CURVE parsing path against binary block decoding with
+numpy.frombuffer. A synthetic record is used so that the benchmark
+runs without an oscilloscope attached.
+
+Created on Mon Oct 19 09:12:40 2026
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from instr_libs import mso
+
+
+def make_record(n_samples, byt_nr=1):
+    """Create a synthetic raw scope record with a few sharp pulses."""
+    dtype = np.int8 if byt_nr == 1 else np.dtype('<i2')
+    top = np.iinfo(dtype).max
+    raw = np.random.randint(-5, 5, size=n_samples).astype(dtype)
+    raw[::n_samples//10] = top
+    return raw
+
+
+def decode_ascii(text):
+    """Decode an ASCII CURVE response the way the old acquire did."""
+    return np.array(text.split(',')).astype(float)
+
+
+def decode_binary(block, preamble):
+    """Decode a binary CURVE response and scale it to volts."""
+    return mso.to_volts(mso.decode_curve(block, preamble), preamble)
+
+
+def run(n_samples=12500000, byt_nr=1):
+    """Time both decoding paths and print the results."""
+    preamble = {'ymult': 1e-3, 'yoff': 0.0, 'yzero': 0.0,
+                'xincr': 8e-10, 'xzero': 0.0, 'byt_nr': byt_nr}
+    raw = make_record(n_samples, byt_nr=byt_nr)
+    text = ','.join(raw.astype(str))
+    block = raw.tobytes()
+    print('samples: {}, bytes per sample: {}'.format(n_samples, byt_nr))
+    print('ASCII response size: {:.1f} MB'.format(len(text)/1e6))
+    print('binary response size: {:.1f} MB'.format(len(block)/1e6))
+
+    t0 = time.perf_counter()
+    sig_ascii = decode_ascii(text)
+    t_ascii = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    sig_binary = decode_binary(block, preamble)
+    t_binary = time.perf_counter() - t0
+
+    assert np.allclose(sig_ascii*preamble['ymult'], sig_binary)
+    print('ASCII decode: {:.3f} s'.format(t_ascii))
+    print('binary decode: {:.3f} s'.format(t_binary))
+    print('speedup: {:.0f}x'.format(t_ascii/t_binary))
+
+
+if __name__ == '__main__':
+
+    run(n_samples=12500000, byt_nr=1)
+    run(n_samples=12500000, byt_nr=2)
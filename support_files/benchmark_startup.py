@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+
+Benchmark for the import time of the application and its instrument
+modules. Each module is imported in a fresh Python process, and the
+import time is compared against a budget. Hardware SDKs (visa,
+thorlabs_apt, the .NET CLR) and matplotlib should only be imported when
+an instrument is enabled or a plot is shown, so the benchmark also fails
+if any of them are loaded at import time.
+
+Usage: python support_files/benchmark_startup.py
+
+Created on Mon Oct 19 12:20:44 2026
+"""
+
+import os
+import sys
+import json
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# import time budgets in seconds
+BUDGETS = {
+        'app': 1.5,
+        'instr_libs.avacs': 0.3,
+        'instr_libs.kcube': 0.3,
+        'instr_libs.lf': 1.0,
+        'instr_libs.mcl': 0.3,
+        'instr_libs.mso': 0.3,
+        'instr_libs.ops': 1.0,
+        'instr_libs.piline': 0.3,
+        'instr_libs.slink': 0.3,
+        'instr_libs.srs': 0.3}
+
+# modules which should not be loaded at startup
+DEFERRED = ['visa', 'pyvisa', 'thorlabs_apt', 'clr', 'matplotlib',
+            'markdown', 'h5py']
+
+# code which is run in a fresh process to time one import
+SNIPPET = '''
+import sys, time, json
+t0 = time.perf_counter()
+import {module}
+t = time.perf_counter() - t0
+print(json.dumps({{'time': t, 'loaded': [m for m in {deferred}
+                                         if m in sys.modules]}}))
+'''
+
+
+def time_import(module):
+    """Time the import of a module in a fresh Python process. Returns
+    the import time in seconds and the deferred modules which were
+    loaded, or the error message if the import failed."""
+    code = SNIPPET.format(module=module, deferred=DEFERRED)
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT,
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        return result.stderr.strip().splitlines()[-1]
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run():
+    """Time the import of each module and print the results. Returns
+    True if every module imported within its budget without loading
+    deferred modules."""
+    ok = True
+    for module, budget in BUDGETS.items():
+        r = time_import(module)
+        if isinstance(r, str):
+            print('{:20s} import failed: {}'.format(module, r))
+            ok = False
+            continue
+        passed = r['time'] <= budget and not r['loaded']
+        ok = ok and passed
+        print('{:20s} {:6.3f} s (budget {:.1f} s) {}{}'.format(
+                module, r['time'], budget, 'ok' if passed else 'FAIL',
+                '' if not r['loaded'] else ', loaded: '+', '.join(
+                        r['loaded'])))
+    return ok
+
+
+if __name__ == '__main__':
+    sys.exit(0 if run() else 1)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+
+Benchmark for the startup time of the main window. Compares building
+the window from the precompiled ui_main.py module against parsing UI.ui
+with uic.loadUiType, and measures the time to window of the full
+application. Set QT_QPA_PLATFORM=offscreen to run it without a display.
+
+Usage: python support_files/benchmark_ui.py
+
+Created on Mon Oct 19 12:52:37 2026
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from PyQt5 import QtWidgets, uic
+from instr_libs import ops
+
+
+def time_ui(get_ui_class, n=5):
+    """Get the mean times to get the UI class and to set up a main
+    window with it."""
+    t_class, t_setup = 0, 0
+    for _ in range(n):
+        t0 = time.perf_counter()
+        ui_class = get_ui_class()
+        t1 = time.perf_counter()
+        window = QtWidgets.QMainWindow()
+        ui_class().setupUi(window)
+        t_class += t1 - t0
+        t_setup += time.perf_counter() - t1
+        window.deleteLater()
+    return t_class/n, t_setup/n
+
+
+def run():
+    """Time UI loading and the time to window, and print the results."""
+    qapp = QtWidgets.QApplication.instance() or QtWidgets.QApplication(
+            sys.argv)
+    ui_path = os.path.join(ROOT, 'UI.ui')
+    for label, get_ui_class in [
+            ('UI.ui with loadUiType', lambda: uic.loadUiType(ui_path)[0]),
+            ('precompiled ui_main.py', lambda: ops.load_ui(ui_path))]:
+        t_class, t_setup = time_ui(get_ui_class)
+        print('{}: {:.4f} s to load, {:.4f} s to set up window'.format(
+                label, t_class, t_setup))
+    # the application writes its logs to the working directory
+    os.chdir(tempfile.mkdtemp())
+    t0 = time.perf_counter()
+    import app
+    window = app.App()
+    window.show()
+    qapp.processEvents()
+    print('Time to window (including imports): {:.3f} s'.format(
+            time.perf_counter() - t0))
+
+
+if __name__ == '__main__':
+    run()
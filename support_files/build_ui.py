@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+
+Compile the Qt Designer file UI.ui into the Python module ui_main.py,
+so the application does not have to parse the XML file at startup. Run
+this after editing UI.ui in Qt Designer. The hash of UI.ui is stored in
+ui_main.py, and the application falls back to loading UI.ui directly if
+ui_main.py is missing or was built from a different UI.ui.
+
+Usage: python support_files/build_ui.py
+
+Created on Mon Oct 19 12:41:09 2026
+"""
+
+import os
+import re
+import sys
+from PyQt5 import uic
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+from instr_libs.ops import ui_hash
+
+
+def build(ui_path=os.path.join(ROOT, 'UI.ui'),
+          py_path=os.path.join(ROOT, 'ui_main.py')):
+    """Compile a .ui file into a Python module."""
+    cwd = os.getcwd()
+    # compile from the directory of the .ui file, so the generated module
+    # does not contain its absolute path
+    os.chdir(os.path.dirname(ui_path))
+    try:
+        with open(py_path+'.tmp', 'w', encoding='utf-8') as f:
+            uic.compileUi(os.path.basename(ui_path), f)
+    finally:
+        os.chdir(cwd)
+    with open(py_path+'.tmp', encoding='utf-8') as f:
+        ui_class = re.search(r'^class (Ui_\w+)\(', f.read(), re.M).group(1)
+    with open(py_path+'.tmp', 'a', encoding='utf-8') as f:
+        f.write("\n\nUi_MainWindow = {}\n".format(ui_class))
+        f.write("\n# hash of the .ui file which this module was built from\n")
+        f.write("UI_HASH = '{}'\n".format(ui_hash(ui_path)))
+    os.replace(py_path+'.tmp', py_path)
+    print('Compiled {} to {}'.format(ui_path, py_path))
+
+
+if __name__ == '__main__':
+    build()
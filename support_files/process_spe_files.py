@@ -4,42 +4,28 @@ Created on Mon Feb 10 16:39:14 2020
 
 @author: a6q
 """
+import os
+import sys
 import matplotlib.pyplot as plt
-import numpy as np
-import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from instr_libs import spe
 
 
 filenames = ['C:\\Users\\a6q\\exp_data\\2019 January 24 12_09_48.spe',
              'C:\\Users\\a6q\\exp_data\\2019 January 23 16_25_39-SG-raw.spe']
-    
-    
-def load_spe(filename):
-    """Load an spe file from Princeton Instruments as a numpy array."""
-    def read_at(data, pos, size, ntype):
-        raw.seek(pos)
-        return np.fromfile(raw, ntype, size)
-    raw = open(filename, 'rb')
-    xdim = np.int64(read_at(raw, 42, 1, np.int16)[0])
-    ydim = np.int64(read_at(raw, 656, 1, np.int16)[0])
-    arr = read_at(raw, 4100, xdim*ydim, np.uint16)
-    arr = arr.reshape((ydim, xdim))
-    print('data shape: {}'.format(np.shape(arr)))
-    if np.shape(arr)[0] == 1:
-        arr = arr[0]
-    print('data shape: {}'.format(np.shape(arr)))
-    return arr
 
 
 
 for f in filenames:
     
-    spec = load_spe(f)
-    
-    plt.plot(spec)
+    s = spe.open_spe(f)
+    print('{}: {} frames, ROIs: {}'.format(f, s['n_frames'], s['rois']))
+    # read one frame at a time from the memory-mapped file
+    for frame in range(s['n_frames']):
+        wl, spec = spe.get_spectrum(s, frame)
+        if wl is None:
+            plt.plot(spec)
+        else:
+            plt.plot(wl, spec)
     plt.show()
-
-    
-    
-    
-    
-    
\ No newline at end of file
+    spe.close_spe(s)
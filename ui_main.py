@@ -0,0 +1,1243 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'UI.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_LaserTriggering(object):
+    def setupUi(self, LaserTriggering):
+        LaserTriggering.setObjectName("LaserTriggering")
+        LaserTriggering.resize(1290, 712)
+        LaserTriggering.setStyleSheet("\n"
+"QMainWindow{\n"
+"background-color: rgb(70,70,70);\n"
+"color: white;}\n"
+"\n"
+"\n"
+"QGroupBox{\n"
+"border: 1px solid rgb(150,150,150);\n"
+"border-radius: 3px;\n"
+"margin-top: 0.5em;\n"
+"font-size: 14px;\n"
+"color: white;}\n"
+"\n"
+"QGroupBox::title{\n"
+"subcontrol-position: top center;\n"
+"subcontrol-origin: margin;\n"
+"padding: 0 3px 0 3px;}\n"
+"\n"
+"\n"
+"QLabel{\n"
+"color: white;}\n"
+"\n"
+"\n"
+"QTextBrowser{\n"
+"border-radius: 3px;\n"
+"border: 1px solid black;\n"
+"background-color: rgb(30, 30, 30);\n"
+"color: white;\n"
+"font-size:12px}\n"
+"\n"
+"\n"
+"QMenuBar{\n"
+"background: rgb(30, 30, 30);\n"
+"spacing: 12px;\n"
+"color: white;\n"
+"font-size:16px;}\n"
+"QMenuBar::item{\n"
+"spacing: 3px; \n"
+"padding: 1px 4px;\n"
+"border-radius: 3px;}\n"
+"QMenuBar::item:selected{\n"
+"background: rgb(80,80,80);}\n"
+"\n"
+"QMenu {\n"
+"border: 2px solid black;\n"
+"color: white;\n"
+"background: rgb(30,30,30);}\n"
+"\n"
+"QMenu::item:selected { \n"
+"background: white;\n"
+"background: rgb(80, 80, 80);}\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"QLineEdit, QSpinBox, QDoubleSpinBox {\n"
+"min-height: 16px;\n"
+"border-radius: 3px;\n"
+"background-color: rgb(100,100,100);\n"
+"border: 1px solid black;\n"
+"color: white;}\n"
+"QLineEdit:hover, QSpinBox:hover, QDoubleSpinBox:hover{\n"
+"border: 1px solid rgb(85, 255, 125);;\n"
+"}\n"
+"\n"
+"QPushButton{\n"
+"color: white;\n"
+"min-height: 20px;\n"
+"min-width: 60px;\n"
+"border-radius: 3px;\n"
+"border: 1px solid black;\n"
+"background-color: rgb(100,100,100);}\n"
+"QPushButton:hover{\n"
+"border: 1px solid rgb(85, 255, 125);}\n"
+"QPushButton:pressed{\n"
+"color: black;\n"
+"background-color: rgb(85, 255, 125);}\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"QRadioButton::indicator, QCheckBox::indicator {\n"
+"width: 13px;\n"
+"height: 13px;\n"
+"border-radius: 3px;\n"
+"border:1px solid black;\n"
+"background: rgb(100, 100, 100);}\n"
+"\n"
+"QRadioButton::indicator:unchecked:hover, QCheckBox::indicator:unchecked:hover {\n"
+"border: 1px solid rgb(85, 255, 125)}\n"
+"\n"
+"QRadioButton::indicator::checked:hover, QCheckBox::indicator::checked:hover {\n"
+"background: rgb(85, 255, 125);\n"
+"border: 1px solid white;}\n"
+"\n"
+"QRadioButton::indicator:checked:pressed, QCheckBox::indicator:checked:pressed {\n"
+"background: white;}\n"
+"\n"
+"QRadioButton::indicator:unchecked:pressed, QCheckBox::indicator:unchecked:pressed {\n"
+"background: white;}\n"
+"\n"
+"QRadioButton::indicator::checked, QCheckBox::indicator::checked {\n"
+"background: rgb(85, 255, 125);}\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"\n"
+"QLineEdit::disabled,\n"
+"QSpinBox::disabled,\n"
+"QLabel::disabled,\n"
+"QDoubleSpinBox::disabled,\n"
+"QPushButton::disabled,\n"
+"QRadioButton::disabled,\n"
+"QCheckBox::indicator::disabled{\n"
+"background: rgb(70, 70, 70);\n"
+"color: black}\n"
+"QCheckBox::indicator::checked::disabled{\n"
+"background: rgb(85, 255, 125);\n"
+"border: 1px solid black;}\n"
+"\n"
+"\n"
+"\n"
+"\n"
+".QFrame{\n"
+"border-radius: 0px;\n"
+"border: 1px solid rgb(100, 100, 100);\n"
+"box-shape: plain;\n"
+"}\n"
+"\n"
+"")
+        self.centralwidget = QtWidgets.QWidget(LaserTriggering)
+        self.centralwidget.setObjectName("centralwidget")
+        self.groupBox_configurepulses = QtWidgets.QGroupBox(self.centralwidget)
+        self.groupBox_configurepulses.setEnabled(True)
+        self.groupBox_configurepulses.setGeometry(QtCore.QRect(280, 360, 241, 191))
+        font = QtGui.QFont()
+        font.setPointSize(-1)
+        self.groupBox_configurepulses.setFont(font)
+        self.groupBox_configurepulses.setFlat(False)
+        self.groupBox_configurepulses.setObjectName("groupBox_configurepulses")
+        self.gridLayoutWidget_5 = QtWidgets.QWidget(self.groupBox_configurepulses)
+        self.gridLayoutWidget_5.setGeometry(QtCore.QRect(20, 30, 201, 151))
+        self.gridLayoutWidget_5.setObjectName("gridLayoutWidget_5")
+        self.srs_grid = QtWidgets.QGridLayout(self.gridLayoutWidget_5)
+        self.srs_grid.setContentsMargins(0, 0, 0, 0)
+        self.srs_grid.setObjectName("srs_grid")
+        self.pulse_delay = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_5)
+        self.pulse_delay.setEnabled(True)
+        self.pulse_delay.setDecimals(3)
+        self.pulse_delay.setMinimum(0.001)
+        self.pulse_delay.setMaximum(100000.0)
+        self.pulse_delay.setSingleStep(0.001)
+        self.pulse_delay.setProperty("value", 1.0)
+        self.pulse_delay.setObjectName("pulse_delay")
+        self.srs_grid.addWidget(self.pulse_delay, 2, 1, 1, 1)
+        self.label_pulsewidth = QtWidgets.QLabel(self.gridLayoutWidget_5)
+        self.label_pulsewidth.setObjectName("label_pulsewidth")
+        self.srs_grid.addWidget(self.label_pulsewidth, 1, 0, 1, 1)
+        self.label_pulseamplitude = QtWidgets.QLabel(self.gridLayoutWidget_5)
+        self.label_pulseamplitude.setObjectName("label_pulseamplitude")
+        self.srs_grid.addWidget(self.label_pulseamplitude, 3, 0, 1, 1)
+        self.pulse_width = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_5)
+        self.pulse_width.setEnabled(True)
+        self.pulse_width.setDecimals(3)
+        self.pulse_width.setMinimum(0.001)
+        self.pulse_width.setMaximum(1000.0)
+        self.pulse_width.setSingleStep(0.001)
+        self.pulse_width.setProperty("value", 1.0)
+        self.pulse_width.setObjectName("pulse_width")
+        self.srs_grid.addWidget(self.pulse_width, 1, 1, 1, 1)
+        self.srs_address_label = QtWidgets.QLabel(self.gridLayoutWidget_5)
+        self.srs_address_label.setObjectName("srs_address_label")
+        self.srs_grid.addWidget(self.srs_address_label, 0, 0, 1, 1)
+        self.label_pulsenumber = QtWidgets.QLabel(self.gridLayoutWidget_5)
+        self.label_pulsenumber.setObjectName("label_pulsenumber")
+        self.srs_grid.addWidget(self.label_pulsenumber, 4, 0, 1, 1)
+        self.label_pulsedelay = QtWidgets.QLabel(self.gridLayoutWidget_5)
+        self.label_pulsedelay.setObjectName("label_pulsedelay")
+        self.srs_grid.addWidget(self.label_pulsedelay, 2, 0, 1, 1)
+        self.pulsegen_address = QtWidgets.QLineEdit(self.gridLayoutWidget_5)
+        self.pulsegen_address.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.pulsegen_address.setObjectName("pulsegen_address")
+        self.srs_grid.addWidget(self.pulsegen_address, 0, 1, 1, 1)
+        self.pulse_amplitude = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_5)
+        self.pulse_amplitude.setEnabled(True)
+        self.pulse_amplitude.setDecimals(1)
+        self.pulse_amplitude.setMinimum(0.5)
+        self.pulse_amplitude.setMaximum(5.0)
+        self.pulse_amplitude.setSingleStep(0.5)
+        self.pulse_amplitude.setProperty("value", 1.0)
+        self.pulse_amplitude.setObjectName("pulse_amplitude")
+        self.srs_grid.addWidget(self.pulse_amplitude, 3, 1, 1, 1)
+        self.pulse_number = QtWidgets.QSpinBox(self.gridLayoutWidget_5)
+        self.pulse_number.setEnabled(True)
+        self.pulse_number.setMinimum(1)
+        self.pulse_number.setMaximum(1000000000)
+        self.pulse_number.setProperty("value", 1)
+        self.pulse_number.setObjectName("pulse_number")
+        self.srs_grid.addWidget(self.pulse_number, 4, 1, 1, 1)
+        self.pulsegen_on = QtWidgets.QCheckBox(self.gridLayoutWidget_5)
+        self.pulsegen_on.setText("")
+        self.pulsegen_on.setObjectName("pulsegen_on")
+        self.srs_grid.addWidget(self.pulsegen_on, 0, 2, 1, 1)
+        self.trigger_pulses = QtWidgets.QPushButton(self.gridLayoutWidget_5)
+        self.trigger_pulses.setFlat(False)
+        self.trigger_pulses.setObjectName("trigger_pulses")
+        self.srs_grid.addWidget(self.trigger_pulses, 5, 1, 1, 1)
+        self.groupBox_output = QtWidgets.QGroupBox(self.centralwidget)
+        self.groupBox_output.setGeometry(QtCore.QRect(550, 400, 491, 271))
+        font = QtGui.QFont()
+        font.setPointSize(-1)
+        self.groupBox_output.setFont(font)
+        self.groupBox_output.setObjectName("groupBox_output")
+        self.outbox = QtWidgets.QTextBrowser(self.groupBox_output)
+        self.outbox.setGeometry(QtCore.QRect(10, 30, 471, 231))
+        font = QtGui.QFont()
+        font.setPointSize(-1)
+        self.outbox.setFont(font)
+        self.outbox.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOn)
+        self.outbox.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.outbox.setObjectName("outbox")
+        self.groupBox_configurelightfield = QtWidgets.QGroupBox(self.centralwidget)
+        self.groupBox_configurelightfield.setGeometry(QtCore.QRect(20, 570, 501, 101))
+        font = QtGui.QFont()
+        font.setPointSize(-1)
+        self.groupBox_configurelightfield.setFont(font)
+        self.groupBox_configurelightfield.setObjectName("groupBox_configurelightfield")
+        self.gridLayoutWidget_7 = QtWidgets.QWidget(self.groupBox_configurelightfield)
+        self.gridLayoutWidget_7.setGeometry(QtCore.QRect(10, 30, 471, 51))
+        self.gridLayoutWidget_7.setObjectName("gridLayoutWidget_7")
+        self.a_grid = QtWidgets.QGridLayout(self.gridLayoutWidget_7)
+        self.a_grid.setContentsMargins(0, 0, 0, 0)
+        self.a_grid.setObjectName("a_grid")
+        self.raman_filename_notes = QtWidgets.QLineEdit(self.gridLayoutWidget_7)
+        self.raman_filename_notes.setText("")
+        self.raman_filename_notes.setObjectName("raman_filename_notes")
+        self.a_grid.addWidget(self.raman_filename_notes, 0, 1, 1, 1)
+        self.lf_notes_label = QtWidgets.QLabel(self.gridLayoutWidget_7)
+        self.lf_notes_label.setObjectName("lf_notes_label")
+        self.a_grid.addWidget(self.lf_notes_label, 0, 0, 1, 1)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.raman_frames_label = QtWidgets.QLabel(self.gridLayoutWidget_7)
+        self.raman_frames_label.setObjectName("raman_frames_label")
+        self.horizontalLayout.addWidget(self.raman_frames_label)
+        self.raman_frames = QtWidgets.QSpinBox(self.gridLayoutWidget_7)
+        self.raman_frames.setMinimum(1)
+        self.raman_frames.setMaximum(100000)
+        self.raman_frames.setProperty("value", 1)
+        self.raman_frames.setObjectName("raman_frames")
+        self.horizontalLayout.addWidget(self.raman_frames)
+        self.raman_export_csv = QtWidgets.QCheckBox(self.gridLayoutWidget_7)
+        self.raman_export_csv.setChecked(True)
+        self.raman_export_csv.setObjectName("raman_export_csv")
+        self.horizontalLayout.addWidget(self.raman_export_csv)
+        self.acquire_raman = QtWidgets.QPushButton(self.gridLayoutWidget_7)
+        self.acquire_raman.setAutoDefault(False)
+        self.acquire_raman.setDefault(False)
+        self.acquire_raman.setFlat(False)
+        self.acquire_raman.setObjectName("acquire_raman")
+        self.horizontalLayout.addWidget(self.acquire_raman)
+        self.launch_lf = QtWidgets.QPushButton(self.gridLayoutWidget_7)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.launch_lf.setFont(font)
+        self.launch_lf.setDefault(False)
+        self.launch_lf.setObjectName("launch_lf")
+        self.horizontalLayout.addWidget(self.launch_lf)
+        self.a_grid.addLayout(self.horizontalLayout, 1, 1, 1, 1)
+        self.groupBox_exp = QtWidgets.QGroupBox(self.centralwidget)
+        self.groupBox_exp.setEnabled(True)
+        self.groupBox_exp.setGeometry(QtCore.QRect(20, 20, 231, 241))
+        font = QtGui.QFont()
+        font.setPointSize(-1)
+        self.groupBox_exp.setFont(font)
+        self.groupBox_exp.setObjectName("groupBox_exp")
+        self.gridLayoutWidget_2 = QtWidgets.QWidget(self.groupBox_exp)
+        self.gridLayoutWidget_2.setGeometry(QtCore.QRect(20, 30, 191, 195))
+        self.gridLayoutWidget_2.setObjectName("gridLayoutWidget_2")
+        self.gridLayout = QtWidgets.QGridLayout(self.gridLayoutWidget_2)
+        self.gridLayout.setContentsMargins(0, 0, 0, 0)
+        self.gridLayout.setObjectName("gridLayout")
+        self.seq_stage_movement_label = QtWidgets.QLabel(self.gridLayoutWidget_2)
+        self.seq_stage_movement_label.setObjectName("seq_stage_movement_label")
+        self.gridLayout.addWidget(self.seq_stage_movement_label, 5, 0, 1, 1)
+        self.seq_raman_acquisition = QtWidgets.QCheckBox(self.gridLayoutWidget_2)
+        self.seq_raman_acquisition.setEnabled(True)
+        self.seq_raman_acquisition.setText("")
+        self.seq_raman_acquisition.setObjectName("seq_raman_acquisition")
+        self.gridLayout.addWidget(self.seq_raman_acquisition, 3, 1, 1, 1)
+        self.seq_polarizer_rot = QtWidgets.QCheckBox(self.gridLayoutWidget_2)
+        self.seq_polarizer_rot.setEnabled(True)
+        self.seq_polarizer_rot.setText("")
+        self.seq_polarizer_rot.setChecked(False)
+        self.seq_polarizer_rot.setObjectName("seq_polarizer_rot")
+        self.gridLayout.addWidget(self.seq_polarizer_rot, 4, 1, 1, 1)
+        self.set_seq_cycles_label = QtWidgets.QLabel(self.gridLayoutWidget_2)
+        self.set_seq_cycles_label.setObjectName("set_seq_cycles_label")
+        self.gridLayout.addWidget(self.set_seq_cycles_label, 0, 0, 1, 1)
+        self.seq_piline_label = QtWidgets.QLabel(self.gridLayoutWidget_2)
+        self.seq_piline_label.setObjectName("seq_piline_label")
+        self.gridLayout.addWidget(self.seq_piline_label, 6, 0, 1, 1)
+        self.p_rotation_label = QtWidgets.QLabel(self.gridLayoutWidget_2)
+        self.p_rotation_label.setObjectName("p_rotation_label")
+        self.gridLayout.addWidget(self.p_rotation_label, 4, 0, 1, 1)
+        self.pause_between_cycles_label = QtWidgets.QLabel(self.gridLayoutWidget_2)
+        self.pause_between_cycles_label.setObjectName("pause_between_cycles_label")
+        self.gridLayout.addWidget(self.pause_between_cycles_label, 1, 0, 1, 1)
+        self.seq_piline = QtWidgets.QCheckBox(self.gridLayoutWidget_2)
+        self.seq_piline.setEnabled(True)
+        self.seq_piline.setText("")
+        self.seq_piline.setObjectName("seq_piline")
+        self.gridLayout.addWidget(self.seq_piline, 6, 1, 1, 1)
+        self.pause_between_cycles = QtWidgets.QSpinBox(self.gridLayoutWidget_2)
+        self.pause_between_cycles.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.pause_between_cycles.setMinimum(3)
+        self.pause_between_cycles.setMaximum(10000)
+        self.pause_between_cycles.setObjectName("pause_between_cycles")
+        self.gridLayout.addWidget(self.pause_between_cycles, 1, 1, 1, 1)
+        self.seq_raman_acquisition_label = QtWidgets.QLabel(self.gridLayoutWidget_2)
+        self.seq_raman_acquisition_label.setObjectName("seq_raman_acquisition_label")
+        self.gridLayout.addWidget(self.seq_raman_acquisition_label, 3, 0, 1, 1)
+        self.seq_mcl = QtWidgets.QCheckBox(self.gridLayoutWidget_2)
+        self.seq_mcl.setEnabled(True)
+        self.seq_mcl.setText("")
+        self.seq_mcl.setObjectName("seq_mcl")
+        self.gridLayout.addWidget(self.seq_mcl, 5, 1, 1, 1)
+        self.seq_laser_trigger = QtWidgets.QCheckBox(self.gridLayoutWidget_2)
+        self.seq_laser_trigger.setEnabled(True)
+        self.seq_laser_trigger.setText("")
+        self.seq_laser_trigger.setObjectName("seq_laser_trigger")
+        self.gridLayout.addWidget(self.seq_laser_trigger, 2, 1, 1, 1)
+        self.seq_laser_triggering_label = QtWidgets.QLabel(self.gridLayoutWidget_2)
+        self.seq_laser_triggering_label.setObjectName("seq_laser_triggering_label")
+        self.gridLayout.addWidget(self.seq_laser_triggering_label, 2, 0, 1, 1)
+        self.set_seq_cycles = QtWidgets.QSpinBox(self.gridLayoutWidget_2)
+        self.set_seq_cycles.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.set_seq_cycles.setMinimum(1)
+        self.set_seq_cycles.setMaximum(10000)
+        self.set_seq_cycles.setObjectName("set_seq_cycles")
+        self.gridLayout.addWidget(self.set_seq_cycles, 0, 1, 1, 1)
+        self.seq_avacs_label = QtWidgets.QLabel(self.gridLayoutWidget_2)
+        self.seq_avacs_label.setObjectName("seq_avacs_label")
+        self.gridLayout.addWidget(self.seq_avacs_label, 7, 0, 1, 1)
+        self.seq_avacs = QtWidgets.QCheckBox(self.gridLayoutWidget_2)
+        self.seq_avacs.setEnabled(True)
+        self.seq_avacs.setText("")
+        self.seq_avacs.setObjectName("seq_avacs")
+        self.gridLayout.addWidget(self.seq_avacs, 7, 1, 1, 1)
+        self.seq_scope_label = QtWidgets.QLabel(self.gridLayoutWidget_2)
+        self.seq_scope_label.setObjectName("seq_scope_label")
+        self.gridLayout.addWidget(self.seq_scope_label, 8, 0, 1, 1)
+        self.seq_scope = QtWidgets.QCheckBox(self.gridLayoutWidget_2)
+        self.seq_scope.setText("")
+        self.seq_scope.setObjectName("seq_scope")
+        self.gridLayout.addWidget(self.seq_scope, 8, 1, 1, 1)
+        self.groupBox_scope = QtWidgets.QGroupBox(self.centralwidget)
+        self.groupBox_scope.setGeometry(QtCore.QRect(810, 250, 231, 141))
+        self.groupBox_scope.setObjectName("groupBox_scope")
+        self.gridLayoutWidget = QtWidgets.QWidget(self.groupBox_scope)
+        self.gridLayoutWidget.setGeometry(QtCore.QRect(20, 30, 197, 102))
+        self.gridLayoutWidget.setObjectName("gridLayoutWidget")
+        self.scope_grid = QtWidgets.QGridLayout(self.gridLayoutWidget)
+        self.scope_grid.setContentsMargins(0, 0, 0, 0)
+        self.scope_grid.setObjectName("scope_grid")
+        self.mso_on = QtWidgets.QCheckBox(self.gridLayoutWidget)
+        self.mso_on.setText("")
+        self.mso_on.setObjectName("mso_on")
+        self.scope_grid.addWidget(self.mso_on, 0, 2, 1, 1)
+        self.mso_address_label = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.mso_address_label.setObjectName("mso_address_label")
+        self.scope_grid.addWidget(self.mso_address_label, 0, 0, 1, 1)
+        self.mso_address = QtWidgets.QLineEdit(self.gridLayoutWidget)
+        self.mso_address.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.mso_address.setObjectName("mso_address")
+        self.scope_grid.addWidget(self.mso_address, 0, 1, 1, 1)
+        self.scope_acquire = QtWidgets.QPushButton(self.gridLayoutWidget)
+        self.scope_acquire.setObjectName("scope_acquire")
+        self.scope_grid.addWidget(self.scope_acquire, 3, 0, 1, 1)
+        self.export_scope_trace = QtWidgets.QPushButton(self.gridLayoutWidget)
+        self.export_scope_trace.setObjectName("export_scope_trace")
+        self.scope_grid.addWidget(self.export_scope_trace, 3, 1, 1, 1)
+        self.mso_channels_label = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.mso_channels_label.setObjectName("mso_channels_label")
+        self.scope_grid.addWidget(self.mso_channels_label, 1, 0, 1, 1)
+        self.mso_channels = QtWidgets.QLineEdit(self.gridLayoutWidget)
+        self.mso_channels.setObjectName("mso_channels")
+        self.scope_grid.addWidget(self.mso_channels, 1, 1, 1, 1)
+        self.mso_frames_label = QtWidgets.QLabel(self.gridLayoutWidget)
+        self.mso_frames_label.setObjectName("mso_frames_label")
+        self.scope_grid.addWidget(self.mso_frames_label, 2, 0, 1, 1)
+        self.mso_frames = QtWidgets.QSpinBox(self.gridLayoutWidget)
+        self.mso_frames.setMinimum(0)
+        self.mso_frames.setMaximum(10000)
+        self.mso_frames.setObjectName("mso_frames")
+        self.scope_grid.addWidget(self.mso_frames, 2, 1, 1, 1)
+        self.groupBox_avacs = QtWidgets.QGroupBox(self.centralwidget)
+        self.groupBox_avacs.setGeometry(QtCore.QRect(20, 270, 231, 281))
+        self.groupBox_avacs.setObjectName("groupBox_avacs")
+        self.gridLayoutWidget_3 = QtWidgets.QWidget(self.groupBox_avacs)
+        self.gridLayoutWidget_3.setGeometry(QtCore.QRect(20, 30, 185, 234))
+        self.gridLayoutWidget_3.setObjectName("gridLayoutWidget_3")
+        self.avacs_grid = QtWidgets.QGridLayout(self.gridLayoutWidget_3)
+        self.avacs_grid.setContentsMargins(0, 0, 0, 0)
+        self.avacs_grid.setObjectName("avacs_grid")
+        self.avacs_initial = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_3)
+        self.avacs_initial.setDecimals(1)
+        self.avacs_initial.setMaximum(100.0)
+        self.avacs_initial.setSingleStep(0.1)
+        self.avacs_initial.setProperty("value", 0.0)
+        self.avacs_initial.setObjectName("avacs_initial")
+        self.avacs_grid.addWidget(self.avacs_initial, 7, 1, 1, 1)
+        self.avacs_final = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_3)
+        self.avacs_final.setDecimals(1)
+        self.avacs_final.setMaximum(100.0)
+        self.avacs_final.setSingleStep(0.1)
+        self.avacs_final.setProperty("value", 50.0)
+        self.avacs_final.setObjectName("avacs_final")
+        self.avacs_grid.addWidget(self.avacs_final, 8, 1, 1, 1)
+        self.avacs_steps = QtWidgets.QSpinBox(self.gridLayoutWidget_3)
+        self.avacs_steps.setMinimum(0)
+        self.avacs_steps.setMaximum(1000)
+        self.avacs_steps.setProperty("value", 2)
+        self.avacs_steps.setObjectName("avacs_steps")
+        self.avacs_grid.addWidget(self.avacs_steps, 9, 1, 1, 1)
+        self.avacs_manual_label = QtWidgets.QLabel(self.gridLayoutWidget_3)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.avacs_manual_label.setFont(font)
+        self.avacs_manual_label.setAlignment(QtCore.Qt.AlignBottom|QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft)
+        self.avacs_manual_label.setObjectName("avacs_manual_label")
+        self.avacs_grid.addWidget(self.avacs_manual_label, 1, 0, 1, 1)
+        self.avacs_set_pc_now = QtWidgets.QPushButton(self.gridLayoutWidget_3)
+        self.avacs_set_pc_now.setObjectName("avacs_set_pc_now")
+        self.avacs_grid.addWidget(self.avacs_set_pc_now, 5, 1, 1, 1)
+        self.avacs_power_label = QtWidgets.QLabel(self.gridLayoutWidget_3)
+        self.avacs_power_label.setObjectName("avacs_power_label")
+        self.avacs_grid.addWidget(self.avacs_power_label, 4, 0, 1, 1)
+        self.avacs_auto_label = QtWidgets.QLabel(self.gridLayoutWidget_3)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.avacs_auto_label.setFont(font)
+        self.avacs_auto_label.setAlignment(QtCore.Qt.AlignBottom|QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft)
+        self.avacs_auto_label.setObjectName("avacs_auto_label")
+        self.avacs_grid.addWidget(self.avacs_auto_label, 6, 0, 1, 1)
+        self.avacs_set_percent = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_3)
+        self.avacs_set_percent.setDecimals(1)
+        self.avacs_set_percent.setMaximum(100.0)
+        self.avacs_set_percent.setSingleStep(1.0)
+        self.avacs_set_percent.setProperty("value", 50.0)
+        self.avacs_set_percent.setObjectName("avacs_set_percent")
+        self.avacs_grid.addWidget(self.avacs_set_percent, 4, 1, 1, 1)
+        self.avacs_final_label = QtWidgets.QLabel(self.gridLayoutWidget_3)
+        self.avacs_final_label.setObjectName("avacs_final_label")
+        self.avacs_grid.addWidget(self.avacs_final_label, 8, 0, 1, 1)
+        self.avacs_steps_label = QtWidgets.QLabel(self.gridLayoutWidget_3)
+        self.avacs_steps_label.setObjectName("avacs_steps_label")
+        self.avacs_grid.addWidget(self.avacs_steps_label, 9, 0, 1, 1)
+        self.avacs_display_percent = QtWidgets.QLabel(self.gridLayoutWidget_3)
+        self.avacs_display_percent.setMinimumSize(QtCore.QSize(40, 0))
+        self.avacs_display_percent.setObjectName("avacs_display_percent")
+        self.avacs_grid.addWidget(self.avacs_display_percent, 4, 2, 1, 1)
+        self.avacs_initial_label = QtWidgets.QLabel(self.gridLayoutWidget_3)
+        self.avacs_initial_label.setObjectName("avacs_initial_label")
+        self.avacs_grid.addWidget(self.avacs_initial_label, 7, 0, 1, 1)
+        self.avacs_angle_label = QtWidgets.QLabel(self.gridLayoutWidget_3)
+        self.avacs_angle_label.setObjectName("avacs_angle_label")
+        self.avacs_grid.addWidget(self.avacs_angle_label, 2, 0, 1, 1)
+        self.avacs_set = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_3)
+        self.avacs_set.setDecimals(1)
+        self.avacs_set.setMaximum(45.0)
+        self.avacs_set.setSingleStep(1.0)
+        self.avacs_set.setProperty("value", 45.0)
+        self.avacs_set.setObjectName("avacs_set")
+        self.avacs_grid.addWidget(self.avacs_set, 2, 1, 1, 1)
+        self.avacs_on = QtWidgets.QCheckBox(self.gridLayoutWidget_3)
+        self.avacs_on.setText("")
+        self.avacs_on.setObjectName("avacs_on")
+        self.avacs_grid.addWidget(self.avacs_on, 0, 2, 1, 1)
+        self.avacs_address = QtWidgets.QLineEdit(self.gridLayoutWidget_3)
+        self.avacs_address.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.avacs_address.setObjectName("avacs_address")
+        self.avacs_grid.addWidget(self.avacs_address, 0, 1, 1, 1)
+        self.avacs_display = QtWidgets.QLabel(self.gridLayoutWidget_3)
+        self.avacs_display.setMinimumSize(QtCore.QSize(40, 0))
+        self.avacs_display.setObjectName("avacs_display")
+        self.avacs_grid.addWidget(self.avacs_display, 2, 2, 1, 1)
+        self.avacs_address_label = QtWidgets.QLabel(self.gridLayoutWidget_3)
+        self.avacs_address_label.setObjectName("avacs_address_label")
+        self.avacs_grid.addWidget(self.avacs_address_label, 0, 0, 1, 1)
+        self.avacs_set_now = QtWidgets.QPushButton(self.gridLayoutWidget_3)
+        self.avacs_set_now.setObjectName("avacs_set_now")
+        self.avacs_grid.addWidget(self.avacs_set_now, 3, 1, 1, 1)
+        self.groupBox_thorlabs = QtWidgets.QGroupBox(self.centralwidget)
+        self.groupBox_thorlabs.setEnabled(True)
+        self.groupBox_thorlabs.setGeometry(QtCore.QRect(280, 20, 241, 321))
+        self.groupBox_thorlabs.setObjectName("groupBox_thorlabs")
+        self.gridLayoutWidget_4 = QtWidgets.QWidget(self.groupBox_thorlabs)
+        self.gridLayoutWidget_4.setGeometry(QtCore.QRect(20, 30, 201, 281))
+        self.gridLayoutWidget_4.setObjectName("gridLayoutWidget_4")
+        self.polarizer_grid = QtWidgets.QGridLayout(self.gridLayoutWidget_4)
+        self.polarizer_grid.setContentsMargins(0, 0, 0, 0)
+        self.polarizer_grid.setObjectName("polarizer_grid")
+        self.polarizer_on = QtWidgets.QCheckBox(self.gridLayoutWidget_4)
+        self.polarizer_on.setText("")
+        self.polarizer_on.setObjectName("polarizer_on")
+        self.polarizer_grid.addWidget(self.polarizer_on, 1, 2, 1, 1)
+        self.polarizer_label = QtWidgets.QLabel(self.gridLayoutWidget_4)
+        self.polarizer_label.setObjectName("polarizer_label")
+        self.polarizer_grid.addWidget(self.polarizer_label, 1, 0, 1, 1)
+        self.p_angle_label = QtWidgets.QLabel(self.gridLayoutWidget_4)
+        self.p_angle_label.setObjectName("p_angle_label")
+        self.polarizer_grid.addWidget(self.p_angle_label, 2, 0, 1, 1)
+        self.polarizer_checkbox_label = QtWidgets.QLabel(self.gridLayoutWidget_4)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.polarizer_checkbox_label.setFont(font)
+        self.polarizer_checkbox_label.setAlignment(QtCore.Qt.AlignBottom|QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft)
+        self.polarizer_checkbox_label.setObjectName("polarizer_checkbox_label")
+        self.polarizer_grid.addWidget(self.polarizer_checkbox_label, 0, 0, 1, 1)
+        self.polarizer_address = QtWidgets.QLineEdit(self.gridLayoutWidget_4)
+        self.polarizer_address.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.polarizer_address.setObjectName("polarizer_address")
+        self.polarizer_grid.addWidget(self.polarizer_address, 1, 1, 1, 1)
+        self.polarizer_display = QtWidgets.QLabel(self.gridLayoutWidget_4)
+        self.polarizer_display.setMinimumSize(QtCore.QSize(40, 0))
+        self.polarizer_display.setObjectName("polarizer_display")
+        self.polarizer_grid.addWidget(self.polarizer_display, 2, 2, 1, 1)
+        self.analyzer_display = QtWidgets.QLabel(self.gridLayoutWidget_4)
+        self.analyzer_display.setMinimumSize(QtCore.QSize(40, 0))
+        self.analyzer_display.setObjectName("analyzer_display")
+        self.polarizer_grid.addWidget(self.analyzer_display, 6, 2, 1, 1)
+        self.analyzer_address = QtWidgets.QLineEdit(self.gridLayoutWidget_4)
+        self.analyzer_address.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.analyzer_address.setObjectName("analyzer_address")
+        self.polarizer_grid.addWidget(self.analyzer_address, 5, 1, 1, 1)
+        self.analyzer_on = QtWidgets.QCheckBox(self.gridLayoutWidget_4)
+        self.analyzer_on.setText("")
+        self.analyzer_on.setObjectName("analyzer_on")
+        self.polarizer_grid.addWidget(self.analyzer_on, 5, 2, 1, 1)
+        self.rotation_label = QtWidgets.QLabel(self.gridLayoutWidget_4)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.rotation_label.setFont(font)
+        self.rotation_label.setAlignment(QtCore.Qt.AlignBottom|QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft)
+        self.rotation_label.setObjectName("rotation_label")
+        self.polarizer_grid.addWidget(self.rotation_label, 8, 0, 1, 1)
+        self.rot_end_label = QtWidgets.QLabel(self.gridLayoutWidget_4)
+        self.rot_end_label.setObjectName("rot_end_label")
+        self.polarizer_grid.addWidget(self.rot_end_label, 10, 0, 1, 1)
+        self.rot_start_label = QtWidgets.QLabel(self.gridLayoutWidget_4)
+        self.rot_start_label.setObjectName("rot_start_label")
+        self.polarizer_grid.addWidget(self.rot_start_label, 9, 0, 1, 1)
+        self.polarizer_set_now = QtWidgets.QPushButton(self.gridLayoutWidget_4)
+        self.polarizer_set_now.setObjectName("polarizer_set_now")
+        self.polarizer_grid.addWidget(self.polarizer_set_now, 3, 1, 1, 1)
+        self.analyzer_set_now = QtWidgets.QPushButton(self.gridLayoutWidget_4)
+        self.analyzer_set_now.setObjectName("analyzer_set_now")
+        self.polarizer_grid.addWidget(self.analyzer_set_now, 7, 1, 1, 1)
+        self.a_checkbox_label = QtWidgets.QLabel(self.gridLayoutWidget_4)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.a_checkbox_label.setFont(font)
+        self.a_checkbox_label.setAlignment(QtCore.Qt.AlignBottom|QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft)
+        self.a_checkbox_label.setObjectName("a_checkbox_label")
+        self.polarizer_grid.addWidget(self.a_checkbox_label, 4, 0, 1, 1)
+        self.a_angle_label = QtWidgets.QLabel(self.gridLayoutWidget_4)
+        self.a_angle_label.setObjectName("a_angle_label")
+        self.polarizer_grid.addWidget(self.a_angle_label, 6, 0, 1, 1)
+        self.analyzer_label = QtWidgets.QLabel(self.gridLayoutWidget_4)
+        self.analyzer_label.setObjectName("analyzer_label")
+        self.polarizer_grid.addWidget(self.analyzer_label, 5, 0, 1, 1)
+        self.rot_steps_label = QtWidgets.QLabel(self.gridLayoutWidget_4)
+        self.rot_steps_label.setObjectName("rot_steps_label")
+        self.polarizer_grid.addWidget(self.rot_steps_label, 11, 0, 1, 1)
+        self.rotation_steps = QtWidgets.QSpinBox(self.gridLayoutWidget_4)
+        self.rotation_steps.setMaximum(360)
+        self.rotation_steps.setProperty("value", 3)
+        self.rotation_steps.setObjectName("rotation_steps")
+        self.polarizer_grid.addWidget(self.rotation_steps, 11, 1, 1, 1)
+        self.polarizer_set = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_4)
+        self.polarizer_set.setDecimals(1)
+        self.polarizer_set.setMaximum(359.9)
+        self.polarizer_set.setObjectName("polarizer_set")
+        self.polarizer_grid.addWidget(self.polarizer_set, 2, 1, 1, 1)
+        self.analyzer_set = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_4)
+        self.analyzer_set.setDecimals(1)
+        self.analyzer_set.setMaximum(359.9)
+        self.analyzer_set.setObjectName("analyzer_set")
+        self.polarizer_grid.addWidget(self.analyzer_set, 6, 1, 1, 1)
+        self.rotation_start = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_4)
+        self.rotation_start.setDecimals(1)
+        self.rotation_start.setMaximum(360.0)
+        self.rotation_start.setObjectName("rotation_start")
+        self.polarizer_grid.addWidget(self.rotation_start, 9, 1, 1, 1)
+        self.rotation_end = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_4)
+        self.rotation_end.setDecimals(1)
+        self.rotation_end.setMaximum(359.9)
+        self.rotation_end.setProperty("value", 90.0)
+        self.rotation_end.setObjectName("rotation_end")
+        self.polarizer_grid.addWidget(self.rotation_end, 10, 1, 1, 1)
+        self.groupBox_mcl = QtWidgets.QGroupBox(self.centralwidget)
+        self.groupBox_mcl.setGeometry(QtCore.QRect(550, 20, 231, 361))
+        self.groupBox_mcl.setObjectName("groupBox_mcl")
+        self.gridLayoutWidget_6 = QtWidgets.QWidget(self.groupBox_mcl)
+        self.gridLayoutWidget_6.setGeometry(QtCore.QRect(20, 30, 191, 281))
+        self.gridLayoutWidget_6.setObjectName("gridLayoutWidget_6")
+        self.mcl_grid = QtWidgets.QGridLayout(self.gridLayoutWidget_6)
+        self.mcl_grid.setContentsMargins(0, 0, 0, 0)
+        self.mcl_grid.setObjectName("mcl_grid")
+        self.mcl_grid_steps_label = QtWidgets.QLabel(self.gridLayoutWidget_6)
+        self.mcl_grid_steps_label.setObjectName("mcl_grid_steps_label")
+        self.mcl_grid.addWidget(self.mcl_grid_steps_label, 8, 0, 1, 1)
+        self.mcl_grid_initial_label = QtWidgets.QLabel(self.gridLayoutWidget_6)
+        self.mcl_grid_initial_label.setObjectName("mcl_grid_initial_label")
+        self.mcl_grid.addWidget(self.mcl_grid_initial_label, 6, 0, 1, 1)
+        self.mcl_set_x = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_6)
+        self.mcl_set_x.setDecimals(2)
+        self.mcl_set_x.setMinimum(-10.0)
+        self.mcl_set_x.setMaximum(10.0)
+        self.mcl_set_x.setSingleStep(1.0)
+        self.mcl_set_x.setProperty("value", 0.0)
+        self.mcl_set_x.setObjectName("mcl_set_x")
+        self.mcl_grid.addWidget(self.mcl_set_x, 2, 1, 1, 1)
+        self.mcl_x_label = QtWidgets.QLabel(self.gridLayoutWidget_6)
+        self.mcl_x_label.setObjectName("mcl_x_label")
+        self.mcl_grid.addWidget(self.mcl_x_label, 2, 0, 1, 1)
+        self.mcl_grid_final_label = QtWidgets.QLabel(self.gridLayoutWidget_6)
+        self.mcl_grid_final_label.setObjectName("mcl_grid_final_label")
+        self.mcl_grid.addWidget(self.mcl_grid_final_label, 7, 0, 1, 1)
+        self.mcl_label = QtWidgets.QLabel(self.gridLayoutWidget_6)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.mcl_label.setFont(font)
+        self.mcl_label.setAlignment(QtCore.Qt.AlignBottom|QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft)
+        self.mcl_label.setObjectName("mcl_label")
+        self.mcl_grid.addWidget(self.mcl_label, 1, 0, 1, 1)
+        self.y_steps_label = QtWidgets.QLabel(self.gridLayoutWidget_6)
+        self.y_steps_label.setMaximumSize(QtCore.QSize(100, 16777215))
+        self.y_steps_label.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.y_steps_label.setObjectName("y_steps_label")
+        self.mcl_grid.addWidget(self.y_steps_label, 11, 0, 1, 1)
+        self.mcl_address = QtWidgets.QLineEdit(self.gridLayoutWidget_6)
+        self.mcl_address.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.mcl_address.setObjectName("mcl_address")
+        self.mcl_grid.addWidget(self.mcl_address, 0, 1, 1, 1)
+        self.mcl_grid_label = QtWidgets.QLabel(self.gridLayoutWidget_6)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.mcl_grid_label.setFont(font)
+        self.mcl_grid_label.setAlignment(QtCore.Qt.AlignBottom|QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft)
+        self.mcl_grid_label.setObjectName("mcl_grid_label")
+        self.mcl_grid.addWidget(self.mcl_grid_label, 5, 0, 1, 1)
+        self.mcl_grid_y_steps = QtWidgets.QSpinBox(self.gridLayoutWidget_6)
+        self.mcl_grid_y_steps.setMaximum(100)
+        self.mcl_grid_y_steps.setProperty("value", 2)
+        self.mcl_grid_y_steps.setObjectName("mcl_grid_y_steps")
+        self.mcl_grid.addWidget(self.mcl_grid_y_steps, 11, 1, 1, 1)
+        self.mcl_current_y = QtWidgets.QLabel(self.gridLayoutWidget_6)
+        self.mcl_current_y.setMinimumSize(QtCore.QSize(40, 0))
+        self.mcl_current_y.setObjectName("mcl_current_y")
+        self.mcl_grid.addWidget(self.mcl_current_y, 3, 2, 1, 1)
+        self.mcl_current_x = QtWidgets.QLabel(self.gridLayoutWidget_6)
+        self.mcl_current_x.setMinimumSize(QtCore.QSize(40, 0))
+        self.mcl_current_x.setObjectName("mcl_current_x")
+        self.mcl_grid.addWidget(self.mcl_current_x, 2, 2, 1, 1)
+        self.mcl_grid_y_end = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_6)
+        self.mcl_grid_y_end.setDecimals(2)
+        self.mcl_grid_y_end.setMinimum(-10.0)
+        self.mcl_grid_y_end.setMaximum(10.0)
+        self.mcl_grid_y_end.setSingleStep(1.0)
+        self.mcl_grid_y_end.setProperty("value", -1.0)
+        self.mcl_grid_y_end.setObjectName("mcl_grid_y_end")
+        self.mcl_grid.addWidget(self.mcl_grid_y_end, 10, 1, 1, 1)
+        self.mcl_set_now = QtWidgets.QPushButton(self.gridLayoutWidget_6)
+        self.mcl_set_now.setObjectName("mcl_set_now")
+        self.mcl_grid.addWidget(self.mcl_set_now, 4, 1, 1, 1)
+        self.mcl_address_label = QtWidgets.QLabel(self.gridLayoutWidget_6)
+        self.mcl_address_label.setObjectName("mcl_address_label")
+        self.mcl_grid.addWidget(self.mcl_address_label, 0, 0, 1, 1)
+        self.mcl_y_label = QtWidgets.QLabel(self.gridLayoutWidget_6)
+        self.mcl_y_label.setObjectName("mcl_y_label")
+        self.mcl_grid.addWidget(self.mcl_y_label, 3, 0, 1, 1)
+        self.mcl_grid_x_end = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_6)
+        self.mcl_grid_x_end.setDecimals(2)
+        self.mcl_grid_x_end.setMinimum(-10.0)
+        self.mcl_grid_x_end.setMaximum(10.0)
+        self.mcl_grid_x_end.setSingleStep(1.0)
+        self.mcl_grid_x_end.setProperty("value", 1.0)
+        self.mcl_grid_x_end.setObjectName("mcl_grid_x_end")
+        self.mcl_grid.addWidget(self.mcl_grid_x_end, 7, 1, 1, 1)
+        self.mcl_set_y = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_6)
+        self.mcl_set_y.setDecimals(2)
+        self.mcl_set_y.setMinimum(-10.0)
+        self.mcl_set_y.setMaximum(10.0)
+        self.mcl_set_y.setSingleStep(1.0)
+        self.mcl_set_y.setProperty("value", 0.0)
+        self.mcl_set_y.setObjectName("mcl_set_y")
+        self.mcl_grid.addWidget(self.mcl_set_y, 3, 1, 1, 1)
+        self.mcl_grid_initial_label_y = QtWidgets.QLabel(self.gridLayoutWidget_6)
+        self.mcl_grid_initial_label_y.setObjectName("mcl_grid_initial_label_y")
+        self.mcl_grid.addWidget(self.mcl_grid_initial_label_y, 9, 0, 1, 1)
+        self.mcl_grid_y_start = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_6)
+        self.mcl_grid_y_start.setDecimals(2)
+        self.mcl_grid_y_start.setMinimum(-10.0)
+        self.mcl_grid_y_start.setMaximum(10.0)
+        self.mcl_grid_y_start.setSingleStep(1.0)
+        self.mcl_grid_y_start.setProperty("value", -1.0)
+        self.mcl_grid_y_start.setObjectName("mcl_grid_y_start")
+        self.mcl_grid.addWidget(self.mcl_grid_y_start, 9, 1, 1, 1)
+        self.mcl_grid_x_start = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_6)
+        self.mcl_grid_x_start.setDecimals(2)
+        self.mcl_grid_x_start.setMinimum(-10.0)
+        self.mcl_grid_x_start.setMaximum(10.0)
+        self.mcl_grid_x_start.setSingleStep(1.0)
+        self.mcl_grid_x_start.setProperty("value", -1.0)
+        self.mcl_grid_x_start.setObjectName("mcl_grid_x_start")
+        self.mcl_grid.addWidget(self.mcl_grid_x_start, 6, 1, 1, 1)
+        self.mcl_on = QtWidgets.QCheckBox(self.gridLayoutWidget_6)
+        self.mcl_on.setText("")
+        self.mcl_on.setObjectName("mcl_on")
+        self.mcl_grid.addWidget(self.mcl_on, 0, 2, 1, 1)
+        self.mcl_grid_final_y_label = QtWidgets.QLabel(self.gridLayoutWidget_6)
+        self.mcl_grid_final_y_label.setObjectName("mcl_grid_final_y_label")
+        self.mcl_grid.addWidget(self.mcl_grid_final_y_label, 10, 0, 1, 1)
+        self.mcl_grid_x_steps = QtWidgets.QSpinBox(self.gridLayoutWidget_6)
+        self.mcl_grid_x_steps.setMaximum(100)
+        self.mcl_grid_x_steps.setProperty("value", 2)
+        self.mcl_grid_x_steps.setObjectName("mcl_grid_x_steps")
+        self.mcl_grid.addWidget(self.mcl_grid_x_steps, 8, 1, 1, 1)
+        self.groupBox_piline = QtWidgets.QGroupBox(self.centralwidget)
+        self.groupBox_piline.setGeometry(QtCore.QRect(810, 20, 231, 221))
+        self.groupBox_piline.setObjectName("groupBox_piline")
+        self.gridLayoutWidget_10 = QtWidgets.QWidget(self.groupBox_piline)
+        self.gridLayoutWidget_10.setGeometry(QtCore.QRect(20, 30, 192, 182))
+        self.gridLayoutWidget_10.setObjectName("gridLayoutWidget_10")
+        self.piline_grid_layout = QtWidgets.QGridLayout(self.gridLayoutWidget_10)
+        self.piline_grid_layout.setContentsMargins(0, 0, 0, 0)
+        self.piline_grid_layout.setObjectName("piline_grid_layout")
+        self.piline_manual_label = QtWidgets.QLabel(self.gridLayoutWidget_10)
+        self.piline_manual_label.setMaximumSize(QtCore.QSize(100, 16777215))
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.piline_manual_label.setFont(font)
+        self.piline_manual_label.setAlignment(QtCore.Qt.AlignBottom|QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft)
+        self.piline_manual_label.setObjectName("piline_manual_label")
+        self.piline_grid_layout.addWidget(self.piline_manual_label, 1, 0, 1, 1)
+        self.piline_display = QtWidgets.QLabel(self.gridLayoutWidget_10)
+        self.piline_display.setMinimumSize(QtCore.QSize(40, 0))
+        self.piline_display.setObjectName("piline_display")
+        self.piline_grid_layout.addWidget(self.piline_display, 2, 2, 1, 1)
+        self.piline_set_label = QtWidgets.QLabel(self.gridLayoutWidget_10)
+        self.piline_set_label.setObjectName("piline_set_label")
+        self.piline_grid_layout.addWidget(self.piline_set_label, 2, 0, 1, 1)
+        self.piline_set_now = QtWidgets.QPushButton(self.gridLayoutWidget_10)
+        self.piline_set_now.setObjectName("piline_set_now")
+        self.piline_grid_layout.addWidget(self.piline_set_now, 3, 1, 1, 1)
+        self.piline_grid_label = QtWidgets.QLabel(self.gridLayoutWidget_10)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.piline_grid_label.setFont(font)
+        self.piline_grid_label.setAlignment(QtCore.Qt.AlignBottom|QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft)
+        self.piline_grid_label.setObjectName("piline_grid_label")
+        self.piline_grid_layout.addWidget(self.piline_grid_label, 4, 0, 1, 1)
+        self.piline_steps_label = QtWidgets.QLabel(self.gridLayoutWidget_10)
+        self.piline_steps_label.setObjectName("piline_steps_label")
+        self.piline_grid_layout.addWidget(self.piline_steps_label, 7, 0, 1, 1)
+        self.piline_address = QtWidgets.QLineEdit(self.gridLayoutWidget_10)
+        self.piline_address.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.piline_address.setClearButtonEnabled(False)
+        self.piline_address.setObjectName("piline_address")
+        self.piline_grid_layout.addWidget(self.piline_address, 0, 1, 1, 1)
+        self.piline_set = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_10)
+        self.piline_set.setDecimals(2)
+        self.piline_set.setMinimum(0.0)
+        self.piline_set.setMaximum(360.0)
+        self.piline_set.setSingleStep(1.0)
+        self.piline_set.setProperty("value", 0.0)
+        self.piline_set.setObjectName("piline_set")
+        self.piline_grid_layout.addWidget(self.piline_set, 2, 1, 1, 1)
+        self.piline_initial_label = QtWidgets.QLabel(self.gridLayoutWidget_10)
+        self.piline_initial_label.setObjectName("piline_initial_label")
+        self.piline_grid_layout.addWidget(self.piline_initial_label, 5, 0, 1, 1)
+        self.piline_final = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_10)
+        self.piline_final.setDecimals(2)
+        self.piline_final.setMinimum(0.0)
+        self.piline_final.setMaximum(360.0)
+        self.piline_final.setSingleStep(1.0)
+        self.piline_final.setProperty("value", 45.0)
+        self.piline_final.setObjectName("piline_final")
+        self.piline_grid_layout.addWidget(self.piline_final, 6, 1, 1, 1)
+        self.piline_initial = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_10)
+        self.piline_initial.setDecimals(2)
+        self.piline_initial.setMinimum(0.0)
+        self.piline_initial.setMaximum(360.0)
+        self.piline_initial.setSingleStep(1.0)
+        self.piline_initial.setProperty("value", 0.0)
+        self.piline_initial.setObjectName("piline_initial")
+        self.piline_grid_layout.addWidget(self.piline_initial, 5, 1, 1, 1)
+        self.piline_final_label = QtWidgets.QLabel(self.gridLayoutWidget_10)
+        self.piline_final_label.setObjectName("piline_final_label")
+        self.piline_grid_layout.addWidget(self.piline_final_label, 6, 0, 1, 1)
+        self.piline_on = QtWidgets.QCheckBox(self.gridLayoutWidget_10)
+        self.piline_on.setText("")
+        self.piline_on.setObjectName("piline_on")
+        self.piline_grid_layout.addWidget(self.piline_on, 0, 2, 1, 1)
+        self.piline_steps = QtWidgets.QSpinBox(self.gridLayoutWidget_10)
+        self.piline_steps.setMaximum(100)
+        self.piline_steps.setProperty("value", 3)
+        self.piline_steps.setObjectName("piline_steps")
+        self.piline_grid_layout.addWidget(self.piline_steps, 7, 1, 1, 1)
+        self.piline_address_label = QtWidgets.QLabel(self.gridLayoutWidget_10)
+        self.piline_address_label.setObjectName("piline_address_label")
+        self.piline_grid_layout.addWidget(self.piline_address_label, 0, 0, 1, 1)
+        self.groupBox_slink = QtWidgets.QGroupBox(self.centralwidget)
+        self.groupBox_slink.setGeometry(QtCore.QRect(1070, 20, 201, 131))
+        self.groupBox_slink.setObjectName("groupBox_slink")
+        self.gridLayoutWidget_slink = QtWidgets.QWidget(self.groupBox_slink)
+        self.gridLayoutWidget_slink.setGeometry(QtCore.QRect(20, 30, 167, 92))
+        self.gridLayoutWidget_slink.setObjectName("gridLayoutWidget_slink")
+        self.slink_grid = QtWidgets.QGridLayout(self.gridLayoutWidget_slink)
+        self.slink_grid.setContentsMargins(0, 0, 0, 0)
+        self.slink_grid.setObjectName("slink_grid")
+        self.slink_address_label = QtWidgets.QLabel(self.gridLayoutWidget_slink)
+        self.slink_address_label.setObjectName("slink_address_label")
+        self.slink_grid.addWidget(self.slink_address_label, 0, 0, 1, 1)
+        self.slink_address = QtWidgets.QLineEdit(self.gridLayoutWidget_slink)
+        self.slink_address.setObjectName("slink_address")
+        self.slink_grid.addWidget(self.slink_address, 0, 1, 1, 1)
+        self.slink_on = QtWidgets.QCheckBox(self.gridLayoutWidget_slink)
+        self.slink_on.setText("")
+        self.slink_on.setObjectName("slink_on")
+        self.slink_grid.addWidget(self.slink_on, 0, 2, 1, 1)
+        self.slink_energy_label = QtWidgets.QLabel(self.gridLayoutWidget_slink)
+        self.slink_energy_label.setObjectName("slink_energy_label")
+        self.slink_grid.addWidget(self.slink_energy_label, 1, 0, 1, 1)
+        self.slink_energy = QtWidgets.QLabel(self.gridLayoutWidget_slink)
+        self.slink_energy.setObjectName("slink_energy")
+        self.slink_grid.addWidget(self.slink_energy, 1, 1, 1, 1)
+        self.slink_range_label = QtWidgets.QLabel(self.gridLayoutWidget_slink)
+        self.slink_range_label.setObjectName("slink_range_label")
+        self.slink_grid.addWidget(self.slink_range_label, 2, 0, 1, 1)
+        self.slink_range = QtWidgets.QLabel(self.gridLayoutWidget_slink)
+        self.slink_range.setObjectName("slink_range")
+        self.slink_grid.addWidget(self.slink_range, 2, 1, 1, 1)
+        self.groupBox_fluence = QtWidgets.QGroupBox(self.centralwidget)
+        self.groupBox_fluence.setGeometry(QtCore.QRect(1070, 170, 201, 181))
+        self.groupBox_fluence.setObjectName("groupBox_fluence")
+        self.gridLayoutWidget_fluence = QtWidgets.QWidget(self.groupBox_fluence)
+        self.gridLayoutWidget_fluence.setGeometry(QtCore.QRect(20, 30, 167, 142))
+        self.gridLayoutWidget_fluence.setObjectName("gridLayoutWidget_fluence")
+        self.fluence_grid = QtWidgets.QGridLayout(self.gridLayoutWidget_fluence)
+        self.fluence_grid.setContentsMargins(0, 0, 0, 0)
+        self.fluence_grid.setObjectName("fluence_grid")
+        self.fluence_target_label = QtWidgets.QLabel(self.gridLayoutWidget_fluence)
+        self.fluence_target_label.setObjectName("fluence_target_label")
+        self.fluence_grid.addWidget(self.fluence_target_label, 0, 0, 1, 1)
+        self.fluence_target = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_fluence)
+        self.fluence_target.setDecimals(3)
+        self.fluence_target.setMaximum(100000.0)
+        self.fluence_target.setProperty("value", 1.0)
+        self.fluence_target.setObjectName("fluence_target")
+        self.fluence_grid.addWidget(self.fluence_target, 0, 1, 1, 1)
+        self.fluence_tolerance_label = QtWidgets.QLabel(self.gridLayoutWidget_fluence)
+        self.fluence_tolerance_label.setObjectName("fluence_tolerance_label")
+        self.fluence_grid.addWidget(self.fluence_tolerance_label, 1, 0, 1, 1)
+        self.fluence_tolerance = QtWidgets.QDoubleSpinBox(self.gridLayoutWidget_fluence)
+        self.fluence_tolerance.setMinimum(0.1)
+        self.fluence_tolerance.setProperty("value", 2.0)
+        self.fluence_tolerance.setObjectName("fluence_tolerance")
+        self.fluence_grid.addWidget(self.fluence_tolerance, 1, 1, 1, 1)
+        self.fluence_pulses_label = QtWidgets.QLabel(self.gridLayoutWidget_fluence)
+        self.fluence_pulses_label.setObjectName("fluence_pulses_label")
+        self.fluence_grid.addWidget(self.fluence_pulses_label, 2, 0, 1, 1)
+        self.fluence_pulses = QtWidgets.QSpinBox(self.gridLayoutWidget_fluence)
+        self.fluence_pulses.setMinimum(1)
+        self.fluence_pulses.setMaximum(1000)
+        self.fluence_pulses.setProperty("value", 5)
+        self.fluence_pulses.setObjectName("fluence_pulses")
+        self.fluence_grid.addWidget(self.fluence_pulses, 2, 1, 1, 1)
+        self.fluence_closed_loop_label = QtWidgets.QLabel(self.gridLayoutWidget_fluence)
+        self.fluence_closed_loop_label.setObjectName("fluence_closed_loop_label")
+        self.fluence_grid.addWidget(self.fluence_closed_loop_label, 3, 0, 1, 1)
+        self.fluence_closed_loop = QtWidgets.QCheckBox(self.gridLayoutWidget_fluence)
+        self.fluence_closed_loop.setText("")
+        self.fluence_closed_loop.setObjectName("fluence_closed_loop")
+        self.fluence_grid.addWidget(self.fluence_closed_loop, 3, 1, 1, 1)
+        self.fluence_servo_now = QtWidgets.QPushButton(self.gridLayoutWidget_fluence)
+        self.fluence_servo_now.setObjectName("fluence_servo_now")
+        self.fluence_grid.addWidget(self.fluence_servo_now, 4, 1, 1, 1)
+        LaserTriggering.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(LaserTriggering)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 1290, 24))
+        self.menubar.setObjectName("menubar")
+        self.menuFile = QtWidgets.QMenu(self.menubar)
+        self.menuFile.setObjectName("menuFile")
+        self.menuHelp = QtWidgets.QMenu(self.menubar)
+        self.menuHelp.setObjectName("menuHelp")
+        self.menuData = QtWidgets.QMenu(self.menubar)
+        self.menuData.setObjectName("menuData")
+        self.menuExperiment = QtWidgets.QMenu(self.menubar)
+        self.menuExperiment.setObjectName("menuExperiment")
+        LaserTriggering.setMenuBar(self.menubar)
+        self.print_ports = QtWidgets.QAction(LaserTriggering)
+        self.print_ports.setObjectName("print_ports")
+        self.find_instruments = QtWidgets.QAction(LaserTriggering)
+        self.find_instruments.setObjectName("find_instruments")
+        self.connect_all = QtWidgets.QAction(LaserTriggering)
+        self.connect_all.setObjectName("connect_all")
+        self.save_rig_profile = QtWidgets.QAction(LaserTriggering)
+        self.save_rig_profile.setObjectName("save_rig_profile")
+        self.show_help = QtWidgets.QAction(LaserTriggering)
+        self.show_help.setObjectName("show_help")
+        self.show_log_path = QtWidgets.QAction(LaserTriggering)
+        self.show_log_path.setObjectName("show_log_path")
+        self.show_file_list = QtWidgets.QAction(LaserTriggering)
+        self.show_file_list.setObjectName("show_file_list")
+        self.close_lf_host = QtWidgets.QAction(LaserTriggering)
+        self.close_lf_host.setObjectName("close_lf_host")
+        self.quit_app = QtWidgets.QAction(LaserTriggering)
+        self.quit_app.setObjectName("quit_app")
+        self.plot_spectra = QtWidgets.QAction(LaserTriggering)
+        self.plot_spectra.setObjectName("plot_spectra")
+        self.export_settings = QtWidgets.QAction(LaserTriggering)
+        self.export_settings.setObjectName("export_settings")
+        self.import_settings = QtWidgets.QAction(LaserTriggering)
+        self.import_settings.setObjectName("import_settings")
+        self.set_filedir = QtWidgets.QAction(LaserTriggering)
+        self.set_filedir.setObjectName("set_filedir")
+        self.actionPlot_Raman_spectra_as_2D_heatmap = QtWidgets.QAction(LaserTriggering)
+        self.actionPlot_Raman_spectra_as_2D_heatmap.setObjectName("actionPlot_Raman_spectra_as_2D_heatmap")
+        self.select_spectra = QtWidgets.QAction(LaserTriggering)
+        self.select_spectra.setObjectName("select_spectra")
+        self.grid_intensity = QtWidgets.QAction(LaserTriggering)
+        self.grid_intensity.setObjectName("grid_intensity")
+        self.generate_report = QtWidgets.QAction(LaserTriggering)
+        self.generate_report.setObjectName("generate_report")
+        self.query_report = QtWidgets.QAction(LaserTriggering)
+        self.query_report.setObjectName("query_report")
+        self.update_catalog = QtWidgets.QAction(LaserTriggering)
+        self.update_catalog.setObjectName("update_catalog")
+        self.run_seq = QtWidgets.QAction(LaserTriggering)
+        self.run_seq.setObjectName("run_seq")
+        self.abort_seq = QtWidgets.QAction(LaserTriggering)
+        self.abort_seq.setObjectName("abort_seq")
+        self.preview_seq = QtWidgets.QAction(LaserTriggering)
+        self.preview_seq.setObjectName("preview_seq")
+        self.menuFile.addAction(self.print_ports)
+        self.menuFile.addAction(self.find_instruments)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.connect_all)
+        self.menuFile.addAction(self.save_rig_profile)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.set_filedir)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.import_settings)
+        self.menuFile.addAction(self.export_settings)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.close_lf_host)
+        self.menuFile.addAction(self.quit_app)
+        self.menuHelp.addAction(self.show_help)
+        self.menuData.addAction(self.show_log_path)
+        self.menuData.addAction(self.show_file_list)
+        self.menuData.addSeparator()
+        self.menuData.addAction(self.generate_report)
+        self.menuData.addAction(self.query_report)
+        self.menuData.addAction(self.update_catalog)
+        self.menuData.addSeparator()
+        self.menuData.addAction(self.select_spectra)
+        self.menuExperiment.addAction(self.preview_seq)
+        self.menuExperiment.addSeparator()
+        self.menuExperiment.addAction(self.run_seq)
+        self.menuExperiment.addSeparator()
+        self.menuExperiment.addAction(self.abort_seq)
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuData.menuAction())
+        self.menubar.addAction(self.menuExperiment.menuAction())
+        self.menubar.addAction(self.menuHelp.menuAction())
+
+        self.retranslateUi(LaserTriggering)
+        QtCore.QMetaObject.connectSlotsByName(LaserTriggering)
+        LaserTriggering.setTabOrder(self.set_seq_cycles, self.pause_between_cycles)
+        LaserTriggering.setTabOrder(self.pause_between_cycles, self.seq_laser_trigger)
+        LaserTriggering.setTabOrder(self.seq_laser_trigger, self.seq_raman_acquisition)
+        LaserTriggering.setTabOrder(self.seq_raman_acquisition, self.seq_polarizer_rot)
+        LaserTriggering.setTabOrder(self.seq_polarizer_rot, self.seq_mcl)
+        LaserTriggering.setTabOrder(self.seq_mcl, self.seq_piline)
+        LaserTriggering.setTabOrder(self.seq_piline, self.pulsegen_address)
+        LaserTriggering.setTabOrder(self.pulsegen_address, self.pulsegen_on)
+        LaserTriggering.setTabOrder(self.pulsegen_on, self.pulse_width)
+        LaserTriggering.setTabOrder(self.pulse_width, self.pulse_delay)
+        LaserTriggering.setTabOrder(self.pulse_delay, self.pulse_amplitude)
+        LaserTriggering.setTabOrder(self.pulse_amplitude, self.pulse_number)
+        LaserTriggering.setTabOrder(self.pulse_number, self.trigger_pulses)
+        LaserTriggering.setTabOrder(self.trigger_pulses, self.mcl_address)
+        LaserTriggering.setTabOrder(self.mcl_address, self.mcl_on)
+        LaserTriggering.setTabOrder(self.mcl_on, self.mcl_set_x)
+        LaserTriggering.setTabOrder(self.mcl_set_x, self.mcl_set_y)
+        LaserTriggering.setTabOrder(self.mcl_set_y, self.mcl_set_now)
+        LaserTriggering.setTabOrder(self.mcl_set_now, self.mcl_grid_x_start)
+        LaserTriggering.setTabOrder(self.mcl_grid_x_start, self.mcl_grid_x_end)
+        LaserTriggering.setTabOrder(self.mcl_grid_x_end, self.mcl_grid_x_steps)
+        LaserTriggering.setTabOrder(self.mcl_grid_x_steps, self.mcl_grid_y_start)
+        LaserTriggering.setTabOrder(self.mcl_grid_y_start, self.mcl_grid_y_end)
+        LaserTriggering.setTabOrder(self.mcl_grid_y_end, self.mcl_grid_y_steps)
+        LaserTriggering.setTabOrder(self.mcl_grid_y_steps, self.raman_filename_notes)
+        LaserTriggering.setTabOrder(self.raman_filename_notes, self.raman_frames)
+        LaserTriggering.setTabOrder(self.raman_frames, self.polarizer_on)
+        LaserTriggering.setTabOrder(self.polarizer_on, self.polarizer_address)
+        LaserTriggering.setTabOrder(self.polarizer_address, self.polarizer_set)
+        LaserTriggering.setTabOrder(self.polarizer_set, self.polarizer_set_now)
+        LaserTriggering.setTabOrder(self.polarizer_set_now, self.analyzer_on)
+        LaserTriggering.setTabOrder(self.analyzer_on, self.analyzer_address)
+        LaserTriggering.setTabOrder(self.analyzer_address, self.analyzer_set)
+        LaserTriggering.setTabOrder(self.analyzer_set, self.analyzer_set_now)
+        LaserTriggering.setTabOrder(self.analyzer_set_now, self.rotation_start)
+        LaserTriggering.setTabOrder(self.rotation_start, self.rotation_end)
+        LaserTriggering.setTabOrder(self.rotation_end, self.rotation_steps)
+        LaserTriggering.setTabOrder(self.rotation_steps, self.outbox)
+        LaserTriggering.setTabOrder(self.outbox, self.mso_address)
+        LaserTriggering.setTabOrder(self.mso_address, self.mso_on)
+        LaserTriggering.setTabOrder(self.mso_on, self.mso_channels)
+        LaserTriggering.setTabOrder(self.mso_channels, self.mso_frames)
+        LaserTriggering.setTabOrder(self.mso_frames, self.seq_scope)
+        LaserTriggering.setTabOrder(self.seq_scope, self.slink_address)
+        LaserTriggering.setTabOrder(self.slink_address, self.slink_on)
+        LaserTriggering.setTabOrder(self.slink_on, self.fluence_target)
+        LaserTriggering.setTabOrder(self.fluence_target, self.fluence_tolerance)
+        LaserTriggering.setTabOrder(self.fluence_tolerance, self.fluence_pulses)
+        LaserTriggering.setTabOrder(self.fluence_pulses, self.fluence_closed_loop)
+        LaserTriggering.setTabOrder(self.fluence_closed_loop, self.fluence_servo_now)
+        LaserTriggering.setTabOrder(self.fluence_servo_now, self.scope_acquire)
+        LaserTriggering.setTabOrder(self.scope_acquire, self.export_scope_trace)
+        LaserTriggering.setTabOrder(self.export_scope_trace, self.avacs_address)
+        LaserTriggering.setTabOrder(self.avacs_address, self.avacs_on)
+        LaserTriggering.setTabOrder(self.avacs_on, self.avacs_set)
+        LaserTriggering.setTabOrder(self.avacs_set, self.avacs_set_now)
+        LaserTriggering.setTabOrder(self.avacs_set_now, self.piline_address)
+        LaserTriggering.setTabOrder(self.piline_address, self.piline_on)
+        LaserTriggering.setTabOrder(self.piline_on, self.piline_set)
+        LaserTriggering.setTabOrder(self.piline_set, self.piline_set_now)
+        LaserTriggering.setTabOrder(self.piline_set_now, self.piline_initial)
+        LaserTriggering.setTabOrder(self.piline_initial, self.piline_final)
+        LaserTriggering.setTabOrder(self.piline_final, self.piline_steps)
+
+    def retranslateUi(self, LaserTriggering):
+        _translate = QtCore.QCoreApplication.translate
+        LaserTriggering.setWindowTitle(_translate("LaserTriggering", "Laser triggering"))
+        self.groupBox_configurepulses.setTitle(_translate("LaserTriggering", "SRS DG645 pulse generator"))
+        self.label_pulsewidth.setText(_translate("LaserTriggering", "Width (ms)"))
+        self.label_pulseamplitude.setText(_translate("LaserTriggering", "Amplitude (V)"))
+        self.srs_address_label.setText(_translate("LaserTriggering", "Address"))
+        self.label_pulsenumber.setText(_translate("LaserTriggering", "Number"))
+        self.label_pulsedelay.setText(_translate("LaserTriggering", "Delay (ms)"))
+        self.pulsegen_address.setText(_translate("LaserTriggering", "COM16"))
+        self.pulsegen_address.setPlaceholderText(_translate("LaserTriggering", "COM16"))
+        self.trigger_pulses.setText(_translate("LaserTriggering", "Trigger pulses"))
+        self.groupBox_output.setTitle(_translate("LaserTriggering", "Output"))
+        self.outbox.setHtml(_translate("LaserTriggering", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
+"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
+"p, li { white-space: pre-wrap; }\n"
+"</style></head><body style=\" font-family:\'MS Shell Dlg 2\'; font-size:12px; font-weight:400; font-style:normal;\">\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt;\">This is an application for automated laser triggering, stage control, and Raman acquisition. To connect to an instrument, navigate to the panel for that instrument, input the instrument\'s address, and select the checkbox next to the address field. To check whether an instrument address is available, navigate to </span><span style=\" font-size:9pt; font-style:italic;\">Menu</span><span style=\" font-size:9pt;\"> -&gt;</span><span style=\" font-size:9pt; font-style:italic;\"> Show avilable instrument ports</span><span style=\" font-size:9pt;\">. The available addresses will be printed in this box.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:9pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt;\">To acquire Raman spectra, first launch LightField software using the </span><span style=\" font-size:9pt; font-weight:600;\">Launch LF</span><span style=\" font-size:9pt;\"> button. Once LightField has loaded, open the </span><span style=\" font-size:9pt; font-style:italic;\">Default_Python_Experiment</span><span style=\" font-size:9pt;\"> in LightField. Then acquire spectra using the </span><span style=\" font-size:9pt; font-weight:600;\">Acquire</span><span style=\" font-size:9pt;\"> button in this application.</span></p>\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px; font-size:9pt;\"><br /></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt;\">To begin an automated experimental procedure, use settings in the </span><span style=\" font-size:9pt; font-style:italic;\">Experimental Sequence</span><span style=\" font-size:9pt;\"> panel. For more information, navigate to </span><span style=\" font-size:9pt; font-style:italic;\">Help</span><span style=\" font-size:9pt;\"> -&gt; </span><span style=\" font-size:9pt; font-style:italic;\">Show help</span><span style=\" font-size:9pt;\">. Full code and documentation for this application are available at:</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt; font-weight:600;\">http://github.com/ericmuckley/laser_triggering</span><span style=\" font-size:9pt;\">.</span></p>\n"
+"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:9pt;\"> -------------------------------------------------------------------------------------------------------------</span></p></body></html>"))
+        self.groupBox_configurelightfield.setTitle(_translate("LaserTriggering", "Configure LightField"))
+        self.lf_notes_label.setText(_translate("LaserTriggering", "File notes"))
+        self.raman_frames_label.setText(_translate("LaserTriggering", "Frames"))
+        self.raman_frames.setToolTip(_translate("LaserTriggering", "Number of frames per acquisition. More than 1 acquires a kinetics series."))
+        self.raman_export_csv.setToolTip(_translate("LaserTriggering", "Also export each spectrum from LightField as a CSV file"))
+        self.raman_export_csv.setText(_translate("LaserTriggering", "Export CSV"))
+        self.acquire_raman.setText(_translate("LaserTriggering", "Acquire"))
+        self.launch_lf.setText(_translate("LaserTriggering", "Launch LF"))
+        self.groupBox_exp.setTitle(_translate("LaserTriggering", "Experiment sequence"))
+        self.seq_stage_movement_label.setText(_translate("LaserTriggering", "MCL-3 stage"))
+        self.set_seq_cycles_label.setText(_translate("LaserTriggering", "Number of cycles"))
+        self.seq_piline_label.setText(_translate("LaserTriggering", "Piline rotation"))
+        self.p_rotation_label.setText(_translate("LaserTriggering", "K-Cube rotation"))
+        self.pause_between_cycles_label.setText(_translate("LaserTriggering", "Cycle delay (s)"))
+        self.seq_raman_acquisition_label.setText(_translate("LaserTriggering", "Raman acquisition"))
+        self.seq_laser_triggering_label.setText(_translate("LaserTriggering", "Excimer triggering"))
+        self.seq_avacs_label.setText(_translate("LaserTriggering", "AVACS attenuation"))
+        self.seq_scope_label.setText(_translate("LaserTriggering", "Scope capture"))
+        self.seq_scope.setToolTip(_translate("LaserTriggering", "Capture an oscilloscope trace of each pulse train"))
+        self.groupBox_scope.setTitle(_translate("LaserTriggering", "Tektronix MSO64 oscilloscope"))
+        self.mso_address_label.setText(_translate("LaserTriggering", "Address"))
+        self.mso_address.setText(_translate("LaserTriggering", "USB0::0x0699::0x0528::B010898::INSTR"))
+        self.mso_address.setPlaceholderText(_translate("LaserTriggering", "USB0::0x0699::0x0528::B010898::INSTR"))
+        self.scope_acquire.setText(_translate("LaserTriggering", "Acquire"))
+        self.export_scope_trace.setText(_translate("LaserTriggering", "Export"))
+        self.mso_channels_label.setText(_translate("LaserTriggering", "Channels"))
+        self.mso_channels.setText(_translate("LaserTriggering", "CH1"))
+        self.mso_channels.setPlaceholderText(_translate("LaserTriggering", "CH1, CH2"))
+        self.mso_frames_label.setText(_translate("LaserTriggering", "FastFrame frames"))
+        self.mso_frames.setToolTip(_translate("LaserTriggering", "Number of FastFrame frames to capture (0 for a single record)"))
+        self.groupBox_avacs.setTitle(_translate("LaserTriggering", "AVACS beam attenuator"))
+        self.avacs_manual_label.setText(_translate("LaserTriggering", "Manual"))
+        self.avacs_set_pc_now.setText(_translate("LaserTriggering", "Set power"))
+        self.avacs_power_label.setText(_translate("LaserTriggering", "Power (%)"))
+        self.avacs_auto_label.setText(_translate("LaserTriggering", "Auto"))
+        self.avacs_final_label.setText(_translate("LaserTriggering", "Final (%)"))
+        self.avacs_steps_label.setText(_translate("LaserTriggering", "Steps"))
+        self.avacs_display_percent.setText(_translate("LaserTriggering", "---       "))
+        self.avacs_initial_label.setText(_translate("LaserTriggering", "Initial (%)"))
+        self.avacs_angle_label.setText(_translate("LaserTriggering", "Angle (deg)"))
+        self.avacs_address.setText(_translate("LaserTriggering", "COM17"))
+        self.avacs_address.setPlaceholderText(_translate("LaserTriggering", "COM17"))
+        self.avacs_display.setText(_translate("LaserTriggering", "---       "))
+        self.avacs_address_label.setText(_translate("LaserTriggering", "Address"))
+        self.avacs_set_now.setText(_translate("LaserTriggering", "Set angle"))
+        self.groupBox_thorlabs.setTitle(_translate("LaserTriggering", "Thorlabs K-Cubes"))
+        self.polarizer_label.setText(_translate("LaserTriggering", "Address"))
+        self.p_angle_label.setText(_translate("LaserTriggering", "Angle (deg)"))
+        self.polarizer_checkbox_label.setText(_translate("LaserTriggering", "Polarizer"))
+        self.polarizer_address.setText(_translate("LaserTriggering", "27255762"))
+        self.polarizer_address.setPlaceholderText(_translate("LaserTriggering", "27255762"))
+        self.polarizer_display.setText(_translate("LaserTriggering", "---       "))
+        self.analyzer_display.setText(_translate("LaserTriggering", "---"))
+        self.analyzer_address.setText(_translate("LaserTriggering", "27255929"))
+        self.analyzer_address.setPlaceholderText(_translate("LaserTriggering", "27255929"))
+        self.rotation_label.setText(_translate("LaserTriggering", "Auto"))
+        self.rot_end_label.setText(_translate("LaserTriggering", "Final (deg)"))
+        self.rot_start_label.setText(_translate("LaserTriggering", "Initial (deg)"))
+        self.polarizer_set_now.setText(_translate("LaserTriggering", "Set angle"))
+        self.analyzer_set_now.setText(_translate("LaserTriggering", "Set angle"))
+        self.a_checkbox_label.setText(_translate("LaserTriggering", "Analyzer"))
+        self.a_angle_label.setText(_translate("LaserTriggering", "Angle (deg)"))
+        self.analyzer_label.setText(_translate("LaserTriggering", "Address"))
+        self.rot_steps_label.setText(_translate("LaserTriggering", "Steps"))
+        self.groupBox_mcl.setTitle(_translate("LaserTriggering", "Marzhauser MCL-3 stage"))
+        self.mcl_grid_steps_label.setText(_translate("LaserTriggering", "X steps"))
+        self.mcl_grid_initial_label.setText(_translate("LaserTriggering", "Initial X (cm)"))
+        self.mcl_x_label.setText(_translate("LaserTriggering", "X pos. (cm)"))
+        self.mcl_grid_final_label.setText(_translate("LaserTriggering", "Final X (cm)"))
+        self.mcl_label.setText(_translate("LaserTriggering", "Manual"))
+        self.y_steps_label.setText(_translate("LaserTriggering", "Y steps"))
+        self.mcl_address.setText(_translate("LaserTriggering", "COM18"))
+        self.mcl_address.setPlaceholderText(_translate("LaserTriggering", "COM18"))
+        self.mcl_grid_label.setText(_translate("LaserTriggering", "Auto"))
+        self.mcl_current_y.setText(_translate("LaserTriggering", "---       "))
+        self.mcl_current_x.setText(_translate("LaserTriggering", "---       "))
+        self.mcl_set_now.setText(_translate("LaserTriggering", "Set position"))
+        self.mcl_address_label.setText(_translate("LaserTriggering", "Address"))
+        self.mcl_y_label.setText(_translate("LaserTriggering", "Y pos. (cm)"))
+        self.mcl_grid_initial_label_y.setText(_translate("LaserTriggering", "Initial X (cm)"))
+        self.mcl_grid_final_y_label.setText(_translate("LaserTriggering", "Final Y (cm)"))
+        self.groupBox_piline.setTitle(_translate("LaserTriggering", "PI C-867 rotation controller"))
+        self.piline_manual_label.setText(_translate("LaserTriggering", "Manual"))
+        self.piline_display.setText(_translate("LaserTriggering", "---"))
+        self.piline_set_label.setText(_translate("LaserTriggering", "Angle (deg)"))
+        self.piline_set_now.setText(_translate("LaserTriggering", "Set angle"))
+        self.piline_grid_label.setText(_translate("LaserTriggering", "Auto"))
+        self.piline_steps_label.setText(_translate("LaserTriggering", "Steps"))
+        self.piline_address.setText(_translate("LaserTriggering", "COM24"))
+        self.piline_address.setPlaceholderText(_translate("LaserTriggering", "COm24"))
+        self.piline_initial_label.setText(_translate("LaserTriggering", "Initial (deg)"))
+        self.piline_final_label.setText(_translate("LaserTriggering", "Final (deg)"))
+        self.piline_address_label.setText(_translate("LaserTriggering", "Address"))
+        self.groupBox_slink.setTitle(_translate("LaserTriggering", "Gentec S-Link photometer"))
+        self.slink_address_label.setText(_translate("LaserTriggering", "Address"))
+        self.slink_address.setText(_translate("LaserTriggering", "COM25"))
+        self.slink_address.setPlaceholderText(_translate("LaserTriggering", "COM25"))
+        self.slink_energy_label.setText(_translate("LaserTriggering", "Energy (J)"))
+        self.slink_energy.setText(_translate("LaserTriggering", "---"))
+        self.slink_range_label.setText(_translate("LaserTriggering", "Range"))
+        self.slink_range.setText(_translate("LaserTriggering", "---"))
+        self.groupBox_fluence.setTitle(_translate("LaserTriggering", "Closed-loop fluence"))
+        self.fluence_target_label.setText(_translate("LaserTriggering", "Target (mJ)"))
+        self.fluence_target.setToolTip(_translate("LaserTriggering", "Target pulse energy. When AVACS attenuation is swept in the sequence, the sweep values are percent of this target."))
+        self.fluence_tolerance_label.setText(_translate("LaserTriggering", "Tolerance (%)"))
+        self.fluence_pulses_label.setText(_translate("LaserTriggering", "Test pulses"))
+        self.fluence_pulses.setToolTip(_translate("LaserTriggering", "Number of pulses fired for each energy measurement"))
+        self.fluence_closed_loop_label.setText(_translate("LaserTriggering", "Closed loop"))
+        self.fluence_closed_loop.setToolTip(_translate("LaserTriggering", "Servo the attenuator to the target energy at each sequence step"))
+        self.fluence_servo_now.setText(_translate("LaserTriggering", "Servo now"))
+        self.menuFile.setTitle(_translate("LaserTriggering", "Menu"))
+        self.menuHelp.setTitle(_translate("LaserTriggering", "Help"))
+        self.menuData.setTitle(_translate("LaserTriggering", "Data"))
+        self.menuExperiment.setTitle(_translate("LaserTriggering", "Experiment"))
+        self.print_ports.setText(_translate("LaserTriggering", "Show available instrument ports"))
+        self.find_instruments.setText(_translate("LaserTriggering", "Find instruments"))
+        self.connect_all.setText(_translate("LaserTriggering", "Connect all instruments"))
+        self.save_rig_profile.setText(_translate("LaserTriggering", "Save rig profile"))
+        self.show_help.setText(_translate("LaserTriggering", "Show help"))
+        self.show_log_path.setText(_translate("LaserTriggering", "Show path to log file"))
+        self.show_file_list.setText(_translate("LaserTriggering", "Show acquisition file list"))
+        self.close_lf_host.setText(_translate("LaserTriggering", "Close LightField host"))
+        self.quit_app.setText(_translate("LaserTriggering", "Quit"))
+        self.plot_spectra.setText(_translate("LaserTriggering", "Plot all Raman spectra"))
+        self.export_settings.setText(_translate("LaserTriggering", "Export settings"))
+        self.import_settings.setText(_translate("LaserTriggering", "Import settings"))
+        self.set_filedir.setText(_translate("LaserTriggering", "Set directory for saving log file"))
+        self.actionPlot_Raman_spectra_as_2D_heatmap.setText(_translate("LaserTriggering", "Plot Raman spectra as 2D heatmap"))
+        self.select_spectra.setText(_translate("LaserTriggering", "Select Raman spectra"))
+        self.grid_intensity.setText(_translate("LaserTriggering", "Plot max intensity across grid"))
+        self.generate_report.setText(_translate("LaserTriggering", "Generate report"))
+        self.query_report.setText(_translate("LaserTriggering", "Generate report from catalog query"))
+        self.update_catalog.setText(_translate("LaserTriggering", "Update catalog from log files"))
+        self.run_seq.setText(_translate("LaserTriggering", "RUN EXPERIMENT"))
+        self.abort_seq.setText(_translate("LaserTriggering", "Abort experiment"))
+        self.preview_seq.setText(_translate("LaserTriggering", "Preview experiment"))
+
+
+Ui_MainWindow = Ui_LaserTriggering
+
+# hash of the .ui file which this module was built from
+UI_HASH = '4720ad6279656ef6f96f6c70a6cf12ae3eb5905b'